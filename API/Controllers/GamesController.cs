@@ -117,7 +117,7 @@ public class GamesController : ControllerBase
 
     // DELETE: api/Games/5
     [HttpDelete("{id}")]
-    [SwaggerOperation(Summary = "Deletes a Game based on ID", Description = "Deletes a game from the database based on Game_ID.")]
+    [SwaggerOperation(Summary = "Deletes a Game based on ID", Description = "Deletes a game and all of its stats from the database based on Game_ID. Either everything is deleted or nothing is.")]
     public async Task<IActionResult> DeleteGame(int id)
     {
         var game = await _context.Games.FindAsync(id);
@@ -126,6 +126,9 @@ public class GamesController : ControllerBase
             return NotFound();
         }
 
+        // The game's stat rows go with it, in the same SaveChanges (one transaction)
+        var stats = await _context.Stats.Where(s => s.Game_ID == id).ToListAsync();
+        _context.Stats.RemoveRange(stats);
         _context.Games.Remove(game);
         await _context.SaveChangesAsync();
 
@@ -6,7 +6,9 @@ using WebApplication1.DTOs;
 using System.Collections.Generic;
 using System.Linq;
 using System.Threading.Tasks;
+using System.Text.Json;
 using Swashbuckle.AspNetCore.Annotations;
+using WebApplication1.Realtime;
 
 
 [ApiController]
@@ -14,10 +16,26 @@ using Swashbuckle.AspNetCore.Annotations;
 public class StatsController : ControllerBase
 {
     private readonly GOBContext _context;
-
-    public StatsController(GOBContext context)
+    private readonly StatEventHub _events;
+
+    // How often an idle event stream gets a comment line, so proxies and clients can tell it's alive
+    private static readonly TimeSpan EventHeartbeat = TimeSpan.FromSeconds(15);
+    private static readonly JsonSerializerOptions EventJson = new JsonSerializerOptions(JsonSerializerDefaults.Web);
+
+    // Idempotency-Key -> stats returned when that batch was applied, so a client retrying
+    // the same batch gets the same answer instead of the stats being added twice.
+    // Kept in memory (oldest keys are forgotten first); keyed batches are applied one at a time.
+    // Not persisted: after the API restarts, a batch that was applied but whose answer never
+    // reached the client is applied again when the client retries it.
+    private const int MaxRememberedBatches = 10000;
+    private static readonly Dictionary<string, List<StatDTO>> _appliedBatches = new Dictionary<string, List<StatDTO>>();
+    private static readonly Queue<string> _appliedBatchOrder = new Queue<string>();
+    private static readonly SemaphoreSlim _batchGate = new SemaphoreSlim(1, 1);
+
+    public StatsController(GOBContext context, StatEventHub? events = null)
     {
         _context = context;
+        _events = events ?? StatEventHub.Shared;
     }
 
     // GET: api/Stats
@@ -187,7 +205,7 @@ public class StatsController : ControllerBase
             _context.Entry(existingStat).State = EntityState.Modified;
             await _context.SaveChangesAsync();
 
-            return Ok(new StatDTO
+            var updated = new StatDTO
             {
                 Stat_ID = existingStat.Stat_ID,
                 Player_ID = existingStat.Player_ID,
@@ -205,7 +223,10 @@ public class StatsController : ControllerBase
                 Fouls = existingStat.Fouls,
                 Off_Rebounds = existingStat.Off_Rebounds,
                 Def_Rebounds = existingStat.Def_Rebounds,
-            }); // Return the updated stat
+            };
+            PublishStats(new List<StatCreateDTO> { statDto }, new List<StatDTO> { updated });
+
+            return Ok(updated); // Return the updated stat
         }
         else
         {
@@ -232,7 +253,7 @@ public class StatsController : ControllerBase
             _context.Stats.Add(stat);
             await _context.SaveChangesAsync();
 
-            return CreatedAtRoute("GetStat", new { id = stat.Stat_ID }, new StatDTO 
+            var created = new StatDTO
             {
                 Stat_ID = stat.Stat_ID,
                 Player_ID = stat.Player_ID,
@@ -250,8 +271,199 @@ public class StatsController : ControllerBase
                 Fouls = statDto.Fouls,
                 Off_Rebounds = statDto.Off_Rebounds,
                 Def_Rebounds = statDto.Def_Rebounds,
-            });
+            };
+            PublishStats(new List<StatCreateDTO> { statDto }, new List<StatDTO> { created });
+
+            return CreatedAtRoute("GetStat", new { id = stat.Stat_ID }, created);
+        }
+    }
+
+    // POST: api/Stats/Batch
+    [HttpPost("Batch")]
+    [SwaggerOperation(Summary = "Add several Stats", Description = "Posts a list of stats in one request (e.g. every stat from one play). Stats for the same player and game are added together, and everything is saved at once. If any player or game does not exist nothing is saved. Send an Idempotency-Key header to make retries safe: a key that was already applied returns the earlier result without adding the stats again.")]
+    public async Task<ActionResult<IEnumerable<StatDTO>>> PostStatsBatch(List<StatCreateDTO> statDtos, [FromHeader(Name = "Idempotency-Key")] string? idempotencyKey = null)
+    {
+        if (statDtos == null || !statDtos.Any())
+        {
+            return BadRequest("No stats given");
+        }
+
+        if (string.IsNullOrEmpty(idempotencyKey))
+        {
+            return await ApplyStatsBatch(statDtos);
+        }
+
+        await _batchGate.WaitAsync();
+        try
+        {
+            if (_appliedBatches.TryGetValue(idempotencyKey, out var earlierResult))
+            {
+                // Already applied - this is a retry
+                return Ok(earlierResult);
+            }
+
+            var result = await ApplyStatsBatch(statDtos);
+            if (result.Result is OkObjectResult ok && ok.Value is List<StatDTO> applied)
+            {
+                _appliedBatches[idempotencyKey] = applied;
+                _appliedBatchOrder.Enqueue(idempotencyKey);
+                while (_appliedBatchOrder.Count > MaxRememberedBatches)
+                {
+                    _appliedBatches.Remove(_appliedBatchOrder.Dequeue());
+                }
+            }
+            return result;
+        }
+        finally
+        {
+            _batchGate.Release();
+        }
+    }
+
+    private async Task<ActionResult<IEnumerable<StatDTO>>> ApplyStatsBatch(List<StatCreateDTO> statDtos)
+    {
+
+        // Check every Player_ID and Game_ID exists (one query each)
+        var playerIds = statDtos.Select(s => s.Player_ID).Distinct().ToList();
+        var gameIds = statDtos.Select(s => s.Game_ID).Distinct().ToList();
+
+        var foundPlayers = await _context.Players.CountAsync(p => playerIds.Contains(p.Player_ID));
+        if (foundPlayers != playerIds.Count)
+        {
+            return BadRequest("Player with given Player_ID does not exist");
+        }
+
+        var foundGames = await _context.Games.CountAsync(g => gameIds.Contains(g.Game_ID));
+        if (foundGames != gameIds.Count)
+        {
+            return BadRequest("Game with given Game_ID does not exist");
         }
+
+        // Load the stats that already exist for these players in these games
+        var existingStats = await _context.Stats
+            .Where(s => playerIds.Contains(s.Player_ID) && gameIds.Contains(s.Game_ID))
+            .ToListAsync();
+        var statsByKey = existingStats
+            .GroupBy(s => (s.Player_ID, s.Game_ID))
+            .ToDictionary(g => g.Key, g => g.First());
+
+        foreach (var statDto in statDtos)
+        {
+            if (!statsByKey.TryGetValue((statDto.Player_ID, statDto.Game_ID), out var stat))
+            {
+                // Create a new stat
+                stat = new Stat
+                {
+                    Player_ID = statDto.Player_ID,
+                    Game_ID = statDto.Game_ID,
+                };
+                _context.Stats.Add(stat);
+                statsByKey[(statDto.Player_ID, statDto.Game_ID)] = stat;
+            }
+
+            // INCREMENT the values
+            stat.Three_Points_Made += statDto.Three_Points_Made;
+            stat.Three_Points_Missed += statDto.Three_Points_Missed;
+            stat.Two_Points_Made += statDto.Two_Points_Made;
+            stat.Two_Points_Missed += statDto.Two_Points_Missed;
+            stat.Free_Throw_Made += statDto.Free_Throw_Made;
+            stat.Free_Throw_Missed += statDto.Free_Throw_Missed;
+            stat.Steals += statDto.Steals;
+            stat.Turnovers += statDto.Turnovers;
+            stat.Assists += statDto.Assists;
+            stat.Blocks += statDto.Blocks;
+            stat.Fouls += statDto.Fouls;
+            stat.Off_Rebounds += statDto.Off_Rebounds;
+            stat.Def_Rebounds += statDto.Def_Rebounds;
+        }
+
+        await _context.SaveChangesAsync();
+
+        var touched = statsByKey.Values.Select(s => new StatDTO
+        {
+            Stat_ID = s.Stat_ID,
+            Player_ID = s.Player_ID,
+            Game_ID = s.Game_ID,
+            Three_Points_Made = s.Three_Points_Made,
+            Three_Points_Missed = s.Three_Points_Missed,
+            Two_Points_Made = s.Two_Points_Made,
+            Two_Points_Missed = s.Two_Points_Missed,
+            Free_Throw_Made = s.Free_Throw_Made,
+            Free_Throw_Missed = s.Free_Throw_Missed,
+            Steals = s.Steals,
+            Turnovers = s.Turnovers,
+            Assists = s.Assists,
+            Blocks = s.Blocks,
+            Fouls = s.Fouls,
+            Off_Rebounds = s.Off_Rebounds,
+            Def_Rebounds = s.Def_Rebounds,
+        }).ToList();
+        PublishStats(statDtos, touched);
+
+        return Ok(touched); // Return every stat that was touched
+    }
+
+    // Tell everyone following these games (GET Stats/Game/{gameId}/Events) what changed
+    private void PublishStats(List<StatCreateDTO> deltas, List<StatDTO> totals)
+    {
+        foreach (var game in deltas.GroupBy(d => d.Game_ID))
+        {
+            _events.Publish(game.Key, game.ToList(), totals.Where(s => s.Game_ID == game.Key).ToList());
+        }
+    }
+
+    // GET: api/Stats/Game/5/Events
+    [HttpGet("Game/{gameId}/Events")]
+    [SwaggerOperation(Summary = "Follow a game's stats live", Description = "Server-Sent Events stream of every stat change in a game. Each 'stats' event carries the play's increments (deltas) and the new totals of the stat rows it touched (stats). Send Last-Event-ID when reconnecting to get the events you missed.")]
+    public async Task StreamGameEvents(int gameId, [FromHeader(Name = "Last-Event-ID")] string? lastEventId = null)
+    {
+        long? lastSeq = long.TryParse(lastEventId, out var seq) ? seq : null;
+        var aborted = HttpContext.RequestAborted;
+
+        Response.Headers["Content-Type"] = "text/event-stream";
+        Response.Headers["Cache-Control"] = "no-cache";
+        Response.Headers["X-Accel-Buffering"] = "no";
+
+        using var subscription = _events.Subscribe(gameId, lastSeq);
+        try
+        {
+            await Response.WriteAsync(": following game " + gameId + "\n\n", aborted);
+            await Response.Body.FlushAsync(aborted);
+            foreach (var evt in subscription.Replay)
+            {
+                await WriteEvent(evt, aborted);
+            }
+
+            while (!aborted.IsCancellationRequested)
+            {
+                using var wait = CancellationTokenSource.CreateLinkedTokenSource(aborted);
+                wait.CancelAfter(EventHeartbeat);
+                StatEvent evt;
+                try
+                {
+                    evt = await subscription.Reader.ReadAsync(wait.Token);
+                }
+                catch (OperationCanceledException) when (!aborted.IsCancellationRequested)
+                {
+                    // Nothing happened for a while
+                    await Response.WriteAsync(": ping\n\n", aborted);
+                    await Response.Body.FlushAsync(aborted);
+                    continue;
+                }
+                await WriteEvent(evt, aborted);
+            }
+        }
+        catch (OperationCanceledException)
+        {
+            // Client went away
+        }
+    }
+
+    private async Task WriteEvent(StatEvent evt, CancellationToken token)
+    {
+        var data = JsonSerializer.Serialize(evt, EventJson);
+        await Response.WriteAsync($"id: {evt.Seq}\nevent: stats\ndata: {data}\n\n", token);
+        await Response.Body.FlushAsync(token);
     }
 
     // DELETE: api/Stats/5
@@ -1,6 +1,7 @@
 using Microsoft.EntityFrameworkCore;
 using WebApplication1.Database;
 using Microsoft.OpenApi.Models;
+using WebApplication1.Realtime;
 
 var builder = WebApplication.CreateBuilder(args);
 
@@ -20,6 +21,9 @@ builder.Services.AddSwaggerGen(options =>
     options.EnableAnnotations();
 });
 
+// Live stat events (GET /Stats/Game/{id}/Events) - one hub shared by every request
+builder.Services.AddSingleton(StatEventHub.Shared);
+
 // Register DbContext
 builder.Services.AddDbContext<GOBContext>(options =>
     options.UseSqlServer(builder.Configuration.GetConnectionString("DefaultConnection")));
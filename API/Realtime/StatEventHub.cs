@@ -0,0 +1,135 @@
+﻿using System.Threading.Channels;
+using WebApplication1.DTOs;
+
+namespace WebApplication1.Realtime;
+
+// One push message: the stat increments of one play (or batch) in a game, plus the
+// new totals of every stat row they touched. Clients can just take the totals, so
+// a dropped message is fixed by the next one.
+public class StatEvent
+{
+    public long Seq { get; set; }
+    public int Game_ID { get; set; }
+    public List<StatCreateDTO> Deltas { get; set; } = new List<StatCreateDTO>();
+    public List<StatDTO> Stats { get; set; } = new List<StatDTO>();
+}
+
+// In-memory fan-out of stat changes to everyone following a game (GET /Stats/Game/{id}/Events).
+// Each game keeps its last few events so a client that reconnects with Last-Event-ID
+// gets what it missed. Slow subscribers lose their oldest queued events instead of
+// holding memory (see StatEvent for why that's fine).
+public class StatEventHub
+{
+    public static StatEventHub Shared { get; } = new StatEventHub();
+
+    private const int ReplayLength = 256;
+    private const int SubscriberQueueLength = 256;
+
+    private readonly object _lock = new object();
+    private readonly Dictionary<int, GameStream> _games = new Dictionary<int, GameStream>();
+
+    private class GameStream
+    {
+        public long Seq;
+        public readonly Queue<StatEvent> Recent = new Queue<StatEvent>();
+        public readonly List<Channel<StatEvent>> Subscribers = new List<Channel<StatEvent>>();
+    }
+
+    public StatEvent Publish(int gameId, List<StatCreateDTO> deltas, List<StatDTO> stats)
+    {
+        lock (_lock)
+        {
+            var game = GetGame(gameId);
+            var evt = new StatEvent { Seq = ++game.Seq, Game_ID = gameId, Deltas = deltas, Stats = stats };
+            game.Recent.Enqueue(evt);
+            while (game.Recent.Count > ReplayLength)
+            {
+                game.Recent.Dequeue();
+            }
+            foreach (var subscriber in game.Subscribers)
+            {
+                subscriber.Writer.TryWrite(evt);
+            }
+            return evt;
+        }
+    }
+
+    // Start following a game. Events after lastSeq that are still remembered come back in Replay.
+    public StatSubscription Subscribe(int gameId, long? lastSeq = null)
+    {
+        var channel = Channel.CreateBounded<StatEvent>(new BoundedChannelOptions(SubscriberQueueLength)
+        {
+            FullMode = BoundedChannelFullMode.DropOldest,
+            SingleReader = true,
+        });
+        lock (_lock)
+        {
+            var game = GetGame(gameId);
+            var replay = lastSeq.HasValue
+                ? game.Recent.Where(e => e.Seq > lastSeq.Value).ToList()
+                : new List<StatEvent>();
+            game.Subscribers.Add(channel);
+            return new StatSubscription(this, gameId, channel, replay);
+        }
+    }
+
+    public int SubscriberCount(int gameId)
+    {
+        lock (_lock)
+        {
+            return _games.TryGetValue(gameId, out var game) ? game.Subscribers.Count : 0;
+        }
+    }
+
+    internal void Unsubscribe(int gameId, Channel<StatEvent> channel)
+    {
+        lock (_lock)
+        {
+            if (_games.TryGetValue(gameId, out var game))
+            {
+                game.Subscribers.Remove(channel);
+            }
+        }
+        channel.Writer.TryComplete();
+    }
+
+    private GameStream GetGame(int gameId)
+    {
+        if (!_games.TryGetValue(gameId, out var game))
+        {
+            game = new GameStream();
+            _games[gameId] = game;
+        }
+        return game;
+    }
+}
+
+public sealed class StatSubscription : IDisposable
+{
+    private readonly StatEventHub _hub;
+    private readonly int _gameId;
+    private readonly Channel<StatEvent> _channel;
+    private bool _disposed;
+
+    internal StatSubscription(StatEventHub hub, int gameId, Channel<StatEvent> channel, List<StatEvent> replay)
+    {
+        _hub = hub;
+        _gameId = gameId;
+        _channel = channel;
+        Replay = replay;
+    }
+
+    public List<StatEvent> Replay { get; }
+
+    public ChannelReader<StatEvent> Reader => _channel.Reader;
+
+    public void Dispose()
+    {
+        if (_disposed)
+        {
+            return;
+        }
+        _disposed = true;
+        _hub.Unsubscribe(_gameId, _channel);
+    }
+}
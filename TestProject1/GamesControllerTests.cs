@@ -185,6 +185,35 @@ namespace TestProject1
             }
         }
 
+        [Fact]
+        public async Task DeleteGame_AlsoDeletesTheGamesStats()
+        {
+            using (var context = new GOBContext(_options))
+            {
+                // Arrange
+                context.Stats.RemoveRange(context.Stats);
+                context.Games.RemoveRange(context.Games);
+                context.SaveChanges();
+
+                context.Games.Add(new Game { Game_ID = 1, Home_ID = 1, Away_ID = 2, Game_Date = DateTime.Now });
+                context.Games.Add(new Game { Game_ID = 2, Home_ID = 1, Away_ID = 2, Game_Date = DateTime.Now });
+                context.Stats.Add(new Stat { Stat_ID = 1, Player_ID = 1, Game_ID = 1, Two_Points_Made = 3 });
+                context.Stats.Add(new Stat { Stat_ID = 2, Player_ID = 2, Game_ID = 1, Assists = 4 });
+                context.Stats.Add(new Stat { Stat_ID = 3, Player_ID = 1, Game_ID = 2, Steals = 1 });
+                context.SaveChanges();
+
+                var controller = new GamesController(context);
+
+                // Act
+                var result = await controller.DeleteGame(1);
+
+                // Assert - game 1 and its stats are gone, game 2's stat is untouched
+                Assert.IsType<NoContentResult>(result);
+                Assert.Equal(new[] { 2 }, context.Games.Select(g => g.Game_ID).ToArray());
+                Assert.Equal(new[] { 3 }, context.Stats.Select(s => s.Stat_ID).ToArray());
+            }
+        }
+
         [Fact]
         public async Task DeleteGame_ReturnsNotFoundResult_WhenGameDoesNotExist()
         {
@@ -5,6 +5,7 @@ using WebApplication1.Controllers;
 using WebApplication1.Database; 
 using WebApplication1.Models; 
 using WebApplication1.DTOs; 
+using WebApplication1.Realtime;
 using Xunit;
 using System.Collections.Generic;
 using System.Linq;
@@ -185,6 +186,181 @@ namespace TestProject1
             }
         }
 
+        [Fact]
+        public async Task PostStatsBatch_MergesStatsIntoOneRowPerPlayer()
+        {
+            using (var context = new GOBContext(_options))
+            {
+                //Clear Data
+                context.Stats.RemoveRange(context.Stats);
+                context.Players.RemoveRange(context.Players);
+                context.Games.RemoveRange(context.Games);
+                context.SaveChanges();
+
+                //Add data (player 1 already has a stat for game 1)
+                context.Players.Add(new Player { Player_ID = 1, Team_ID = 1, First_Name = "John", Last_Name = "Doe", Position_ID = "C", Jersy_Number = 23 });
+                context.Players.Add(new Player { Player_ID = 2, Team_ID = 1, First_Name = "Jane", Last_Name = "Doe", Position_ID = "G", Jersy_Number = 5 });
+                context.Games.Add(new Game { Game_ID = 1, Home_ID = 1, Away_ID = 2, Game_Date = DateTime.Now });
+                context.Stats.Add(new Stat { Stat_ID = 1, Player_ID = 1, Game_ID = 1, Two_Points_Made = 1 });
+                context.SaveChanges();
+
+                //Controller
+                var controller = new StatsController(context);
+
+                //One play: made 2 + and-one free throw for player 1, assist for player 2
+                var statDtos = new List<StatCreateDTO>
+                {
+                    new StatCreateDTO { Player_ID = 1, Game_ID = 1, Two_Points_Made = 1 },
+                    new StatCreateDTO { Player_ID = 1, Game_ID = 1, Free_Throw_Made = 1 },
+                    new StatCreateDTO { Player_ID = 2, Game_ID = 1, Assists = 1 },
+                };
+
+                // Post
+                var result = await controller.PostStatsBatch(statDtos);
+
+                // Check
+                var okResult = Assert.IsType<OkObjectResult>(result.Result);
+                var stats = Assert.IsAssignableFrom<IEnumerable<StatDTO>>(okResult.Value);
+                Assert.Equal(2, stats.Count());
+                Assert.Equal(2, context.Stats.Count());
+                var shooter = context.Stats.Single(s => s.Player_ID == 1);
+                Assert.Equal(2, shooter.Two_Points_Made);
+                Assert.Equal(1, shooter.Free_Throw_Made);
+                Assert.Equal(1, context.Stats.Single(s => s.Player_ID == 2).Assists);
+            }
+        }
+
+        [Fact]
+        public async Task PostStatsBatch_ReturnsBadRequestAndSavesNothing_WhenPlayerDoesNotExist()
+        {
+            using (var context = new GOBContext(_options))
+            {
+                //Clear Data
+                context.Stats.RemoveRange(context.Stats);
+                context.Players.RemoveRange(context.Players);
+                context.Games.RemoveRange(context.Games);
+                context.SaveChanges();
+
+                //Add data
+                context.Players.Add(new Player { Player_ID = 1, Team_ID = 1, First_Name = "John", Last_Name = "Doe", Position_ID = "C", Jersy_Number = 23 });
+                context.Games.Add(new Game { Game_ID = 1, Home_ID = 1, Away_ID = 2, Game_Date = DateTime.Now });
+                context.SaveChanges();
+
+                //Controller
+                var controller = new StatsController(context);
+
+                //Second stat has a player that doesnt exist
+                var statDtos = new List<StatCreateDTO>
+                {
+                    new StatCreateDTO { Player_ID = 1, Game_ID = 1, Two_Points_Made = 1 },
+                    new StatCreateDTO { Player_ID = 99, Game_ID = 1, Assists = 1 },
+                };
+
+                // Post
+                var result = await controller.PostStatsBatch(statDtos);
+
+                // Check
+                Assert.IsType<BadRequestObjectResult>(result.Result);
+                Assert.False(context.Stats.Any());
+            }
+        }
+
+        [Fact]
+        public async Task PostStatsBatch_AppliesSameIdempotencyKeyOnlyOnce()
+        {
+            using (var context = new GOBContext(_options))
+            {
+                //Clear Data
+                context.Stats.RemoveRange(context.Stats);
+                context.Players.RemoveRange(context.Players);
+                context.Games.RemoveRange(context.Games);
+                context.SaveChanges();
+
+                //Add data
+                context.Players.Add(new Player { Player_ID = 1, Team_ID = 1, First_Name = "John", Last_Name = "Doe", Position_ID = "C", Jersy_Number = 23 });
+                context.Games.Add(new Game { Game_ID = 1, Home_ID = 1, Away_ID = 2, Game_Date = DateTime.Now });
+                context.SaveChanges();
+
+                //Controller
+                var controller = new StatsController(context);
+
+                var statDtos = new List<StatCreateDTO>
+                {
+                    new StatCreateDTO { Player_ID = 1, Game_ID = 1, Three_Points_Made = 1 },
+                };
+                var key = Guid.NewGuid().ToString();
+
+                // Post the same batch twice (a client retry)
+                var first = await controller.PostStatsBatch(statDtos, key);
+                var second = await controller.PostStatsBatch(statDtos, key);
+
+                // Check - counted once, both answered Ok
+                Assert.IsType<OkObjectResult>(first.Result);
+                Assert.IsType<OkObjectResult>(second.Result);
+                Assert.Equal(1, context.Stats.Single(s => s.Player_ID == 1).Three_Points_Made);
+
+                // A different key is a new play
+                await controller.PostStatsBatch(statDtos, Guid.NewGuid().ToString());
+                Assert.Equal(2, context.Stats.Single(s => s.Player_ID == 1).Three_Points_Made);
+            }
+        }
+
+        [Fact]
+        public async Task PostStatsBatch_PublishesTotalsToGameSubscribers()
+        {
+            using (var context = new GOBContext(_options))
+            {
+                //Clear Data
+                context.Stats.RemoveRange(context.Stats);
+                context.Players.RemoveRange(context.Players);
+                context.Games.RemoveRange(context.Games);
+                context.SaveChanges();
+
+                //Add data
+                context.Players.Add(new Player { Player_ID = 1, Team_ID = 1, First_Name = "John", Last_Name = "Doe", Position_ID = "C", Jersy_Number = 23 });
+                context.Games.Add(new Game { Game_ID = 1, Home_ID = 1, Away_ID = 2, Game_Date = DateTime.Now });
+                context.SaveChanges();
+
+                //Controller with its own hub, following game 1
+                var hub = new StatEventHub();
+                var controller = new StatsController(context, hub);
+                using var subscription = hub.Subscribe(1);
+
+                await controller.PostStatsBatch(new List<StatCreateDTO>
+                {
+                    new StatCreateDTO { Player_ID = 1, Game_ID = 1, Two_Points_Made = 1 },
+                    new StatCreateDTO { Player_ID = 1, Game_ID = 1, Assists = 1 },
+                });
+
+                // Check - one event with both deltas and the merged row
+                Assert.True(subscription.Reader.TryRead(out var evt));
+                Assert.Equal(1, evt!.Game_ID);
+                Assert.Equal(2, evt.Deltas.Count);
+                var row = Assert.Single(evt.Stats);
+                Assert.Equal(1, row.Two_Points_Made);
+                Assert.Equal(1, row.Assists);
+                Assert.False(subscription.Reader.TryRead(out _));
+            }
+        }
+
+        [Fact]
+        public void StatEventHub_ReplaysEventsAfterLastSeq()
+        {
+            var hub = new StatEventHub();
+            hub.Publish(7, new List<StatCreateDTO>(), new List<StatDTO>());
+            var second = hub.Publish(7, new List<StatCreateDTO>(), new List<StatDTO>());
+            hub.Publish(8, new List<StatCreateDTO>(), new List<StatDTO>());
+
+            // Reconnecting after seq 1 gets only game 7's second event
+            using (var subscription = hub.Subscribe(7, lastSeq: 1))
+            {
+                var replayed = Assert.Single(subscription.Replay);
+                Assert.Equal(second.Seq, replayed.Seq);
+                Assert.Equal(1, hub.SubscriberCount(7));
+            }
+            Assert.Equal(0, hub.SubscriberCount(7));
+        }
+
         [Fact]
         public async Task DeleteStat_ReturnsNoContentResult_WhenStatIsDeleted()
         {
@@ -1,119 +1,357 @@
+import contextvars
 import json
 import os
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from gob_log import get_logger
+from live_events import GameEventStream
+from response_cache import ResponseCache
+from records import STAT_FIELDS, Game, Player, Stat, Team
+from stats_engine import StatTable
+from tracing import TRACER
+
+log = get_logger("Real_API")
+
+# Default timeouts for every call: (connect, read) in seconds.
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# How long get_game_snapshot waits for its parallel fetches, in seconds.
+SNAPSHOT_BUDGET = 1.5
+
+# Marker for "no default given" in _get_json
+_RAISE = object()
+
+# Which StatCreateDTO field each UI action increments.
+# "rebound" is counted as a defensive rebound; actions not listed here
+# (e.g. "fouled") don't change any counter.
+ACTION_FIELDS = {
+    "2pt_make": "two_Points_Made",
+    "2pt_miss": "two_Points_Missed",
+    "3pt_make": "three_Points_Made",
+    "3pt_miss": "three_Points_Missed",
+    "ft_make": "free_Throw_Made",
+    "ft_miss": "free_Throw_Missed",
+    "rebound": "def_Rebounds",
+    "steal": "steals",
+    "TO": "turnovers",
+    "assist": "assists",
+    "block": "blocks",
+    "foul": "fouls",
+}
+
+
+def stat_body(game_id, player_id):
+    """A StatCreateDTO payload with every counter at 0."""
+    body = {"player_ID": player_id, "game_ID": game_id}
+    body.update((field, 0) for field in STAT_FIELDS)
+    return body
+
+
+def stat_increments(action):
+    """
+    {field: count} for one UI action, e.g. "3pt_make" -> {"three_Points_Made": 1}
+    and "ft_make_2" -> {"free_Throw_Made": 2}. Unknown actions give {}.
+    """
+    field = ACTION_FIELDS.get(action)
+    if field is not None:
+        return {field: 1}
+    if action.startswith("ft_make_"):
+        count_str = action.split("_")[-1]
+        if count_str.isdigit():
+            return {"free_Throw_Made": int(count_str)}
+    return {}
+
+
+def merge_stat_events(game_id, events):
+    """
+    Turns one play's (player_id, action) events into StatCreateDTO rows, one per player,
+    in the order the players first appear. Events that don't change a counter are skipped.
+      [(12, "2pt_make"), (12, "ft_make"), (7, "assist")]
+        -> [{player 12: two_Points_Made 1, free_Throw_Made 1}, {player 7: assists 1}]
+    """
+    merged = {}  # player_id -> StatCreateDTO payload
+    for player_id, action in events:
+        increments = stat_increments(action)
+        if not increments:
+            continue
+        body = merged.get(player_id)
+        if body is None:
+            body = merged[player_id] = stat_body(game_id, player_id)
+        for field, count in increments.items():
+            body[field] += count
+    return list(merged.values())
+
+
+def _response_bytes(resp):
+    length = resp.headers.get("Content-Length")
+    if length is not None and length.isdigit():
+        return int(length)
+    return len(resp.content or b"")
+
 
 class RealAPI:
-    def __init__(self):
-        # Put all your normal init code here, for example:
-        self.base_url = "http://localhost:5232"
-        self._players_cache = {}  # optional caches
-        self._stats_cache = {}  # optional caches
-        # Define _team_cache as a dictionary:
-        self._team_cache = {}
+    def __init__(self, base_url="http://localhost:5232", pool_connections=4, pool_maxsize=16,
+                 pool_block=True, timeout=DEFAULT_TIMEOUT, cache_size=512, cache_ttls=None, tracer=None):
+        """
+        All endpoint wrappers share one requests.Session, so the TCP connection to the
+        ASP.NET API is kept alive and reused between calls instead of being reopened
+        for every stat post.
+
+          pool_connections - how many per-host pools to keep (we normally only talk to one host)
+          pool_maxsize     - max open connections per host
+          pool_block       - if True, callers wait for a free connection instead of opening
+                             more than pool_maxsize connections to the same host
+          timeout          - (connect, read) timeout used by every request
+          cache_size       - max responses kept in the read cache (LRU beyond that)
+          cache_ttls       - per-endpoint TTLs, see response_cache.DEFAULT_TTLS
+          tracer           - where every request and cache lookup is recorded
+                             (default: the shared tracing.TRACER)
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.tracer = tracer if tracer is not None else TRACER
+
+        self._session = requests.Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
+
+        # Runs the independent GETs of get_game_snapshot side by side
+        self._snapshot_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gob-snapshot")
+
+        # Every read (rosters, teams, games, stats, scores) goes through this cache.
+        # Writes below invalidate the keys they affect.
+        self._cache = ResponseCache(max_entries=cache_size, ttls=cache_ttls, on_lookup=self.tracer.record_cache)
+
+    # ----------------
+    # CONNECTION POOL
+    # ----------------
+    def _request(self, method, path, **kwargs):
+        """
+        Sends one request through the shared session. 'path' is relative to base_url
+        (e.g. "/Games/5"). Uses the default timeout unless one is passed in.
+        Every call is reported to the tracer: status, bytes and latency (status None
+        if it never got an answer).
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        try:
+            resp = self._session.request(method, f"{self.base_url}{path}", **kwargs)
+        except requests.RequestException:
+            self.tracer.record_request(method, path, None, 0, time.perf_counter() - start)
+            raise
+        self.tracer.record_request(method, path, resp.status_code, _response_bytes(resp),
+                                   time.perf_counter() - start)
+        return resp
 
-        # 1) Get all players for a team, sorted by Player_ID
+    def _get(self, path, **kwargs):
+        return self._request("GET", path, **kwargs)
 
-    def get_players_for_team_sorted(self, team_id: int):
-        url = f"{self.base_url}/Players"
+    def _post(self, path, **kwargs):
+        return self._request("POST", path, **kwargs)
+
+    def _delete(self, path, **kwargs):
+        return self._request("DELETE", path, **kwargs)
+
+    def connection_stats(self):
+        """
+        Returns how many requests went out and how many TCP connections had to be
+        opened for them, e.g. { "requests": 40, "opened": 1, "reused": 39 }.
+        """
+        requests_sent = 0
+        opened = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_sent += pool.num_requests
+            opened += pool.num_connections
+        return {
+            "requests": requests_sent,
+            "opened": opened,
+            "reused": max(requests_sent - opened, 0),
+        }
+
+    def close(self):
+        """Closes every pooled connection."""
+        self._snapshot_pool.shutdown(wait=False)
+        self._session.close()
+
+    def _get_json(self, path, not_found=_RAISE):
+        """
+        GET path and return the decoded JSON. If not_found is given, a 404 returns
+        it instead of raising (several endpoints answer 404 for "no rows yet").
+        Raises requests.RequestException on any other failure.
+        """
+        resp = self._get(path)
+        if resp.status_code == 404 and not_found is not _RAISE:
+            return not_found
+        resp.raise_for_status()
+        return resp.json()
+
+    def _get_records(self, path, record, not_found=_RAISE):
+        """
+        Like _get_json, but turns the JSON into records (records.Team / Game / Player /
+        Stat): a list for a JSON array, one record for an object.
+        """
+        data = self._get_json(path, not_found=not_found)
+        if data is not_found:
+            return data
+        if isinstance(data, list):
+            return [record.from_json(item) for item in data]
+        return record.from_json(data)
+
+    def cache_stats(self):
+        """Hit / miss / eviction counters of the response cache."""
+        return self._cache.stats()
+
+    def clear_cache(self):
+        """Forgets every cached response, so the next reads all go to the API (benchmarks use it)."""
+        self._cache.clear()
+
+    # ----------------
+    # ROSTER INDEX
+    # ----------------
+    def _load_roster_index(self):
+        """
+        Downloads the whole league roster once (GET /Players) and groups it by team:
+          { 5: [ Player(player_ID=1, team_ID=5, ...), Player(player_ID=4, ...) ], 6: [...], None: [...] }
+        Each team's list is already sorted by player_ID. Returns (by_team, {player_ID: team_ID}).
+        """
+        index = {}
+        team_by_player = {}
+        for p in self._get_records("/Players", Player):
+            index.setdefault(p.team_ID, []).append(p)
+            team_by_player[p.player_ID] = p.team_ID
+        for roster in index.values():
+            roster.sort(key=lambda x: x.player_ID)
+        return index, team_by_player
+
+    def _roster_index(self):
+        """The cached (by_team, team_by_player) roster index, or None if it can't be loaded right now."""
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
+            return self._cache.get_or_load(("players",), self._load_roster_index)
         except requests.RequestException as e:
-            print(f"Error fetching players: {e}")
+            log.error("Error fetching players: %s", e)
+            return None
+
+    def invalidate_roster_index(self):
+        """Forget the roster index; the next per-team lookup reloads it with one GET /Players."""
+        self._cache.invalidate(("players",))
+
+    def _team_of_player(self, player_id):
+        """team_ID of a player, looked up in the roster index (None if unknown)."""
+        index = self._roster_index()
+        if index is None:
+            return None
+        return index[1].get(player_id)
+
+    # ----------------
+    # GETTERS
+    # ----------------
+    def get_players_for_team_sorted(self, team_id: int):
+        """
+        All players on a team, sorted by player_ID. Served from the roster index, so only
+        the first call (or the first after invalidate_roster_index / the TTL) touches the
+        network. The returned list is shared with the index - don't modify it.
+        """
+        index = self._roster_index()
+        if index is None:
             return []
-        all_players = resp.json()  # Expecting an array of player objects.
-        print("DEBUG: get_players_for_team_sorted - full response:", all_players)
-        # Use the correct key: your debug shows players have 'team_ID'
-        filtered = [p for p in all_players if p.get("team_ID") == team_id]
-        filtered.sort(key=lambda x: x.get("Player_ID", 0))
-        print("DEBUG: get_players_for_team_sorted - filtered for team", team_id, ":", filtered)
-        return filtered
+        return index[0].get(team_id, [])
 
     def get_team_stats_for_game(self, team_id: int, game_id: int):
-        url = f"{self.base_url}/Stats/Team/{team_id}/Game/{game_id}"
+        """
+        GET /Stats/Team/{teamId}/Game/{gameId}, cached until a stat for that team and
+        game is written. Returns [] if there are no stats yet or the call fails.
+        """
+        if not team_id or not game_id:
+            return []
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
+            stats = self._cache.get_or_load(
+                ("team_stats", team_id, game_id),
+                lambda: self._get_records(f"/Stats/Team/{team_id}/Game/{game_id}", Stat, not_found=[]),
+                tags=(("stats", team_id, game_id), ("stats", game_id), ("game", game_id)),
+            )
         except requests.RequestException as e:
-            print(f"Error fetching stats for team={team_id} in game={game_id}: {e}")
+            log.error("Error fetching stats for team=%s in game=%s: %s", team_id, game_id, e)
             return []
-        stats = resp.json()
-        print("DEBUG: get_team_stats_for_game - response for team", team_id, "in game", game_id, ":", stats)
+        log.debug("get_team_stats_for_game - team %s in game %s: %s", team_id, game_id, stats)
         return stats
 
-    def get_player_stats_for_game(self, player_id: int, game_id: int) -> dict:
-        url = f"{self.base_url}/Stats/Game/{game_id}"
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            all_stats = resp.json()  # Expecting an array of stat objects.
-        except requests.RequestException as e:
-            print(f"Error fetching stats for game {game_id}: {e}")
-            return None
-        print("DEBUG: get_player_stats_for_game - all stats for game", game_id, ":", all_stats)
-        # Filter for the player's record (using "Player_ID")
-        row = next((s for s in all_stats if s.get("Player_ID") == player_id), None)
-        print("DEBUG: get_player_stats_for_game - filtered stat for player", player_id, ":", row)
+    def get_player_stats_for_game(self, player_id: int, game_id: int) -> Stat:
+        all_stats = self.get_game_stats(game_id)
+        # Filter for the player's record
+        row = next((s for s in all_stats if s.player_ID == player_id), None)
+        log.debug("get_player_stats_for_game - player %s in game %s: %s", player_id, game_id, row)
         return row
 
-    def get_game_score(self, game_id: int):
-        url = f"{self.base_url}/Stats/GameScore/{game_id}"
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-        except requests.RequestException as e:
-            print(f"Error fetching game score for game {game_id}: {e}")
-            return {}
-        score = resp.json()
-        print("DEBUG: get_game_score - response for game", game_id, ":", score)
-        return score
-
-    def get_all_teams(self):
-        url = f"{self.base_url}/Teams"
+    def get_game_stats(self, game_id: int):
+        """
+        GET /Stats/Game/{gameId} - every stat row recorded for a game, as records.Stat.
+        Returns [] if the game has no stats yet (the API answers 404 in that case).
+        """
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
+            return self._cache.get_or_load(
+                ("game_stats", game_id),
+                lambda: self._get_records(f"/Stats/Game/{game_id}", Stat, not_found=[]),
+                tags=(("stats", game_id), ("game", game_id)),
+            )
         except requests.RequestException as e:
-            print(f"Error calling {url}: {e}")
+            log.error("Error fetching stats for game %s: %s", game_id, e)
             return []
-        return resp.json()
 
-    def get_schedule(self):
-        url = f"{self.base_url}/Games"
+    def get_all_stats(self):
+        """
+        GET /Stats - every stat row of the season. Cached until any stat is written.
+        Returns [] if the call fails.
+        """
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
+            return self._cache.get_or_load(("all_stats",), lambda: self._get_records("/Stats", Stat),
+                                          tags=(("stats",),))
         except requests.RequestException as e:
-            print(f"Error fetching games from {url}: {e}")
+            log.error("Error fetching all stats: %s", e)
             return []
-        games = resp.json()
-        for game in games:
-            home_id = game.get("Home_ID")
-            away_id = game.get("Away_ID")
-            home_name = self._get_team_name_by_id(home_id) if home_id else "Unknown"
-            away_name = self._get_team_name_by_id(away_id) if away_id else "Unknown"
-            game["home"] = home_name
-            game["away"] = away_name
-        return games
 
-    def _get_team_name_by_id(self, team_id):
-        if team_id in self._team_cache:
-            return self._team_cache[team_id]
-        url = f"{self.base_url}/Teams/{team_id}"
+    def get_season_table(self):
+        """
+        The whole season's stat rows as a stats_engine.StatTable (with each player's
+        team filled in), e.g. get_season_table().leaders("points", n=10, per_game=True).
+        Cached like the rows it's built from, so repeated leaderboards skip the loading.
+        """
+        def build():
+            index = self._roster_index()
+            return StatTable.from_rows(self.get_all_stats(), team_of=index[1] if index else None)
+        return self._cache.get_or_load(("season_table",), build, tags=(("stats",),))
+
+    def get_game(self, game_id: int):
+        """
+        GET /Games/{id} - a single game, e.g.
+          Game(game_ID=2, home_ID=5, away_ID=6, game_Date="...")
+        Returns None if it can't be fetched.
+        """
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
+            return self._cache.get_or_load(
+                ("game", game_id),
+                lambda: self._get_records(f"/Games/{game_id}", Game),
+                tags=(("game", game_id),),
+            )
         except requests.RequestException as e:
-            print(f"Error fetching team {team_id} from {url}: {e}")
-            self._team_cache[team_id] = "Unknown"
-            return "Unknown"
-        data = resp.json()
-        team_name = data.get("Team_Name", "Unknown")
-        self._team_cache[team_id] = team_name
-        return team_name
+            log.error("Error fetching game %s: %s", game_id, e)
+            return None
 
     # (Optional) If you want a method to fetch the scoreboard from /Stats/GameScore/{gameId}:
     def get_game_score(self, game_id: int):
@@ -121,103 +359,158 @@ class RealAPI:
         If your backend has an endpoint that returns the live score for a game,
         e.g. GET /Stats/GameScore/15 => { "GameId":15, "HomeTeamScore":72, "AwayTeamScore":68 }
         return that object. Adjust key names if needed.
+        Raises requests.RequestException if it can't be fetched.
         """
-        url = f"{self.base_url}/Stats/GameScore/{game_id}"
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        return resp.json()
-    def get_all_teams(self):
+        return self._cache.get_or_load(
+            ("game_score", game_id),
+            lambda: self._get_json(f"/Stats/GameScore/{game_id}"),
+            tags=(("stats", game_id), ("game", game_id)),
+        )
+
+    def get_game_snapshot(self, game_id: int, game=None, budget=SNAPSHOT_BUDGET, server_score=False):
         """
-        Makes an HTTP GET request to retrieve all teams (TeamDTOs).
-        Adjust the path if your endpoint is /Team or /api/Team, etc.
+        Everything the game details panel needs, in one call:
+          {
+            "game_id": 2,
+            "game": Game(game_ID=2, home_ID=5, away_ID=6, ...),
+            "stats": [ Stat(...), ... ],
+            "home_roster": [ Player(...), ... ],  # sorted by player_ID
+            "away_roster": [ Player(...), ... ],
+            "team_of": { player_ID: team_ID },  # whole league
+            "server_score": None,               # GameScore response, if asked for
+            "missing": [],                      # parts that failed / missed the budget
+            "elapsed_ms": 41.7
+          }
+        The score isn't fetched by default - box_score.BoxScore works it out from the
+        stat rows. Pass server_score=True to also get GET /Stats/GameScore/{id} (to
+        reconcile against).
+        Pass the game's schedule record as 'game' if you have it (saves GET /Games/{id}).
+        The remaining parts are fetched in parallel, so opening a game costs about one
+        round trip instead of several in a row, and cached parts come back immediately.
+        Nothing waits longer than 'budget' seconds: a part that isn't back by then is
+        left empty and named in "missing" (its request keeps running and fills the
+        cache for next time). Returns None if the game itself can't be had.
         """
-        url = f"{self.base_url}/Teams"
-        # If your controller route is [Route("api/[controller]")], it might be f"{self.base_url}/api/Teams" instead.
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()  # Will raise an exception if status is 4xx/5xx
-        except requests.RequestException as e:
-            print(f"Error calling {url}: {e}")
-            return []  # or re-raise, or handle as you wish
+        start = time.perf_counter()
+        parts = {
+            "stats": lambda: self.get_game_stats(game_id),
+            "roster": self._roster_index,
+        }
+        if server_score:
+            parts["score"] = lambda: self._snapshot_score(game_id)
+        if game is None:
+            parts["game"] = lambda: self.get_game(game_id)
+        # Each part runs in a copy of our context, so its requests count toward the caller's span
+        futures = {name: self._snapshot_pool.submit(contextvars.copy_context().run, fn)
+                   for name, fn in parts.items()}
+        wait(futures.values(), timeout=budget)
+
+        results = {}
+        missing = []
+        for name, future in futures.items():
+            if not future.done():
+                log.warning("Snapshot of game %s: '%s' not back within %ss", game_id, name, budget)
+                missing.append(name)
+                continue
+            try:
+                results[name] = future.result()
+            except requests.RequestException as e:
+                log.error("Snapshot of game %s: '%s' failed: %s", game_id, name, e)
+                missing.append(name)
+                continue
+            if results[name] is None:
+                missing.append(name)
+
+        game = game if game is not None else results.get("game")
+        if game is None:
+            log.error("Snapshot of game %s: game not found", game_id)
+            return None
+        roster = results.get("roster") or ({}, {})
+        return {
+            "game_id": game_id,
+            "game": game,
+            "stats": results.get("stats") or [],
+            "home_roster": roster[0].get(game.home_ID, []),
+            "away_roster": roster[0].get(game.away_ID, []),
+            "team_of": roster[1],
+            "server_score": results.get("score"),
+            "missing": missing,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
 
-        # If success, parse JSON (should be a list of TeamDTO)
-        teams_json = response.json()  # e.g. [{ "team_ID": 1, "team_Name": "...", ... }, ...]
-        return teams_json  # or you can transform that into just names if you prefer
+    def _snapshot_score(self, game_id):
+        # GameScore answers 404 until the game has a stat; that's a 0-0 game, not an error
+        try:
+            return self.get_game_score(game_id)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return {"gameId": game_id, "homeTeamScore": 0, "awayTeamScore": 0}
+            raise
 
-    # ----------------
-    # GETTERS
-    # ----------------
     def get_schedule(self):
         """
         Fetches all games from the API (like GET /Games),
         then for each game, look up the home/away team name by ID
-        and store them in game["home"] / game["away"].
-        Returns a list of game dicts, each like:
-          {
-            "game_ID": 2,
-            "home_ID": 5,
-            "away_ID": 6,
-            "game_Date": "2025-03-22T16:00:00",
-            "home": "sandro",
-            "away": "Bilitski"
-          },
-          ...
-        just like the FakeAPI version did, but now from real data.
+        and store them in game.home / game.away.
+        Returns a list of records.Game, each like:
+          Game(game_ID=2, home_ID=5, away_ID=6, game_Date="2025-03-22T16:00:00",
+               home="sandro", away="Bilitski")
+        The list is cached until a game is created or deleted - don't modify it.
         """
-        url = f"{self.base_url}/Games"
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
+            return self._cache.get_or_load(("games",), self._load_schedule)
         except requests.RequestException as e:
-            print(f"Error fetching games from {url}: {e}")
+            log.error("Error fetching games from %s/Games: %s", self.base_url, e)
             return []
 
-        # This should be a list of game objects, e.g.
-        # [ { "game_ID": 2, "home_ID":5, "away_ID":6, "game_Date": ... }, ... ]
-        games = resp.json()
+    def _load_schedule(self):
+        # [ Game(game_ID=2, home_ID=5, away_ID=6, game_Date=...), ... ]
+        games = self._get_records("/Games", Game)
 
-        for game in games:
-            home_id = game.get("home_ID")
-            away_id = game.get("away_ID")
-
-            # Get the team names from the helper method:
-            home_name = self._get_team_name_by_id(home_id) if home_id else "Unknown"
-            away_name = self._get_team_name_by_id(away_id) if away_id else "Unknown"
+        # Resolve every team name in one pass: if any ID isn't in the team table yet,
+        # reload the whole table with a single GET /Teams (never one call per team).
+        team_ids = {g.home_ID for g in games} | {g.away_ID for g in games}
+        team_ids.discard(None)
+        names = self._team_table()[1]
+        if not team_ids.issubset(names):
+            names = self._team_table(refresh=True)[1]
 
-            # Add them to the game dict
-            game["home"] = home_name
-            game["away"] = away_name
+        for game in games:
+            game.home = names.get(game.home_ID, "Unknown")
+            game.away = names.get(game.away_ID, "Unknown")
 
         return games
 
-    def _get_team_name_by_id(self, team_id):
+    def _load_team_table(self):
         """
-        Helper method to fetch a single team by its ID.
-        Cache the results so repeated requests for the same ID won't re-fetch.
-        Expects the API to return JSON like:
-          {
-            "team_ID": 7,
-            "team_Name": "Duke",
-            "team_City": "Pittsburgh",
-            ...
-          }
+        GET /Teams once and build (teams_list, {team_ID: team_Name}).
         """
-        if team_id in self._team_cache:
-            return self._team_cache[team_id]
+        teams_data = self._get_records("/Teams", Team)  # e.g. [Team(team_ID=5, team_Name="sandro", ...), ...]
+        names = {team.team_ID: team.team_Name for team in teams_data}
+        return teams_data, names
 
-        url = f"{self.base_url}/Teams/{team_id}"
+    def _team_table(self, refresh=False):
+        """
+        The cached (teams_list, {team_ID: team_Name}) pair. refresh=True forces one
+        new GET /Teams. Returns ([], {}) if the teams can't be fetched.
+        """
+        if refresh:
+            self._cache.invalidate(("teams",))
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
+            return self._cache.get_or_load(("teams",), self._load_team_table)
         except requests.RequestException as e:
-            print(f"Error fetching team {team_id} from {url}: {e}")
-            self._team_cache[team_id] = "Unknown"
-            return "Unknown"
+            log.error("Error calling %s/Teams: %s", self.base_url, e)
+            return [], {}
 
-        data = resp.json()  # e.g. { "team_ID":7, "team_Name":"Duke", ...}
-        team_name = data.get("team_Name", "Unknown")
-        self._team_cache[team_id] = team_name
-        return team_name
+    def _get_team_name_by_id(self, team_id):
+        """
+        Looks a team name up in the team table. A miss reloads the whole table
+        with one GET /Teams rather than fetching /Teams/{id} on its own.
+        """
+        names = self._team_table()[1]
+        if team_id not in names:
+            names = self._team_table(refresh=True)[1]
+        return names.get(team_id, "Unknown")
 
     def get_all_teams(self):
         """
@@ -229,27 +522,18 @@ class RealAPI:
         ]
         We'll extract the 'team_Name' from each and return a sorted list of names.
         """
-        url = f"{self.base_url}/Teams"
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()  # Raises an error if HTTP status is 4xx or 5xx
-        except requests.RequestException as e:
-            print(f"Error calling {url}: {e}")
-            # Return an empty list (or handle differently)
-            return []
-
-        # response.json() should be the list of teams
-        teams_data = response.json()  # e.g. [{ "team_ID": 5, "team_Name": "sandro", ...}, ...]
+        # Shares the team table used by get_schedule
+        teams_data = self._team_table()[0]
 
         # Extract just the team names
-        team_names = [team["team_Name"] for team in teams_data]
+        team_names = [team.team_Name for team in teams_data]
 
         # Sort the list of names before returning
         return sorted(team_names)
 
     def get_game_details(self, game):
         """
-        1) Get home_team_id and away_team_id from the game dictionary.
+        1) Get home_team_id and away_team_id from the game record.
         2) Fetch the list of players for each team.
         3) Fetch the stats for each team in that game (via /Stats/Team/{teamId}/Game/{gameId}).
         4) For each player, if a stat row exists use it; otherwise, use zeroed stats.
@@ -257,9 +541,9 @@ class RealAPI:
         6) Return a dictionary with game_id, home_score, away_score, and display lines.
         """
         # Use the keys as returned by your API.
-        game_id = game.get("game_ID")
-        home_team_id = game.get("home_ID")
-        away_team_id = game.get("away_ID")
+        game_id = game.game_ID
+        home_team_id = game.home_ID
+        away_team_id = game.away_ID
 
         home_display = []
         away_display = []
@@ -274,61 +558,27 @@ class RealAPI:
         home_stats_list = self._get_team_stats_for_game(home_team_id, game_id) if home_team_id and game_id else []
         away_stats_list = self._get_team_stats_for_game(away_team_id, game_id) if away_team_id and game_id else []
 
-        # Build stat mapping by player ID.
-        # Check both "Player_ID" (from stat objects) and "player_ID"
-        home_stats_dict = {(s.get("Player_ID") or s.get("player_ID")): s for s in home_stats_list}
-        away_stats_dict = {(s.get("Player_ID") or s.get("player_ID")): s for s in away_stats_list}
-
-        def format_stat_line(player, stat):
-            # Use keys from stat objects (which are capitalized)
-            two_pt_made = stat.get("Two_Points_Made", 0)
-            two_pt_miss = stat.get("Two_Points_Missed", 0)
-            three_pt_made = stat.get("Three_Points_Made", 0)
-            three_pt_miss = stat.get("Three_Points_Missed", 0)
-            ft_made = stat.get("Free_Throw_Made", 0)
-            off_reb = stat.get("Off_Rebounds", 0)
-            def_reb = stat.get("Def_Rebounds", 0)
-            assists = stat.get("Assists", 0)
-            points = (three_pt_made * 3) + (two_pt_made * 2) + ft_made
-            rebounds = off_reb + def_reb
-            total_made = two_pt_made + three_pt_made
-            total_attempts = total_made + two_pt_miss + three_pt_miss
-            fg_pct_int = int(round((total_made / total_attempts) * 100)) if total_attempts > 0 else 0
-            fg_str = f"{fg_pct_int}%"
-
-            # Use keys from player objects (which are lowercase)
-            last_name = player.get("last_Name", "")
-            pos_id = player.get("position_ID", "???")
-            number_str = str(player.get("jersey_Number", 0))
-
-            line = f"{pos_id:<3}|{number_str:<2}|{last_name:<12}|{points:>3}|{assists:>3}|{rebounds:>3}|{fg_str:>3}"
-            return line, points
-
-        # Process home team players.
+        # All the math happens in one StatTable; it reads either key casing.
+        per_player = StatTable.from_rows(list(home_stats_list) + list(away_stats_list)).by_player()
+
+        def format_stat_line(player):
+            line = per_player.get(player.player_ID)
+            last_name = player.last_Name
+            pos_id = player.position_ID or "???"
+            number_str = str(player.jersey_Number)
+            fg_str = f"{line['fg_pct']}%"
+
+            text = (f"{pos_id:<3}|{number_str:<2}|{last_name:<12}|{line['points']:>3}|{line['assists']:>3}|"
+                    f"{line['rebounds']:>3}|{fg_str:>3}")
+            return text, line["points"]
+
         for player in home_players:
-            pid = player.get("player_ID")
-            stat = home_stats_dict.get(pid, {
-                "Two_Points_Made": 0, "Two_Points_Missed": 0,
-                "Three_Points_Made": 0, "Three_Points_Missed": 0,
-                "Free_Throw_Made": 0, "Free_Throw_Missed": 0,
-                "Steals": 0, "Turnovers": 0, "Assists": 0, "Blocks": 0,
-                "Fouls": 0, "Off_Rebounds": 0, "Def_Rebounds": 0
-            })
-            line_str, pts = format_stat_line(player, stat)
+            line_str, pts = format_stat_line(player)
             home_display.append(line_str)
             home_score += pts
 
-        # Process away team players.
         for player in away_players:
-            pid = player.get("player_ID")
-            stat = away_stats_dict.get(pid, {
-                "Two_Points_Made": 0, "Two_Points_Missed": 0,
-                "Three_Points_Made": 0, "Three_Points_Missed": 0,
-                "Free_Throw_Made": 0, "Free_Throw_Missed": 0,
-                "Steals": 0, "Turnovers": 0, "Assists": 0, "Blocks": 0,
-                "Fouls": 0, "Off_Rebounds": 0, "Def_Rebounds": 0
-            })
-            line_str, pts = format_stat_line(player, stat)
+            line_str, pts = format_stat_line(player)
             away_display.append(line_str)
             away_score += pts
 
@@ -343,30 +593,16 @@ class RealAPI:
     # ----------------
     # SETTERS / UPDATERS
     # ----------------
-    def _get_players_for_team(self, team_id):
-        url = f"{self.base_url}/Players"
-        resp = requests.get(url)
-        if resp.status_code != 200:
-            print(f"Error fetching players: {resp.status_code} {resp.text}")
-            return []
-        all_players = resp.json()  # e.g. [ { "player_ID":1, "team_ID":5, "last_Name":"Smith", ...}, ... ]
-        # Filter the list
-        return [p for p in all_players if p.get("team_ID") == team_id]
-
     def get_team_id_by_name(self, team_name):
         """
-        Example: calls GET /Teams, finds a team whose 'team_Name' matches.
+        Finds a team whose 'team_Name' matches in the team table, reloading the
+        table (one GET /Teams) only if the name isn't there.
         Return the integer Team_ID or None if not found.
         """
-        url = f"{self.base_url}/Teams"
-        resp = requests.get(url)
-        if resp.status_code != 200:
-            print(f"Error fetching teams: {resp.status_code} {resp.text}")
-            return None
-        all_teams = resp.json()  # e.g. [ { "team_ID":5,"team_Name":"sandro"...}, ... ]
-        for t in all_teams:
-            if t["team_Name"].lower() == team_name.lower():
-                return t["team_ID"]
+        for refresh in (False, True):
+            for team_id, name in self._team_table(refresh=refresh)[1].items():
+                if name.lower() == team_name.lower():
+                    return team_id
         return None
 
     def create_game(self, home, away, dt_value):
@@ -393,8 +629,8 @@ class RealAPI:
         # --------------------------------
         utc_dt = dt_value.astimezone(timezone.utc)
 
-        # For debugging, print so you confirm times
-        print(f"[create_game] Input local dt: {dt_value}, converted to UTC: {utc_dt}")
+        # For debugging, so you can confirm times
+        log.debug("create_game: input local dt %s, converted to UTC %s", dt_value, utc_dt)
 
         # --------------------------------
         # C) Format the final string
@@ -405,7 +641,7 @@ class RealAPI:
         home_team_id = self.get_team_id_by_name(home)
         away_team_id = self.get_team_id_by_name(away)
         if home_team_id is None or away_team_id is None:
-            print("Error: Could not find team IDs for the selected teams.")
+            log.error("Could not find team IDs for the selected teams.")
             return None
 
         # Build payload for your ASP.NET /Games endpoint
@@ -418,41 +654,97 @@ class RealAPI:
         # --------------------------------
         # D) POST to /Games
         # --------------------------------
-        url = f"{self.base_url}/Games"
-        resp = requests.post(url, json=payload_game)
+        resp = self._post("/Games", json=payload_game)
         if resp.status_code not in (200, 201):
-            print(f"Error creating game: {resp.status_code} {resp.text}")
+            log.error("Error creating game: %s %s", resp.status_code, resp.text)
             return None
 
-        created_game = resp.json()
-        print(f"Created game {created_game['game_ID']} with date {created_game['game_Date']} in DB.")
+        created_game = Game.from_json(resp.json())
+        # The schedule list no longer matches the DB
+        self._cache.invalidate(("games",))
+        log.info("Created game %s with date %s in DB.", created_game.game_ID, created_game.game_Date)
         return created_game
 
     def delete_game(self, game_id):
         """
         Calls DELETE /Games/{game_id} on the ASP.NET API to remove the game from the DB.
-        Returns True on success, False on error.
+        The API deletes the game's stats along with it, in one transaction, so this is
+        the only call needed. Returns True on success, False on error.
         """
-        url = f"{self.base_url}/Games/{game_id}"
-        response = requests.delete(url)
+        try:
+            response = self._delete(f"/Games/{game_id}")
+        except requests.RequestException as e:
+            log.error("Error deleting game %s: %s", game_id, e)
+            return False
         if response.status_code in (200, 204):
+            # Drop the schedule and everything cached for this game (record, stats, score)
+            self._cache.invalidate(("games",))
+            self._cache.bump(("game", game_id))
+            self._cache.bump(("stats",))
             return True
         else:
-            print(f"Error deleting game {game_id}: {response.status_code} {response.text}")
+            log.error("Error deleting game %s: %s %s", game_id, response.status_code, response.text)
             return False
 
+    def delete_stat(self, stat_id):
+        """
+        Calls DELETE /Stats/{stat_id}. Returns True on success, False on error.
+        """
+        try:
+            response = self._delete(f"/Stats/{stat_id}")
+        except requests.RequestException as e:
+            log.error("Error deleting stat %s: %s", stat_id, e)
+            return False
+        if response.status_code in (200, 204):
+            self._cache.bump(("stats",))
+            return True
+        log.warning("Could not delete stat %s (HTTP %s)", stat_id, response.status_code)
+        return False
+
     def _get_players_for_team(self, team_id):
         """
-        Example: calls GET /Players, filters by team_ID, or if you have
-        GET /Teams/{teamId}/Players, use that instead.
+        Same as get_players_for_team_sorted (kept for older callers).
         """
-        url = f"{self.base_url}/Players"
-        resp = requests.get(url)
-        if resp.status_code != 200:
-            print(f"Error fetching players: {resp.status_code} {resp.text}")
-            return []
-        all_players = resp.json()  # e.g. [ { "player_ID":1,"team_ID":5,...}, ... ]
-        return [p for p in all_players if p.get("team_ID") == team_id]
+        return self.get_players_for_team_sorted(team_id)
+
+    def create_player(self, team_id, first_name, last_name, position, jersey_number):
+        """
+        POST /Players, then drop the roster index so the new player shows up.
+        Returns the created Player, or None on error.
+        """
+        payload = {
+            "Team_ID": team_id,
+            "First_Name": first_name,
+            "Last_Name": last_name,
+            "Position_ID": position,
+            "Jersey_Number": jersey_number
+        }
+        try:
+            resp = self._post("/Players", json=payload)
+        except requests.RequestException as e:
+            log.error("Error creating player: %s", e)
+            return None
+        if resp.status_code not in (200, 201):
+            log.error("Error creating player: %s %s", resp.status_code, resp.text)
+            return None
+        self.invalidate_roster_index()
+        return Player.from_json(resp.json())
+
+    def delete_player(self, player_id):
+        """
+        DELETE /Players/{player_id}, then drop the roster index.
+        Returns True on success, False on error.
+        """
+        try:
+            resp = self._delete(f"/Players/{player_id}")
+        except requests.RequestException as e:
+            log.error("Error deleting player %s: %s", player_id, e)
+            return False
+        if resp.status_code not in (200, 204):
+            log.error("Error deleting player %s: %s %s", player_id, resp.status_code, resp.text)
+            return False
+        self.invalidate_roster_index()
+        return True
 
 
     def _get_team_stats_for_game(self, team_id, game_id):
@@ -470,29 +762,25 @@ class RealAPI:
             },
             ...
           ]
-        We'll store it in a cache so we don't re-fetch unnecessarily.
+        Served from the same cache as get_team_stats_for_game, so it is refreshed
+        whenever update_player_stats writes a stat for that team and game.
         """
+        return self.get_team_stats_for_game(team_id, game_id)
 
-        if not team_id or not game_id:
-            return []
-
-        cache_key = (team_id, game_id)
-        if cache_key in self._stats_cache:
-            return self._stats_cache[cache_key]
-
-        url = f"{self.base_url}/Stats/Team/{team_id}/Game/{game_id}"
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-        except requests.RequestException as e:
-            print(f"Error fetching stats from {url}: {e}")
-            self._stats_cache[cache_key] = []
-            return []
-
-        stat_list = resp.json()
-        # Cache it
-        self._stats_cache[cache_key] = stat_list
-        return stat_list
+    def _invalidate_stats(self, game_id, player_id):
+        """
+        Called after a stat write: drops the season-wide stat list, the (team, game)
+        stats of the player's team plus the game-wide stat list and score. If we
+        don't know the player's team, every stat entry for the game is dropped instead.
+        """
+        self._cache.bump(("stats",))
+        team_id = self._team_of_player(player_id)
+        if team_id is None:
+            self._cache.bump(("stats", game_id))
+            return
+        self._cache.bump(("stats", team_id, game_id))
+        self._cache.invalidate(("game_stats", game_id))
+        self._cache.invalidate(("game_score", game_id))
 
     def update_player_stats(self, game_id: int, player_id: int, action: str) -> None:
         """
@@ -504,77 +792,96 @@ class RealAPI:
           "ft_make", "ft_miss", "rebound", "steal", "TO",
           "assist", "block", "foul", etc.
 
-        If you need more specialized variants (e.g. "ft_make_2" for 2 free throws),
-        you'll see an example of how to parse that at the bottom.
-        """
-
-        # 1) Build a base payload for StatCreateDTO, with all fields 0
-        #    (matching the property names in your ASP.NET StatCreateDTO).
-        body = {
-            "player_ID": player_id,
-            "game_ID": game_id,
-            "three_Points_Made": 0,
-            "three_Points_Missed": 0,
-            "two_Points_Made": 0,
-            "two_Points_Missed": 0,
-            "free_Throw_Made": 0,
-            "free_Throw_Missed": 0,
-            "steals": 0,
-            "turnovers": 0,
-            "assists": 0,
-            "blocks": 0,
-            "fouls": 0,
-            "off_Rebounds": 0,
-            "def_Rebounds": 0
-        }
+        "ft_make_2" / "ft_make_3" record several made free throws in one post.
+        For more than one event from the same play, use update_player_stats_batch.
+        """
 
-        # 2) Figure out which field(s) to increment based on 'action'
-        #    We'll do a simple mapping.
-        #    For rebounds, you might or might not differentiate offensive vs defensive.
-        #    Below, "rebound" will just increment defensive rebounds by 1 for example.
-        if action == "2pt_make":
-            body["two_Points_Made"] = 1
-        elif action == "2pt_miss":
-            body["two_Points_Missed"] = 1
-        elif action == "3pt_make":
-            body["three_Points_Made"] = 1
-        elif action == "3pt_miss":
-            body["three_Points_Missed"] = 1
-        elif action == "ft_make":
-            body["free_Throw_Made"] = 1
-        elif action == "ft_miss":
-            body["free_Throw_Missed"] = 1
-        elif action == "rebound":
-            # Could choose off_Rebounds or def_Rebounds. Let's pick def_Rebounds for a basic example.
-            body["def_Rebounds"] = 1
-        elif action == "steal":
-            body["steals"] = 1
-        elif action == "TO":
-            body["turnovers"] = 1
-        elif action == "assist":
-            body["assists"] = 1
-        elif action == "block":
-            body["blocks"] = 1
-        elif action == "foul":
-            body["fouls"] = 1
-
-        # Example: If you want to handle "ft_make_2" or "ft_make_3" for multiple made free throws:
-        # elif action.startswith("ft_make_"):
-        #     # e.g. action == "ft_make_2"
-        #     count_str = action.split("_")[-1]
-        #     made_count = int(count_str)
-        #     body["free_Throw_Made"] = made_count
+        # 1) Build a base payload for StatCreateDTO, with all fields 0,
+        # 2) then increment the field(s) for this action (see ACTION_FIELDS).
+        #    "ft_make_2" / "ft_make_3" count several made free throws at once.
+        body = stat_body(game_id, player_id)
+        for field, count in stat_increments(action).items():
+            body[field] += count
 
         # 3) Send the POST request to /Stats. This will increment (or create) as needed.
-        url = f"{self.base_url}/Stats"
         try:
-            resp = requests.post(url, json=body)
+            resp = self._post("/Stats", json=body)
             resp.raise_for_status()
-
-
+            # Cached box scores for this game are now out of date
+            self._invalidate_stats(game_id, player_id)
 
             # On success, the server returns 201 (or 200) with the updated/created StatDTO
-            print(f"Stats updated successfully: {action} => (Game={game_id}, Player={player_id})")
+            log.debug("Stats updated: %s => (Game=%s, Player=%s)", action, game_id, player_id)
+        except requests.RequestException as ex:
+            log.error("Error posting stat update: %s", ex)
+            # You might pop up a messagebox or log an error here
+
+    def update_player_stats_batch(self, game_id: int, events) -> bool:
+        """
+        Records every stat event of one play in a single round trip.
+        events is a list of (player_id, action) pairs, e.g.
+          [(12, "2pt_make"), (12, "ft_make"), (7, "assist"), (31, "rebound")]
+
+        Events for the same player are merged into one StatCreateDTO first, so the
+        play above becomes 3 rows, not 4. The rows go to POST /Stats/Batch, which
+        saves them in one transaction. If the server doesn't have that endpoint
+        (404/405), each merged row is posted to /Stats instead.
+        Returns True if everything was recorded.
+        """
+        rows = merge_stat_events(game_id, events)
+        if not rows:
+            return True
+        try:
+            self.post_stat_rows(rows)
         except requests.RequestException as ex:
-            print(f"Error posting stat update: {ex}")
-            # You might pop up a messagebox or log an error here
\ No newline at end of file
+            log.error("Error posting stat batch: %s", ex)
+            return False
+        log.debug("Stats updated: %s event(s) in %s row(s) => (Game=%s)", len(events), len(rows), game_id)
+        return True
+
+    def post_stat_rows(self, rows, idempotency_key=None):
+        """
+        Sends already-merged StatCreateDTO rows (see merge_stat_events) to POST /Stats/Batch
+        in one request. With an idempotency_key the server applies the batch at most once,
+        so the same rows can be retried with the same key without double counting.
+        If the server doesn't have the batch endpoint (404/405), each row is posted to /Stats
+        instead. That path has no duplicate protection, so if it fails partway the exception
+        has .rows_sent - the rows that did go through - and a retry must leave those out.
+        Raises requests.RequestException (HTTPError for a 4xx/5xx answer) if it didn't go through.
+        """
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        resp = self._post("/Stats/Batch", json=rows, headers=headers)
+        if resp.status_code in (404, 405):
+            # Older API without the batch endpoint - one POST per merged row
+            for sent, body in enumerate(rows):
+                try:
+                    self._post("/Stats", json=body).raise_for_status()
+                except requests.RequestException as e:
+                    e.rows_sent = rows[:sent]
+                    raise
+                self._invalidate_stats(body["game_ID"], body["player_ID"])
+            return
+        resp.raise_for_status()
+        for body in rows:
+            self._invalidate_stats(body["game_ID"], body["player_ID"])
+
+    # ----------------
+    # LIVE EVENTS
+    # ----------------
+    def subscribe_game_events(self, game_id, on_event):
+        """
+        Follows a game's stat changes as the API pushes them (GET /Stats/Game/{id}/Events),
+        so a second scorer or a spectator screen sees every play without reloading the game.
+        on_event(event) is called on a background thread with
+          { "seq", "game_id", "deltas": [Stat], "stats": [Stat] }
+        (see live_events.stat_event). The cached stats of the game are dropped before
+        on_event runs. Returns the stream; call .close() to stop following.
+        """
+        def forward(event):
+            # Someone else's write - every stat entry of the game may be out of date
+            self._cache.bump(("stats",))
+            self._cache.bump(("stats", event["game_id"]))
+            on_event(event)
+
+        return GameEventStream(f"{self.base_url}/Stats/Game/{game_id}/Events", forward,
+                               timeout=self.timeout[0]).start()
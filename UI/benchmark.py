@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULTS_DIR = os.path.join(UI_DIR, "bench_results")
+DEFAULT_SCALES = (2, 30, 300)
+
+
+# ----------------
+# TIMING
+# ----------------
+def _pick_tk(mode):
+    """
+    'real' uses the real tkinter (needs a display - run under xvfb-run on a server),
+    'mock' the fake one in headless_tk, 'auto' the real one if it can open a window.
+    Has to run before anything imports tkinter.
+    """
+    if mode == "auto":
+        probe = subprocess.run([sys.executable, "-c", "import tkinter; tkinter.Tk().destroy()"],
+                               capture_output=True)
+        mode = "real" if probe.returncode == 0 else "mock"
+    if mode == "mock":
+        import headless_tk
+        headless_tk.install()
+    return mode
+
+
+def pump(app, done, timeout=30.0):
+    """Runs the Tk event loop until done() is true. Raises TimeoutError after timeout seconds."""
+    deadline = time.perf_counter() + timeout
+    while not done():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark step didn't finish")
+        app.update()
+        time.sleep(0.0005)
+
+
+class Bench:
+    """Runs named steps, times them, and collects the results for one league size."""
+
+    def __init__(self, repeat, server=None):
+        self.repeat = repeat
+        self.server = server
+        self.results = {}
+
+    def run(self, name, step, setup=None, repeat=None, **extra):
+        """
+        Times step() `repeat` times (after one untimed warm-up), calling setup() untimed
+        before each. Records p50/p95/p99 and, with a server, the requests per call.
+        """
+        from tracing import LatencyHistogram
+
+        repeat = repeat or self.repeat
+        latency = LatencyHistogram()
+        if setup:
+            setup()
+        step()
+        requests_before = self.server.requests if self.server else 0
+        for _ in range(repeat):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            step()
+            latency.observe(time.perf_counter() - start)
+        result = latency.summary()
+        if self.server:
+            result["requests_per_call"] = round((self.server.requests - requests_before) / repeat, 2)
+        result.update(extra)
+        self.results[name] = result
+        print(f"  {name:<36} p50 {result['p50_ms']:>9.2f} ms   p95 {result['p95_ms']:>9.2f} ms", flush=True)
+        return result
+
+
+# ----------------
+# SUITES
+# ----------------
+def bench_api(bench, api, game_ids, rng):
+    """RealAPI through the stand-in server, with an empty cache ("cold") and a filled one ("warm")."""
+    heavy = max(1, bench.repeat // 10)
+    bench.run("api.get_schedule cold", api.get_schedule, setup=api.clear_cache, repeat=heavy)
+    bench.run("api.get_schedule warm", api.get_schedule)
+    bench.run("api.get_all_teams cold", api.get_all_teams, setup=api.clear_cache)
+    bench.run("api.get_players_for_team_sorted cold", lambda: api.get_players_for_team_sorted(1),
+              setup=api.clear_cache)
+    bench.run("api.get_game_snapshot cold", lambda: api.get_game_snapshot(rng.choice(game_ids)),
+              setup=api.clear_cache)
+    game_id = game_ids[0]
+    bench.run("api.get_game_snapshot warm", lambda: api.get_game_snapshot(game_id))
+    bench.run("api.get_season_table cold", api.get_season_table, setup=api.clear_cache, repeat=heavy)
+    player = api.get_players_for_team_sorted(api.get_game(game_id).home_ID)[0]
+    row = {"player_ID": player.player_ID, "game_ID": game_id}
+    row.update((field, 0) for field in _stat_fields())
+    row["two_Points_Made"] = 1
+    bench.run("api.post_stat_rows", lambda: api.post_stat_rows([row]))
+
+
+def bench_menu(bench, app, api, rng):
+    """MainMenu's data-building paths, on the (real or fake) Tk thread."""
+    from jersey_cache import JerseyRenderer
+
+    import gob_ui
+
+    def build_schedule():
+        before = app.schedule_model
+        app.build_schedule_contents()
+        pump(app, lambda: app.schedule_model is not before)
+
+    bench.run("menu.build_schedule_contents", build_schedule, setup=api.clear_cache,
+              repeat=max(1, bench.repeat // 10), games=len(app.schedule_model))
+
+    games = len(app.schedule_view)
+
+    def select_game():
+        index = rng.randrange(games)
+        game_id = app.schedule_view.item(index).game_ID
+        app._details_snapshot = None
+        app.select_game(index)
+        pump(app, lambda: app._details_snapshot is not None and app._details_snapshot["game_id"] == game_id)
+
+    bench.run("menu.select_game", select_game, setup=api.clear_cache)
+
+    # Two different games, shown in turn, so every show() really changes the labels
+    snapshots = [app._load_game_details(app.schedule_view.item(i).game_ID) for i in (0, games // 2)]
+    turn = iter(range(1 << 30))
+    configures_before = app.details_view.configures
+    bench.run("menu.update_game_details_ui", lambda: app.update_game_details_ui(snapshots[next(turn) % 2]))
+    jersey_path = os.path.join(gob_ui.UI_ELEMENTS, "Jersey.png")
+
+    def fresh_renderer():
+        app.jerseys = JerseyRenderer(app, jersey_path)
+
+    def roster_jerseys():
+        # One lineup's worth of icons
+        for number in range(15):
+            app.generate_jersey_image(number)
+
+    bench.run("menu.generate_jersey_image cold", roster_jerseys, setup=fresh_renderer)
+    bench.run("menu.generate_jersey_image warm", roster_jerseys)
+    bench.results["menu.update_game_details_ui"]["label_configures"] = app.details_view.configures - configures_before
+
+
+def _stat_fields():
+    from records import STAT_FIELDS
+    return STAT_FIELDS
+
+
+def run_scale(teams, args):
+    import gob_ui
+    from league_generator import LeagueGenerator
+    from local_backend import LocalAPI
+    from Real_API import RealAPI
+    from stand_in_server import StandInServer
+
+    print(f"{teams} teams x {args.games} games", flush=True)
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="gob-bench-") as tmp:
+        start = time.perf_counter()
+        db_path = os.path.join(tmp, "league.json")
+        sizes = LeagueGenerator(teams, teams * args.games // 2, seed=args.seed).write(db_path)
+        local = LocalAPI(db_path)
+        setup_s = round(time.perf_counter() - start, 2)
+
+        with StandInServer(local) as server:
+            api = RealAPI(base_url=server.url)
+            bench = Bench(args.repeat, server)
+            bench_api(bench, api, list(local.games), rng)
+
+            api.clear_cache()
+            app = gob_ui.MainMenu(backend=api, journal_path=os.path.join(tmp, "stat_journal.jsonl"))
+            try:
+                pump(app, lambda: len(app.schedule_view) > 0, timeout=120)
+                bench_menu(bench, app, api, rng)
+            finally:
+                app._on_close()
+            api.close()
+    return {"league": dict(sizes, teams=teams, games_per_team=args.games, setup_s=setup_s),
+            "results": bench.results}
+
+
+# ----------------
+# RESULTS
+# ----------------
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=UI_DIR, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(old, new, threshold, min_ms=1.0):
+    """
+    Prints the p50 change of every step both result files have. Returns the steps
+    that got more than threshold (e.g. 0.2 = 20%) slower - and at least min_ms slower,
+    so jitter on sub-millisecond steps doesn't count.
+    """
+    regressions = []
+    for scale, entry in new["scales"].items():
+        before = old.get("scales", {}).get(scale)
+        if before is None:
+            continue
+        print(f"{scale} teams (vs {old.get('commit')})")
+        for name, result in entry["results"].items():
+            base = before["results"].get(name)
+            if base is None or not base["p50_ms"]:
+                continue
+            change = result["p50_ms"] / base["p50_ms"] - 1
+            slower = change > threshold and result["p50_ms"] - base["p50_ms"] >= min_ms
+            flag = "  <-- slower" if slower else ""
+            print(f"  {name:<36} {base['p50_ms']:>9.2f} -> {result['p50_ms']:>9.2f} ms ({change:+.0%}){flag}")
+            if flag:
+                regressions.append((scale, name, change))
+    return regressions
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Times RealAPI and MainMenu's data paths against a local stand-in for the API")
+    arg_parser.add_argument("--teams", default=",".join(map(str, DEFAULT_SCALES)),
+                            help="league sizes to run, comma separated (default 2,30,300)")
+    arg_parser.add_argument("--games", type=int, default=82, help="games per team (default 82)")
+    arg_parser.add_argument("--repeat", type=int, default=20, help="timed runs per step (default 20)")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--tk", choices=["auto", "real", "mock"], default="auto",
+                            help="real Tk needs a display (e.g. xvfb-run); mock runs anywhere (default auto)")
+    arg_parser.add_argument("--out", default=None,
+                            help="results file (default bench_results/<commit>.json)")
+    arg_parser.add_argument("--compare", default=None, metavar="OLD.json",
+                            help="compare with an earlier results file; exits 1 if a step got slower")
+    arg_parser.add_argument("--threshold", type=float, default=0.2,
+                            help="how much slower (fraction of p50) counts as a regression (default 0.2)")
+    args = arg_parser.parse_args(argv)
+
+    # gob_ui finds its images relative to the working directory
+    os.chdir(UI_DIR)
+    tk_mode = _pick_tk(args.tk)
+    import gob_log
+    gob_log.configure(level="WARNING")
+
+    commit = _git_commit()
+    report = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tk": tk_mode,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "scales": {},
+    }
+    for teams in (int(t) for t in args.teams.split(",") if t.strip()):
+        report["scales"][str(teams)] = run_scale(teams, args)
+
+    out = args.out or os.path.join(DEFAULT_RESULTS_DIR, f"{commit or 'results'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {out}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+from stats_engine import StatTable
+
+
+class BoxScore:
+    """
+    Score, team totals and shooting splits of one game, worked out locally from the
+    game's stat rows - the same numbers GET /Stats/GameScore/{id} would give, without
+    the extra round trip.
+
+    The rows go into a stats_engine.StatTable, which adds them up per player and per
+    team in one go. team_of maps player_ID -> team_ID (e.g. the roster index); like
+    the API, rows of players who aren't on either team don't count toward a team.
+
+      score()            -> { "gameId", "homeTeamScore", "awayTeamScore" } (GameScore's shape)
+      team_totals(team)  -> every counter summed, plus points, rebounds and the splits
+      splits(team)       -> { "fg": (made, attempts, pct), "three": (...), "ft": (...) }
+      player(player_id)  -> the same kind of dict for one player (all zeros if no row)
+      reconcile(server)  -> {} if a GameScore answer agrees with us, else what differs
+    """
+
+    def __init__(self, game, stats, team_of):
+        self.game_id = game.game_ID
+        self.home_id = game.home_ID
+        self.away_id = game.away_ID
+        self.table = StatTable.from_rows(stats, team_of)
+        self._players = self.table.by_player()
+        self._teams = self.table.by_team()
+
+    def score(self):
+        return {
+            "gameId": self.game_id,
+            "homeTeamScore": self._teams.get(self.home_id)["points"],
+            "awayTeamScore": self._teams.get(self.away_id)["points"],
+        }
+
+    def team_totals(self, team_id):
+        return self._teams.get(team_id)
+
+    def splits(self, team_id):
+        line = self._teams.get(team_id)
+        return {
+            "fg": (line["fg_made"], line["fg_attempts"], line["fg_pct"]),
+            "three": (line["three_made"], line["three_attempts"], line["three_pct"]),
+            "ft": (line["ft_made"], line["ft_attempts"], line["ft_pct"]),
+        }
+
+    def player(self, player_id):
+        return self._players.get(player_id)
+
+    def reconcile(self, server_score):
+        """
+        Compares our score with a GameScore response. Returns the differing fields as
+        {field: (ours, server's)}; empty when they agree.
+        """
+        ours = self.score()
+        diffs = {}
+        for field in ("homeTeamScore", "awayTeamScore"):
+            theirs = server_score.get(field, 0)
+            if ours[field] != theirs:
+                diffs[field] = (ours[field], theirs)
+        return diffs
@@ -0,0 +1,160 @@
+from tkinter import ttk
+
+HEADER_LINE = f"{'Pos':<3}|{'#':<2}|{'Last Name':<15}|{'Pts':>3}|{'Ast':>3}|{'Reb':>3}|{'FG%':>3}"
+PLACEHOLDER_TEXT = "Click a game to view details"
+
+
+def box_score_row(player, box):
+    """One roster player's numbers for the panel, from the game's BoxScore."""
+    line = box.player(player.player_ID)
+    return {
+        "player_ID": player.player_ID,
+        "position_ID": player.position_ID or "??",
+        "jersey_Number": player.jersey_Number,
+        "last_Name": player.last_Name,
+        "Points": line["points"],
+        "Assists": line["assists"],
+        "Rebounds": line["rebounds"],
+        "FG%": line["fg_pct"]
+    }
+
+
+def box_score_line(row):
+    """The text of one player's line (a box_score_row)."""
+    return (
+        f"{row.get('position_ID', '??'):<3}|"
+        f"{row.get('jersey_Number', 0):<2}|"
+        f"{row.get('last_Name', ''):<15}|"
+        f"{row.get('Points', 0):>3}|"
+        f"{row.get('Assists', 0):>3}|"
+        f"{row.get('Rebounds', 0):>3}|"
+        f"{row.get('FG%', 0):>3}%"
+    )
+
+
+def scoreboard_text(snapshot):
+    game = snapshot["game"]
+    score = snapshot.get("score", {})
+    return (f"{game.home or 'Home'} ({score.get('homeTeamScore', 0)}) vs "
+            f"{game.away or 'Away'} ({score.get('awayTeamScore', 0)})")
+
+
+class _TeamSection:
+    """One team's column: name, "Players:", the header, then one label per roster player."""
+
+    def __init__(self, parent, column):
+        self.frame = ttk.Frame(parent)
+        self.frame.grid(row=0, column=column, padx=15, sticky="nw")
+        self.title = ttk.Label(self.frame, font=("Consolas", 12, "bold"))
+        self.title.pack()
+        ttk.Label(self.frame, text="Players:", font=("Consolas", 10, "bold underline")).pack(pady=(10, 0))
+        ttk.Label(self.frame, text=HEADER_LINE, font=("Consolas", 12, "bold")).pack(anchor="w", padx=5)
+        self.labels = []  # packed, in roster order
+        self._free = []  # unpacked, kept for the next (bigger) roster
+
+    def label(self, index):
+        """The label for the index-th player line, packing another one if needed."""
+        while len(self.labels) <= index:
+            label = self._free.pop() if self._free else ttk.Label(self.frame, font=("Consolas", 12))
+            label.pack(anchor="w", padx=5)
+            self.labels.append(label)
+        return self.labels[index]
+
+    def trim(self, count):
+        """Hides the player lines past the first count."""
+        while len(self.labels) > count:
+            label = self.labels.pop()
+            label.pack_forget()
+            self._free.append(label)
+
+
+class GameDetailsView:
+    """
+    The game details panel (score and both teams' box score lines), kept alive
+    between updates instead of being torn down and rebuilt.
+
+    The widgets are created the first time a game is shown and reused after that;
+    player lines are kept by player_ID together with the text they show. Showing a
+    game - a different one or the same one with new numbers - only calls
+    configure(text=...) on the labels whose text actually changes, so live scoring
+    updates don't flicker or churn widgets.
+
+      show(snapshot)              - shows a game snapshot (see MainMenu._load_game_details)
+      update(snapshot, players)   - same game, only these player_IDs (and the score) changed
+      clear()                     - back to the "Click a game" placeholder
+    """
+
+    def __init__(self, container):
+        self.container = container
+        self.placeholder = ttk.Label(container, text=PLACEHOLDER_TEXT, font=("Consolas", 14, "italic"))
+        self.placeholder.pack(anchor="center", expand=True)
+        self.frame = None
+        self.game_id = None
+        self._score_label = None
+        self._sections = ()
+        self._texts = {}  # Label -> text it shows
+        self._rows = {}  # player_ID -> (Label, roster player)
+        self.configures = 0
+
+    def show(self, snapshot):
+        if self.frame is None:
+            self._build()
+        if not self.frame.winfo_ismapped():
+            self.placeholder.pack_forget()
+            self.frame.pack(expand=True, fill="both")
+
+        game = snapshot["game"]
+        box = snapshot["box"]
+        self.game_id = snapshot["game_id"]
+        self._set(self._score_label, scoreboard_text(snapshot))
+        self._rows = {}
+        rosters = (snapshot.get("home_roster", []), snapshot.get("away_roster", []))
+        titles = (f"{game.home or 'Home'} (Home)", f"{game.away or 'Away'} (Away)")
+        for section, roster, title in zip(self._sections, rosters, titles):
+            self._set(section.title, title)
+            for i, player in enumerate(roster):
+                label = section.label(i)
+                self._set(label, box_score_line(box_score_row(player, box)))
+                self._rows[player.player_ID] = (label, player)
+            section.trim(len(roster))
+
+    def update(self, snapshot, player_ids=None):
+        """
+        Refreshes the game that is showing. With player_ids, only those players' lines
+        (and the score) are looked at; otherwise every line is. A different game is shown
+        from scratch.
+        """
+        if snapshot["game_id"] != self.game_id or player_ids is None:
+            self.show(snapshot)
+            return
+        box = snapshot["box"]
+        self._set(self._score_label, scoreboard_text(snapshot))
+        for player_id in player_ids:
+            entry = self._rows.get(player_id)
+            if entry is not None:
+                label, player = entry
+                self._set(label, box_score_line(box_score_row(player, box)))
+
+    def clear(self):
+        self.game_id = None
+        self._rows = {}
+        if self.frame is not None:
+            self.frame.pack_forget()
+        self.placeholder.pack(anchor="center", expand=True)
+
+    # ----------------
+    # INTERNALS
+    # ----------------
+    def _build(self):
+        self.frame = ttk.Frame(self.container)
+        self._score_label = ttk.Label(self.frame, font=("Consolas", 16, "bold"))
+        self._score_label.pack(anchor="center", pady=10)
+        teams_frame = ttk.Frame(self.frame)
+        teams_frame.pack(expand=True, fill="both", padx=10, pady=10)
+        self._sections = (_TeamSection(teams_frame, 0), _TeamSection(teams_frame, 1))
+
+    def _set(self, label, text):
+        if self._texts.get(label) != text:
+            label.configure(text=text)
+            self._texts[label] = text
+            self.configures += 1
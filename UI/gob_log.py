@@ -0,0 +1,123 @@
+import collections
+import logging
+import os
+import sys
+
+ROOT = "gob"
+FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# Where dump_ring() writes by default - next to this file, like the stat journal.
+DEFAULT_DUMP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gob_log_dump.txt")
+
+_console = None
+_ring = None
+_module_levels = set()  # modules configure() gave their own level
+
+
+def get_logger(module):
+    """
+    The logger for one UI module, e.g. get_logger("Real_API") -> "gob.Real_API".
+    Log with %-style arguments (log.debug("game %s: %s", game_id, stats)), not
+    f-strings: the message is only built if the record is actually kept.
+    """
+    return logging.getLogger(f"{ROOT}.{module}")
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the last capacity log lines in memory, for dumping after something went
+    wrong (see dump_ring). Nothing is written anywhere until then.
+
+    The message is rendered when the record comes in, so a dump shows the values
+    as they were at the time (and doesn't keep whole responses alive).
+    """
+
+    def __init__(self, capacity=2000, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        self.records.append(record)
+
+    def lines(self):
+        return [self.format(record) for record in list(self.records)]
+
+    def dump(self, stream):
+        for line in self.lines():
+            stream.write(line + "\n")
+
+
+def _parse_modules(spec):
+    # "Real_API=DEBUG,gob_ui=WARNING" -> {"Real_API": "DEBUG", "gob_ui": "WARNING"}
+    levels = {}
+    for part in (spec or "").split(","):
+        name, _, level = part.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure(level=None, modules=None, ring=None, stream=None):
+    """
+    Sets up logging for the UI. Every argument falls back to an environment variable:
+
+      level    - level of everything not listed in modules (GOB_LOG_LEVEL, default INFO)
+      modules  - per-module levels, {"Real_API": "DEBUG"} or "Real_API=DEBUG,gob_ui=WARNING"
+                 (GOB_LOG_MODULES)
+      ring     - keep the last N records in memory for dump_ring() (GOB_LOG_RING, default 0 = off).
+                 It gets every record the loggers let through, same as the console.
+      stream   - where console lines go (default stderr)
+
+    Can be called again to change the setup.
+    """
+    global _console, _ring, _module_levels
+    level = (level or os.environ.get("GOB_LOG_LEVEL") or "INFO").upper()
+    if modules is None:
+        modules = os.environ.get("GOB_LOG_MODULES")
+    if isinstance(modules, str):
+        modules = _parse_modules(modules)
+    if ring is None:
+        ring = int(os.environ.get("GOB_LOG_RING") or 0)
+
+    root = logging.getLogger(ROOT)
+    root.propagate = False
+    for handler in (_console, _ring):
+        if handler is not None:
+            root.removeHandler(handler)
+
+    _console = logging.StreamHandler(stream or sys.stderr)
+    _console.setFormatter(logging.Formatter(FORMAT))
+    _console.setLevel(level)
+    root.addHandler(_console)
+    _ring = None
+    if ring:
+        _ring = RingBufferHandler(ring)
+        _ring.setFormatter(logging.Formatter(FORMAT))
+        root.addHandler(_ring)
+
+    # Logger levels decide what gets created at all: modules not listed inherit `level`
+    root.setLevel(level)
+    for name in _module_levels:
+        get_logger(name).setLevel(logging.NOTSET)
+    _module_levels = set(modules or ())
+    for name, value in (modules or {}).items():
+        logger = get_logger(name)
+        logger.setLevel(value)
+        _console.setLevel(min(_console.level, logger.level))
+    return _ring
+
+
+def ring_buffer():
+    """The RingBufferHandler set up by configure(), or None."""
+    return _ring
+
+
+def dump_ring(path=DEFAULT_DUMP_PATH):
+    """Writes the ring buffer to path. Returns the path, or None if there's no ring buffer."""
+    if _ring is None:
+        return None
+    with open(path, "w", encoding="utf-8") as f:
+        _ring.dump(f)
+    return path
@@ -5,18 +5,36 @@ import os
 from tkinter import ttk, messagebox
 
 import dateutil
-import requests
-from PIL import Image, ImageTk, ImageFont, ImageDraw
+from PIL import Image, ImageTk
 from datetime import date, timedelta, datetime, timezone
 from dateutil import parser
+import gob_log
+import tracing
 from Real_API import RealAPI
+from box_score import BoxScore
+from game_details_view import GameDetailsView
+from jersey_cache import JerseyRenderer
+from net_worker import NetworkWorker
+from on_court import OnCourtState
+from schedule_model import ScheduleModel
+from schedule_view import VirtualScheduleList
+from stat_journal import DEFAULT_JOURNAL_PATH, StatJournal
 from zoneinfo import ZoneInfo
 
 UI_ELEMENTS = "GOB UI ELEMENTS"
 
+log = gob_log.get_logger("gob_ui")
+
 class MainMenu(tk.Tk):
-    def __init__(self):
+    def __init__(self, backend=None, trace_dump=None, journal_path=DEFAULT_JOURNAL_PATH):
+        """
+        backend: the data source to use (anything with RealAPI's methods, e.g. a
+        LocalAPI). If it's None we start the ASP.NET API and talk to it with RealAPI.
+        trace_dump: file to write the request/UI trace to on exit (see tracing.Tracer.dump).
+        journal_path: where the stat journal lives (benchmarks point it at a temp file).
+        """
         super().__init__()
+        self.trace_dump = trace_dump
         self.title("Basketball Manager")
         self.default_width = 1100
         self.default_height = 800
@@ -34,25 +52,23 @@ class MainMenu(tk.Tk):
         style.map('Selected.TButton', background=[('active', '#87CEFA')])
 
         # ===================== Attempt to start ASP.NET Core API =====================
-        try:
-            # Run "dotnet run" from the ../api directory relative to the current UI folder
-            # Adjust the path as needed if your folder structure is different
-            self.api_process = subprocess.Popen(
-                ["dotnet", "run"],
-                cwd=os.path.join("..", "api")  # up one folder, then into "api"
-            )
-        except Exception as e:
-            # If the process fails to launch, show an error popup and optionally exit
-            messagebox.showerror("API Failure", f"Failed to start the ASP.NET Core project.\n\nError: {e}")
-            # You could call self.destroy() or sys.exit(1) to stop the UI if the API is mandatory
+        if backend is not None:
+            self.test_data = backend
+            log.info("Using %s backend (ASP.NET Core API not started).", type(backend).__name__)
         else:
-            # If we get here, the .NET process started without immediate exceptions
-            # You can now switch from FakeAPI to your real API connector
-            self.test_data = RealAPI()
-            print("ASP.NET Core API launched successfully (subprocess started).")
-            # or:
-            # from real_api import RealAPI
-            # self.test_data = RealAPI()
+            self._start_api()
+
+        # ===================== Background Network Worker =====================
+        # Every API call runs off the Tk thread; results come back via after().
+        self.status_var = tk.StringVar(value="")
+        self.status_label = ttk.Label(self, textvariable=self.status_var, font=("Consolas", 9), anchor="w")
+        self.status_label.pack(side="bottom", fill="x", padx=5)
+        self.net = NetworkWorker(self, on_busy_change=self._on_network_busy)
+        # Stats are written to a local journal first and delivered from there,
+        # so nothing entered while the API is down gets lost.
+        self.stat_journal = StatJournal(self.test_data, path=journal_path)
+        self.stat_journal.start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # ===================== Tabs =====================
         self.set_window_icon()
@@ -72,11 +88,10 @@ class MainMenu(tk.Tk):
         self.schedule_list_frame.pack(side="left", fill="both")
         self.schedule_list_frame.pack_propagate(False)  # Prevent the frame from resizing to its content
         self.schedule_canvas = tk.Canvas(self.schedule_list_frame, bg="white")
-        self.schedule_scrollbar = ttk.Scrollbar(self.schedule_list_frame, orient="vertical",command=self.schedule_canvas.yview)
-        self.scrollable_schedule_frame = tk.Frame(self.schedule_canvas, bg="white")
-        self.scrollable_schedule_frame.bind("<Configure>",lambda e: self.schedule_canvas.configure(scrollregion=self.schedule_canvas.bbox("all")))
-        self.scrollable_window = self.schedule_canvas.create_window((0, 0), window=self.scrollable_schedule_frame, anchor="nw")
-        self.schedule_canvas.configure(yscrollcommand=self.schedule_scrollbar.set)
+        self.schedule_scrollbar = ttk.Scrollbar(self.schedule_list_frame, orient="vertical")
+        # Only the rows on screen exist as widgets; they are recycled while scrolling
+        self.schedule_view = VirtualScheduleList(self.schedule_canvas, self.schedule_scrollbar,
+                                                 describe=self._describe_schedule_row, on_select=self.select_game)
         self.schedule_canvas.pack(side="left", fill="both", expand=True)
         self.schedule_scrollbar.pack(side="right", fill="y")
 
@@ -93,8 +108,8 @@ class MainMenu(tk.Tk):
         # ----- TOP: Game Preview Panel -----
         self.details_container = ttk.Frame(self.details_top)
         self.details_container.pack(expand=True)
-        self.details_placeholder = ttk.Label(self.details_container, text="Click a game to view details", font=("Consolas", 14, "italic"))
-        self.details_placeholder.pack(anchor="center", expand=True)
+        # Built once; showing / refreshing a game only changes label texts
+        self.details_view = GameDetailsView(self.details_container)
 
         # ----- BOTTOM: Game Creation Form (button placed inline) -----
         self.create_game_form = ttk.Frame(self.details_bottom)
@@ -103,12 +118,10 @@ class MainMenu(tk.Tk):
         ttk.Label(self.create_game_form, text="Home Team:").grid(row=1, column=0, sticky="e", padx=5, pady=2)
         self.home_team_var = tk.StringVar()
         self.home_dropdown = ttk.Combobox(self.create_game_form, textvariable=self.home_team_var, state="readonly")
-        self.home_dropdown['values'] = self.test_data.get_all_teams()
         self.home_dropdown.grid(row=1, column=1, padx=5, pady=2)
         ttk.Label(self.create_game_form, text="Away Team:").grid(row=1, column=2, sticky="e", padx=5, pady=2)
         self.away_team_var = tk.StringVar()
         self.away_dropdown = ttk.Combobox(self.create_game_form, textvariable=self.away_team_var, state="readonly")
-        self.away_dropdown['values'] = self.test_data.get_all_teams()
         self.away_dropdown.grid(row=1, column=3, padx=5, pady=2)
         ttk.Label(self.create_game_form, text="Date (YYYY-MM-DD):").grid(row=2, column=0, sticky="e", padx=5, pady=2)
         self.date_entry = ttk.Entry(self.create_game_form)
@@ -133,15 +146,25 @@ class MainMenu(tk.Tk):
         self.game_ui_container.pack(fill="both", expand=True, padx=10, pady=10)
 
         # ===================== Teams Tab =====================
-        teams_tab = ttk.Frame(self.notebook)
-        self.notebook.add(teams_tab, text='Teams')
-        ttk.Label(teams_tab, text="Teams:", font=("Consolas", 14, "bold")).pack(pady=10)
-        for team in self.test_data.get_all_teams():
-            ttk.Label(teams_tab, text=team, font=("Consolas", 12)).pack(anchor="w", padx=10, pady=2)
+        self.teams_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.teams_tab, text='Teams')
+        ttk.Label(self.teams_tab, text="Teams:", font=("Consolas", 14, "bold")).pack(pady=10)
+        # Team names (tab + dropdowns) are filled in by populate_teams once they load.
+        self.net.submit(self.test_data.get_all_teams, on_success=self.populate_teams, key="teams")
 
         # ===================== Final Setup =====================
         self.selected_game_index = None
-        self.game_buttons = []
+        self.selected_game_id = None
+        self._reconciled_games = set()  # games whose local score matched GameScore
+        # Live stat pushes for the game in the details panel (see _follow_game)
+        self._game_events = None
+        self._game_events_id = None
+        self._details_snapshot = None
+        self.on_court = None  # OnCourtState of the game in the Game tab (see update_game_ui)
+        self.schedule_model = ScheduleModel()
+        self.jerseys = JerseyRenderer(self, os.path.join(UI_ELEMENTS, "Jersey.png"))
+        # Pre-render jerseys 0-99 once the window is up, so lineups never render any
+        self.after_idle(self.jerseys.build_atlas)
         self.build_schedule_contents()
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         self._enable_scroll_wheel()
@@ -149,56 +172,45 @@ class MainMenu(tk.Tk):
     # ======================================================
     # BUILD SCHEDULE CONTENTS
     # ======================================================
+    def populate_teams(self, team_names):
+        """Fills the Teams tab and both team dropdowns (runs on the Tk thread)."""
+        self.home_dropdown['values'] = team_names
+        self.away_dropdown['values'] = team_names
+        for team in team_names:
+            ttk.Label(self.teams_tab, text=team, font=("Consolas", 12)).pack(anchor="w", padx=10, pady=2)
+
     def build_schedule_contents(self):
-        from dateutil import parser
-        from datetime import timedelta
+        """
+        Fetches the whole schedule in the background, then shows it on the Tk thread.
+        A newer call supersedes one that is still loading. Only needed for the first
+        load (or a full reload) - creating / deleting a game updates the model in place.
+        """
+        self.net.submit(self._fetch_schedule_model, on_success=self._render_schedule, key="schedule")
 
-        self.clear_schedule_ui()
+    def _fetch_schedule_model(self):
+        # Runs on a worker thread - no Tk calls in here.
+        # Sorted by game date minus 4 hours; each date is parsed once
+        return ScheduleModel(self.test_data.get_schedule())
 
-        # Sort games by game date – parse the string and subtract 4 hours
-        games = sorted(
-            self.test_data.get_schedule(),
-            key=lambda g: parser.isoparse(g["game_Date"]) - timedelta(hours=4)
-        )
+    def _render_schedule(self, model):
+        self.schedule_model = model
+        self.schedule_view.set_items(model)
 
-        for idx, game in enumerate(games):
-            # Parse the stored date and forcibly subtract 4 hours
-            raw_dt = parser.isoparse(game["game_Date"])
-            adjusted_dt = raw_dt - timedelta(hours=4)
-
-            # Use adjusted_dt to check if it's past
-            is_past = (datetime.now() - adjusted_dt).total_seconds() > 7200
-            style_to_use = 'Past.TButton' if is_past else 'Default.TButton'
-
-            # Format date/time strings
-            day_str = adjusted_dt.strftime("%Y-%m-%d")
-            time_str = adjusted_dt.strftime("%I:%M %p").lstrip("0")
-
-            # Create the frame for this game in the schedule list
-            frame = ttk.Frame(self.scrollable_schedule_frame, width=250, height=60)
-            frame.pack_propagate(False)
-            frame.pack(fill="x", pady=5, padx=8)
-
-            # Button shows "Home vs Away"
-            btn_text = f"{game.get('home', 'Unknown')} vs {game.get('away', 'Unknown')}"
-            btn = ttk.Button(
-                frame,
-                text=btn_text,
-                style=style_to_use,
-                width=35,
-                command=lambda idx=idx: self.select_game(idx)
-            )
-            btn.pack(anchor="w", ipady=6)
-
-            # Show the date/time (4 hrs subtracted)
-            ttk.Label(
-                frame,
-                text=f"{day_str} {time_str}",
-                font=("Consolas", 9),
-                width=35
-            ).pack(anchor="w", padx=10)
-            game_id = game["game_ID"]
-            self.game_buttons.append((btn, is_past, game_id))
+    def _describe_schedule_row(self, game):
+        """(button text, date label, is_past) for one schedule row - only called for rows on screen."""
+        # Date already parsed (4 hours subtracted) by the schedule model
+        adjusted_dt = self.schedule_model.adjusted_date(game.game_ID)
+
+        # Use adjusted_dt to check if it's past
+        is_past = (datetime.now() - adjusted_dt).total_seconds() > 7200
+
+        # Format date/time strings
+        day_str = adjusted_dt.strftime("%Y-%m-%d")
+        time_str = adjusted_dt.strftime("%I:%M %p").lstrip("0")
+
+        # Button shows "Home vs Away", the label the date/time (4 hrs subtracted)
+        btn_text = f"{game.home or 'Unknown'} vs {game.away or 'Unknown'}"
+        return btn_text, f"{day_str} {time_str}", is_past
 
     def display_column_headers(self, parent, is_starter=False):
         # Columns: Pos (3 left), # (2 left), Name (12 left), Pts (3 right), Ast (3 right), Reb (3 right), FG% (3 right)
@@ -207,117 +219,146 @@ class MainMenu(tk.Tk):
         ttk.Label(parent, text=headers, font=font_used).pack(anchor="w", padx=5)
 
     def select_game(self, index):
-        print(f"\n========== SELECT GAME [{index}] ==========")
-
-        btn, is_past, game_id = self.game_buttons[index]
-        print(f"[INFO] Game ID selected: {game_id}")
-
-        # --- 1. Get full game details ---
-        all_games = self.test_data.get_schedule()
-        game_data = next((g for g in all_games if g.get("game_ID") == game_id), None)
-        if game_data is None:
-            try:
-                url = f"{self.test_data.base_url}/Games/{game_id}"
-                resp = requests.get(url, timeout=10)
-                resp.raise_for_status()
-                game_data = resp.json()
-                print("[DEBUG] Game data (fetched directly):", game_data)
-            except Exception as e:
-                print(f"[ERROR] Error fetching game details for gameID {game_id}: {e}")
-                return
-        else:
-            print("[DEBUG] Game data (from schedule):", game_data)
+        game = self.schedule_view.item(index)
+        game_id = game.game_ID
+        log.debug("Select game [%s]: game ID %s", index, game_id)
+        self.selected_game_id = game_id
 
-        # --- 2. Retrieve the live scoreboard ---
-        try:
-            score_info = self.test_data.get_game_score(game_id)
-            print("[DEBUG] Scoreboard data:", score_info)
-        except Exception as e:
-            print(f"[ERROR] Error fetching scoreboard for gameID {game_id}: {e}")
-            score_info = {"homeTeamScore": 0, "awayTeamScore": 0}
+        # Load in the background; clicking another game before this finishes
+        # cancels/drops this load (same key). The game record itself comes from the
+        # schedule we already have, so only the score and stats go over the network.
+        # The span runs until the details are on screen.
+        # GameScore is only asked for until a game's local score has matched it once.
+        reconcile = game_id not in self._reconciled_games
+        with tracing.TRACER.span("select_game", game_id=game_id):
+            self.net.submit(self._load_game_details, game_id, game, reconcile,
+                            on_success=self._show_game_details, key="game_details")
+
+    def _game_record(self, game_id=None):
+        """
+        The schedule's record for a game (default: the selected one), or None.
+        A dict lookup in the schedule model - no API call. The model is updated in
+        place when games are created or deleted, so this is never stale.
+        """
+        if game_id is None:
+            game_id = self.selected_game_id
+        return self.schedule_model.get(game_id)
+
+    def _show_game_details(self, snapshot):
+        if snapshot is None:
+            return
+        if snapshot["game_id"] != self.selected_game_id:
+            # The selection moved on (e.g. the game was deleted) while this was loading
+            return
+        log.debug("Game snapshot ready in %s ms. Passing to UI.", snapshot["elapsed_ms"])
+        if snapshot["reconciled"]:
+            self._reconciled_games.add(snapshot["game_id"])
+        self.update_game_details_ui(snapshot)
+        self._follow_game(snapshot["game_id"])
+
+    def _follow_game(self, game_id):
+        """
+        Starts following a game's live stat pushes (and stops following the previous
+        one), so the details panel stays current while other scorers enter stats.
+        None just stops.
+        """
+        if game_id == self._game_events_id:
+            return
+        if self._game_events is not None:
+            self._game_events.close()
+        self._game_events = None
+        self._game_events_id = game_id
+        if game_id is None:
+            return
+        # The stream calls back on its own thread; the worker hands events to the Tk thread
+        self._game_events = self.test_data.subscribe_game_events(
+            game_id, lambda event: self.net.call_soon(self._on_game_event, event))
+
+    def _on_game_event(self, event):
+        """A stat change pushed for a game: fold the new totals into the shown snapshot and patch the panel."""
+        snapshot = self._details_snapshot
+        if snapshot is None or event["game_id"] != snapshot["game_id"]:
+            return
+        rows = {s.player_ID: s for s in snapshot["stats"]}
+        for stat in event["stats"]:
+            rows[stat.player_ID] = stat
+        snapshot["stats"] = list(rows.values())
+        box = BoxScore(snapshot["game"], snapshot["stats"], snapshot["team_of"])
+        snapshot["box"] = box
+        snapshot["score"] = box.score()
+        self.details_view.update(snapshot, [stat.player_ID for stat in event["stats"]])
+
+    def _load_game_details(self, game_id, game_data=None, reconcile=True):
+        """
+        Fetches everything the details panel needs for one game (see
+        RealAPI.get_game_snapshot). game_data is the game's schedule record, if the
+        caller has it. Runs on a worker thread - no Tk calls or MainMenu state in here;
+        snapshot["reconciled"] tells the Tk thread whether the score checked out.
+        Returns None on failure.
+        """
+        # The score is worked out locally from the stat rows. With reconcile, GameScore
+        # is asked for too, to check the two agree.
+        snapshot = self.test_data.get_game_snapshot(game_id, game=game_data, server_score=reconcile)
+        if snapshot is None:
+            log.error("Error fetching game details for gameID %s", game_id)
+            return None
+        if snapshot["missing"]:
+            log.warning("Game %s details incomplete, missing: %s", game_id, snapshot["missing"])
+
+        box = BoxScore(snapshot["game"], snapshot["stats"], snapshot["team_of"])
+        snapshot["box"] = box
+        snapshot["score"] = box.score()
+        snapshot["reconciled"] = False
+        server = snapshot["server_score"]
+        if server is not None:
+            diffs = box.reconcile(server)
+            if diffs:
+                # Trust the server and check again next time
+                log.warning("Game %s: local score disagrees with GameScore %s", game_id, diffs)
+                snapshot["score"] = server
+            else:
+                snapshot["reconciled"] = True
+        return snapshot
 
-        # --- 3. Retrieve all stat records for the game ---
+    def _start_api(self):
+        """Starts the ASP.NET Core project and points self.test_data at it."""
         try:
-            url = f"{self.test_data.base_url}/Stats/Game/{game_id}"
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            all_game_stats = resp.json()
-            print(f"[DEBUG] Raw stats for game {game_id}:", all_game_stats)
+            # Run "dotnet run" from the ../api directory relative to the current UI folder
+            # Adjust the path as needed if your folder structure is different
+            self.api_process = subprocess.Popen(
+                ["dotnet", "run"],
+                cwd=os.path.join("..", "api")  # up one folder, then into "api"
+            )
         except Exception as e:
-            print(f"[ERROR] Error fetching stats for gameID {game_id}: {e}")
-            all_game_stats = []
-
-        # --- Build stat map ---
-        stat_map = {}
-        for stat in all_game_stats:
-            pid = stat.get("player_ID")
-            if pid is not None:
-                stat_map[pid] = stat
-        print("[DEBUG] stat_map keys:", list(stat_map.keys()))
-
-        # --- 4. Get rosters for both teams ---
-        home_team_id = game_data.get("Home_ID") or game_data.get("home_ID")
-        away_team_id = game_data.get("Away_ID") or game_data.get("away_ID")
-        print(f"[DEBUG] Home team ID: {home_team_id}, Away team ID: {away_team_id}")
-
-        home_roster = self.test_data.get_players_for_team_sorted(home_team_id)
-        print("[DEBUG] Home roster:", home_roster)
-        away_roster = self.test_data.get_players_for_team_sorted(away_team_id)
-        print("[DEBUG] Away roster:", away_roster)
-
-        # --- 5. Construct team data by joining with stats ---
-        def build_team_data(roster):
-            team_list = []
-            for player in roster:
-                pid = player.get("player_ID")
-                stat = stat_map.get(pid)
-                print(f"[DEBUG] Player {pid} - found stat? {'Yes' if stat else 'No'}")
-                if stat:
-                    print(f"[DEBUG] Stats for Player {pid}:", stat)
-                    two_made = stat.get("two_Points_Made", 0)
-                    thr_made = stat.get("three_Points_Made", 0)
-                    ft_made = stat.get("free_Throw_Made", 0)
-                    assists = stat.get("assists", 0)
-                    off_reb = stat.get("off_Rebounds", 0)
-                    def_reb = stat.get("def_Rebounds", 0)
-                    two_miss = stat.get("two_Points_Missed", 0)
-                    thr_miss = stat.get("three_Points_Missed", 0)
-                    points = (two_made * 2) + (thr_made * 3) + ft_made
-                    rebounds = off_reb + def_reb
-                    total_made = two_made + thr_made
-                    total_attempts = total_made + two_miss + thr_miss
-                    fg_pct = round((total_made / total_attempts) * 100) if total_attempts > 0 else 0
-                else:
-                    points, assists, rebounds, fg_pct = 0, 0, 0, 0
-                team_list.append({
-                    "player_ID": pid,
-                    "position_ID": player.get("position_ID", "??"),
-                    "jersey_Number": player.get("jersey_Number", 0),
-                    "last_Name": player.get("last_Name", ""),
-                    "Points": points,
-                    "Assists": assists,
-                    "Rebounds": rebounds,
-                    "FG%": fg_pct
-                })
-            return team_list
-
-        home_team_data = build_team_data(home_roster)
-        away_team_data = build_team_data(away_roster)
-
-        print("[DEBUG] Final home_team_data:", home_team_data)
-        print("[DEBUG] Final away_team_data:", away_team_data)
-
-        aggregated_details = {
-            "game_id": game_id,
-            "game_data": game_data,
-            "scoreboard": score_info,
-            "home_team_data": home_team_data,
-            "away_team_data": away_team_data
-        }
+            # If the process fails to launch, show an error popup and optionally exit
+            messagebox.showerror("API Failure", f"Failed to start the ASP.NET Core project.\n\nError: {e}")
+            # You could call self.destroy() or sys.exit(1) to stop the UI if the API is mandatory
+        else:
+            # If we get here, the .NET process started without immediate exceptions
+            # You can now switch from FakeAPI to your real API connector
+            self.test_data = RealAPI()
+            log.info("ASP.NET Core API launched successfully (subprocess started).")
+            # or:
+            # from real_api import RealAPI
+            # self.test_data = RealAPI()
 
-        self.selected_game_id = game_id
-        print("[DEBUG] Aggregated details ready. Passing to UI.")
-        self.update_game_details_ui(aggregated_details)
+    def _on_network_busy(self, count):
+        self.status_var.set(f"Loading... ({count} request{'s' if count != 1 else ''} in flight)" if count else "")
+
+    def report_callback_exception(self, exc, val, tb):
+        # Tk calls this for anything a callback raises; keep the lead-up with it
+        log.error("Unhandled error in a UI callback", exc_info=(exc, val, tb))
+        path = gob_log.dump_ring()
+        if path:
+            log.error("Recent log written to %s", path)
+
+    def _on_close(self):
+        self._follow_game(None)
+        self.net.shutdown()
+        self.stat_journal.stop()
+        if self.trace_dump:
+            log.info("Request trace written to %s", tracing.TRACER.dump(self.trace_dump))
+        self.destroy()
 
     def _enable_scroll_wheel(self):
         self.schedule_canvas.bind("<Enter>", lambda e: self.schedule_canvas.focus_set())
@@ -349,101 +390,19 @@ class MainMenu(tk.Tk):
                 self.last_selected_game_id = self.selected_game_id
                 self._need_reset = False
 
-    def update_game_details_ui(self, aggregated_details):
+    def update_game_details_ui(self, snapshot):
         """
-        Displays the game details using pre-aggregated data.
-        Expects aggregated_details to be a dictionary with keys:
-          - game_id
-          - game_data: full game details (including 'home' and 'away' names)
-          - scoreboard: with keys "HomeTeamScore" and "AwayTeamScore"
-          - home_team_data: list of dicts for home players, each with keys:
-                'position_ID', 'jersey_Number', 'last_Name', 'Points', 'Assists', 'Rebounds', 'FG%'
-          - away_team_data: same for away players.
-        This method simply renders the data in the UI.
+        Displays the game details straight from a game snapshot
+        (see _load_game_details): the game record (including 'home' and 'away'
+        names), the score, both rosters and the game's BoxScore, which gives one
+        line per player:
+            'position_ID', 'jersey_Number', 'last_Name', 'Points', 'Assists', 'Rebounds', 'FG%'
+        The panel's widgets are reused (see GameDetailsView); only changed texts are set.
         """
-        # 1. Clear the current details container.
-        for widget in self.details_container.winfo_children():
-            widget.destroy()
-
-        # --- Debug prints: print entire aggregated_details ---
-        print("DEBUG: Aggregated Details Received:")
-        print(aggregated_details)
-
-        # Extract values.
-        game_data = aggregated_details.get("game_data", {})
-        scoreboard = aggregated_details.get("scoreboard", {})
-        home_score = scoreboard.get("homeTeamScore", 0)
-        away_score = scoreboard.get("awayTeamScore", 0)
-
-        # Print what we're using for the scoreboard.
-        print("DEBUG: Game Data:", game_data)
-        print("DEBUG: Scoreboard Data:", scoreboard)
-
-        # 2. Build the scoreboard label.
-        # We assume game_data contains keys 'home' and 'away' (team names)
-        scoreboard_text = f"{game_data.get('home', 'Home')} ({home_score}) vs {game_data.get('away', 'Away')} ({away_score})"
-        print("DEBUG: Scoreboard Text to Render:", scoreboard_text)
-        score_label = ttk.Label(self.details_container, text=scoreboard_text, font=("Consolas", 16, "bold"))
-        score_label.pack(anchor="center", pady=10)
-
-        # 3. Create a frame to hold the two team sections.
-        teams_frame = ttk.Frame(self.details_container)
-        teams_frame.pack(expand=True, fill="both", padx=10, pady=10)
-
-        # Header for columns.
-        header_line = f"{'Pos':<3}|{'#':<2}|{'Last Name':<15}|{'Pts':>3}|{'Ast':>3}|{'Reb':>3}|{'FG%':>3}"
-        print("DEBUG: Header Line:", header_line)
-
-        # --- Home Team Section ---
-        home_frame = ttk.Frame(teams_frame)
-        home_frame.grid(row=0, column=0, padx=15, sticky="nw")
-        home_team_name = game_data.get('home', 'Home')
-        ttk.Label(home_frame, text=f"{home_team_name} (Home)", font=("Consolas", 12, "bold")).pack()
-        ttk.Label(home_frame, text="Players:", font=("Consolas", 10, "bold underline")).pack(pady=(10, 0))
-        ttk.Label(home_frame, text=header_line, font=("Consolas", 12, "bold")).pack(anchor="w", padx=5)
-
-        home_team_data = aggregated_details.get("home_team_data", [])
-        print("DEBUG: Home Team Data:")
-        print(home_team_data)
-        for player in home_team_data:
-            # Print each player's dictionary before formatting.
-            print("DEBUG: Home player raw data:", player)
-            line = (
-                f"{player.get('position_ID', '??'):<3}|"
-                f"{player.get('jersey_Number', 0):<2}|"
-                f"{player.get('last_Name', ''):<15}|"
-                f"{player.get('Points', 0):>3}|"
-                f"{player.get('Assists', 0):>3}|"
-                f"{player.get('Rebounds', 0):>3}|"
-                f"{player.get('FG%', 0):>3}%"
-            )
-            print("DEBUG: Home player formatted line:", line)
-            ttk.Label(home_frame, text=line, font=("Consolas", 12)).pack(anchor="w", padx=5)
-
-        # --- Away Team Section ---
-        away_frame = ttk.Frame(teams_frame)
-        away_frame.grid(row=0, column=1, padx=15, sticky="nw")
-        away_team_name = game_data.get('away', 'Away')
-        ttk.Label(away_frame, text=f"{away_team_name} (Away)", font=("Consolas", 12, "bold")).pack()
-        ttk.Label(away_frame, text="Players:", font=("Consolas", 10, "bold underline")).pack(pady=(10, 0))
-        ttk.Label(away_frame, text=header_line, font=("Consolas", 12, "bold")).pack(anchor="w", padx=5)
-
-        away_team_data = aggregated_details.get("away_team_data", [])
-        print("DEBUG: Away Team Data:")
-        print(away_team_data)
-        for player in away_team_data:
-            print("DEBUG: Away player raw data:", player)
-            line = (
-                f"{player.get('position_ID', '??'):<3}|"
-                f"{player.get('jersey_Number', 0):<2}|"
-                f"{player.get('last_Name', ''):<15}|"
-                f"{player.get('Points', 0):>3}|"
-                f"{player.get('Assists', 0):>3}|"
-                f"{player.get('Rebounds', 0):>3}|"
-                f"{player.get('FG%', 0):>3}%"
-            )
-            print("DEBUG: Away player formatted line:", line)
-            ttk.Label(away_frame, text=line, font=("Consolas", 12)).pack(anchor="w", padx=5)
+        # Kept so live stat pushes can fold their changes in (see _on_game_event)
+        self._details_snapshot = snapshot
+        log.debug("Showing game %s: %s", snapshot["game_id"], snapshot.get("score"))
+        self.details_view.show(snapshot)
 
     def _on_mousewheel_global_win(self, event):
         self.schedule_canvas.yview_scroll(int(-event.delta / 120), "units")
@@ -451,113 +410,60 @@ class MainMenu(tk.Tk):
     def delete_game(self):
         # Ensure a game is selected
         if not hasattr(self, 'selected_game_id') or not self.selected_game_id:
-            print("No game selected to delete.")
+            log.info("No game selected to delete.")
             return
 
         game_id = self.selected_game_id
 
-        # 1) Fetch the game object to get home/away team IDs
-        game_url = f"{self.test_data.base_url}/Games/{game_id}"
-        resp = requests.get(game_url)
-        if resp.status_code != 200:
-            print(f"Error: Could not retrieve game {game_id}.")
+        # The deletes run on the write lane; keep the button off until they're done
+        # so the same game can't be deleted twice.
+        self.delete_button.state(["disabled"])
+        with tracing.TRACER.span("delete_game", game_id=game_id):
+            self.net.submit(
+                self._delete_game_and_stats, game_id,
+                on_success=lambda ok: self._on_game_deleted(game_id, ok),
+                on_error=lambda e: self._on_game_deleted(game_id, False),
+                lane="write",
+            )
+
+    def _delete_game_and_stats(self, game_id):
+        # Runs on a worker thread - no Tk calls in here.
+        # One call: the API deletes the game and all of its stats in a single transaction,
+        # so a failure leaves the game exactly as it was.
+        if not self.test_data.delete_game(game_id):
+            return False
+
+        log.info("Game %s (and all stats) deleted successfully.", game_id)
+        return True
+
+    def _on_game_deleted(self, game_id, ok):
+        self.delete_button.state(["!disabled"])
+        if not ok:
             return
-        game_data = resp.json()  # e.g. { "game_ID":2, "home_ID":5, "away_ID":6, "game_Date":"..." }
-
-        home_team_id = game_data["home_ID"]
-        away_team_id = game_data["away_ID"]
-
-        # Helper: a function to delete all stats for a specific team in this game
-        def delete_stats_for_team(team_id, game_id):
-            url = f"{self.test_data.base_url}/Stats/Team/{team_id}/Game/{game_id}"
-            resp_stats = requests.get(url)
-            if resp_stats.status_code == 404:
-                # Means no stats for that team/game combo
-                return
-            elif resp_stats.status_code != 200:
-                print(f"Warning: Could not fetch stats for team {team_id}, game {game_id}. {resp_stats.status_code}")
-                return
-
-            stats_list = resp_stats.json()  # e.g. [ { "stat_ID":12, "player_ID":..., "game_ID":... }, ...]
-            for s in stats_list:
-                stat_id = s["stat_ID"]
-                delete_url = f"{self.test_data.base_url}/Stats/{stat_id}"
-                del_resp = requests.delete(delete_url)
-                if del_resp.status_code not in (200, 204):
-                    print(f"Warning: Could not delete stat {stat_id} (HTTP {del_resp.status_code})")
-
-        # 2) Delete stats for home team, then away team
-        delete_stats_for_team(home_team_id, game_id)
-        delete_stats_for_team(away_team_id, game_id)
-
-        # 3) Delete the game
-        delete_url = f"{self.test_data.base_url}/Games/{game_id}"
-        del_game_resp = requests.delete(delete_url)
-        if del_game_resp.status_code not in (200, 204):
-            print(f"Error deleting game {game_id}: {del_game_resp.status_code} {del_game_resp.text}")
+        # Now refresh UI - just drop that one row
+        if self.schedule_model.remove(game_id) is not None:
+            self.schedule_view.items_changed()
+        if self.selected_game_id != game_id:
+            # The user already moved on to another game; leave its details up
             return
-
-        print(f"Game {game_id} (and all stats) deleted successfully.")
-        # Now refresh UI
-        self.clear_schedule_ui()
-        self.build_schedule_contents()
+        self.net.cancel("game_details")
+        self._follow_game(None)
+        self._details_snapshot = None
         self.selected_game_index = None
         self.selected_game_id = None
-        for widget in self.details_container.winfo_children():
-            widget.destroy()
-        self.details_placeholder = ttk.Label(
-            self.details_container,
-            text="Click a game to view details",
-            font=("Consolas", 14, "italic")
-        )
-        self.details_placeholder.pack(anchor="center", expand=True)
+        self.details_view.clear()
 
     def scroll_near_today(self, today_index, offset=4):
-        if 0 <= today_index < len(self.game_buttons):
-            adjusted_index = max(0, today_index - offset)
-            self.scrollable_schedule_frame.update_idletasks()
-            target_widget, _, _ = self.game_buttons[adjusted_index]
-            y_coord = target_widget.winfo_y()
-            total_height = self.scrollable_schedule_frame.winfo_height()
-            fraction = y_coord / float(total_height)
-            fraction = max(0.0, min(fraction, 1.0))
-            self.schedule_canvas.yview_moveto(fraction)
+        if 0 <= today_index < len(self.schedule_view):
+            self.schedule_view.scroll_to_index(max(0, today_index - offset))
 
     def clear_schedule_ui(self):
-        for widget in self.scrollable_schedule_frame.winfo_children():
-            widget.destroy()
-        self.game_buttons.clear()
+        self.schedule_model = ScheduleModel()
+        self.schedule_view.set_items(self.schedule_model)
 
-    def generate_jersey_image(self, number):
-        jersey_path = os.path.join(UI_ELEMENTS, "Jersey.png")
-        if not os.path.exists(jersey_path):
-            print(f"Error: Jersey image not found at {jersey_path}")
-            return None
-        try:
-            from PIL import Image
-            img = Image.open(jersey_path).convert("RGBA").resize((32, 32), Image.Resampling.LANCZOS)
-            style = ttk.Style()
-            bg_color = style.lookup('TFrame', 'background')
-            def tk_to_rgb(color):
-                return self.winfo_rgb(color)[0] // 256, self.winfo_rgb(color)[1] // 256, self.winfo_rgb(color)[2] // 256
-            bg_rgb = tk_to_rgb(bg_color)
-            new_img = Image.new("RGBA", img.size, (*bg_rgb, 255))
-            new_img.paste(img, (0, 0), img)
-            txt_layer = Image.new("RGBA", img.size, (255, 255, 255, 0))
-            draw = ImageDraw.Draw(txt_layer)
-            font = ImageFont.load_default()
-            text = str(number)
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            x = (32 - text_width) // 2
-            y = (32 - text_height) // 2
-            draw.text((x, y), text, fill="black", font=font)
-            final_image = Image.alpha_composite(new_img, txt_layer)
-            return ImageTk.PhotoImage(final_image)
-        except Exception as e:
-            print(f"Error generating jersey image: {e}")
-            return None
+    def generate_jersey_image(self, number, bg=None, highlight=False):
+        """Jersey icon for a number - cached, so the same number/colour is only rendered once."""
+        return self.jerseys.get(number, bg=bg, highlight=highlight)
 
     def update_jersey_display(self):
         if not hasattr(self, 'selected_game_id') or not self.selected_game_id:
@@ -576,19 +482,19 @@ class MainMenu(tk.Tk):
         time_str = self.time_entry.get()  # Time of day
 
         if home == away:
-            print("Error: Home and away teams must be different.")
+            log.error("Home and away teams must be different.")
             return
 
         try:
             game_date = datetime.strptime(date_str, "%Y-%m-%d").date()
         except ValueError:
-            print("Invalid date format. Use YYYY-MM-DD")
+            log.error("Invalid date format. Use YYYY-MM-DD")
             return
 
         try:
             game_time = datetime.strptime(time_str.strip(), "%I:%M %p").time()
         except ValueError:
-            print("Invalid time format. Use HH:MM AM/PM")
+            log.error("Invalid time format. Use HH:MM AM/PM")
             return
 
         local_dt = datetime.combine(game_date, game_time)
@@ -597,15 +503,54 @@ class MainMenu(tk.Tk):
         utc_dt = local_dt.astimezone(timezone.utc)
 
         # Instead of passing iso_zulu_str, pass the actual datetime:
-        new_game = self.test_data.create_game(home, away, utc_dt)
-        if new_game is not None:
-            self.clear_schedule_ui()
-            self.build_schedule_contents()
+        self.net.submit(
+            self.test_data.create_game, home, away, utc_dt,
+            on_success=lambda new_game: self._on_game_created(new_game, home, away),
+            lane="write",
+        )
+
+    def _on_game_created(self, new_game, home, away):
+        if new_game is None:
+            return
+        # Slot just the new game into the schedule (no refetch of /Games)
+        new_game.home = home
+        new_game.away = away
+        self.schedule_model.insert(new_game)
+        self.schedule_view.items_changed()
 
-    def update_game_ui_with_lineup(self, starters, bench):
+    def update_game_ui(self):
         """
-        Rebuilds the game UI using the provided 'starters' array (on-court player IDs)
-        and 'bench' dictionary (teamID -> list of bench player IDs).
+        Sets up the Game tab for the selected game: loads both rosters in the background,
+        puts the first five of each on the court and shows them (see OnCourtState).
+        """
+        for widget in self.game_ui_container.winfo_children():
+            widget.destroy()
+        self.on_court = None
+        game = self._game_record()
+        if game is None:
+            ttk.Label(self.game_ui_container, text="Select a game on the Schedule tab first.",
+                      font=("Consolas", 14, "italic")).pack(pady=20)
+            return
+        ttk.Label(self.game_ui_container, text="Loading rosters...", font=("Consolas", 12, "italic")).pack(pady=20)
+        self.net.submit(self._load_on_court, game, on_success=lambda state: self._on_court_loaded(game.game_ID, state),
+                        key="on_court")
+
+    def _load_on_court(self, game):
+        """Worker thread: both rosters -> a fresh OnCourtState."""
+        home = self.test_data.get_players_for_team_sorted(game.home_ID)
+        away = self.test_data.get_players_for_team_sorted(game.away_ID)
+        return OnCourtState(game.home_ID, game.away_ID, home, away)
+
+    def _on_court_loaded(self, game_id, state):
+        if game_id != self.selected_game_id:
+            return
+        self.on_court = state
+        self.update_game_ui_with_lineup(state)
+
+    def update_game_ui_with_lineup(self, on_court):
+        """
+        Rebuilds the game UI from an OnCourtState: one row per on-court player of
+        each team, with the stat buttons.
         """
         # Clear the game UI container.
         for widget in self.game_ui_container.winfo_children():
@@ -613,25 +558,23 @@ class MainMenu(tk.Tk):
 
         # Retrieve the game record using the selected game ID.
         if not hasattr(self, 'selected_game_id') or not self.selected_game_id:
-            print("No game selected to update.")
+            log.info("No game selected to update.")
             return
-        game = next((g for g in self.test_data.get_schedule() if g["GameID"] == self.selected_game_id), None)
+        game = self._game_record()
         if not game:
-            print("Game record not found!")
+            log.error("Game record not found!")
             return
 
         # Get team IDs.
-        home_team_id = game.get("HomeTeamID")
-        away_team_id = game.get("AwayTeamID")
+        home_team_id = game.home_ID
+        away_team_id = game.away_ID
 
-        # Filter on-court players from starters using the provided array.
-        home_players = [p for p in self.test_data.db["Players"]
-                        if p["PlayerID"] in starters and p.get("TeamID") == home_team_id]
-        away_players = [p for p in self.test_data.db["Players"]
-                        if p["PlayerID"] in starters and p.get("TeamID") == away_team_id]
+        # The players on the court right now.
+        home_players = on_court.on_court(home_team_id)
+        away_players = on_court.on_court(away_team_id)
 
         # Create header label.
-        header = ttk.Label(self.game_ui_container, text=f"{game['home']} vs {game['away']}",
+        header = ttk.Label(self.game_ui_container, text=f"{game.home} vs {game.away}",
                            font=("Consolas", 16, "bold"))
         header.pack(pady=5)
 
@@ -665,22 +608,17 @@ class MainMenu(tk.Tk):
         def create_player_row(parent, player):
             row_frame = ttk.Frame(parent)
             row_frame.pack(fill="x", pady=2)
-            # Save widget references for potential substitution.
-            jersey_img = self.generate_jersey_image(player["Jersey_Number"])
+            jersey_img = self.generate_jersey_image(player.jersey_Number)
             if jersey_img:
                 jersey_label = ttk.Label(row_frame, image=jersey_img)
                 jersey_label.image = jersey_img
                 jersey_label.pack(side="left", padx=2)
                 # Bind a click event for substitution.
                 jersey_label.bind("<Button-1>", lambda e, p=player: self.on_stat_button(p, "jersey"))
-                # Store the widget reference.
-                player["jersey_widget"] = jersey_label
             else:
-                ttk.Label(row_frame, text=str(player["Jersey_Number"]), font=("Consolas", 10)).pack(side="left", padx=2)
-            name_label = ttk.Label(row_frame, text=f"{player['Last_Name']:<15}", font=("Consolas", 10), width=15)
+                ttk.Label(row_frame, text=str(player.jersey_Number), font=("Consolas", 10)).pack(side="left", padx=2)
+            name_label = ttk.Label(row_frame, text=f"{player.last_Name:<15}", font=("Consolas", 10), width=15)
             name_label.pack(side="left", padx=2)
-            # Store the name label for potential substitution updates.
-            player["name_widget"] = name_label
             stats_frame = ttk.Frame(row_frame)
             stats_frame.pack(side="left", padx=2, fill="x", expand=True)
             stat_categories = ["2pt", "3pt", "Stl", "TO", "Ast", "Blk", "Foul", "Reb", "FT"]
@@ -704,6 +642,16 @@ class MainMenu(tk.Tk):
         for player in away_players:
             create_player_row(away_frame, player)
 
+    def post_stat_updates(self, game_id, updates):
+        """
+        Records a stat form's updates - a list of (player_id, action) - in the stat journal.
+        That only touches the local disk; the journal's flusher sends the play to the API
+        (and keeps retrying if the API is down), so the form can move on right away.
+        """
+        if game_id is None or not updates:
+            return
+        self.stat_journal.record(game_id, updates)
+
     def on_stat_button(self, player, stat):
         # Clear the current contents of the stat detail frame.
         for widget in self.stat_detail_frame.winfo_children():
@@ -712,25 +660,24 @@ class MainMenu(tk.Tk):
         match stat:
             case "2pt":
                 # Set the header text to the shooter's last name (actual field might be "last_Name")
-                self.stat_detail_frame.config(text=f"2-Point Attempt for {player['last_Name']}")
+                self.stat_detail_frame.config(text=f"2-Point Attempt for {player.last_Name}")
 
                 # Clear out any existing widgets in the detail frame
                 for w in self.stat_detail_frame.winfo_children():
                     w.destroy()
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
 
-                # Grab the current game record from your real schedule
-                all_games = self.test_data.get_schedule()  # real API call
-                game_rec = next((g for g in all_games if g["game_ID"] == self.selected_game_id), {})
+                # Grab the current game record from the schedule
+                game_rec = self._game_record()
                 if not game_rec:
-                    print("Error: game record not found in real API schedule.")
+                    log.error("Game record not found in the schedule.")
                     return
 
-                home_team_id = game_rec.get("home_ID")
-                away_team_id = game_rec.get("away_ID")
+                home_team_id = game_rec.home_ID
+                away_team_id = game_rec.away_ID
 
                 # This shooter's team: (the player dict might have "team_ID")
-                shooter_team = player.get("team_ID")
+                shooter_team = player.team_ID
                 # Opposing team is whichever is not the shooter’s
                 opposing_team = away_team_id if shooter_team == home_team_id else home_team_id
 
@@ -865,23 +812,20 @@ class MainMenu(tk.Tk):
                     btn_frame = ttk.Frame(fp_frame)
                     btn_frame.grid(row=1, column=0, columnspan=4)
 
-                    # >>> Real API fetch <<<
-                    # e.g. get all opposing team players from the DB:
-                    full_opponents = self.test_data._get_players_for_team(opposing_team)
-                    # Then filter by who is currently on-court:
-                    candidates = [pl for pl in full_opponents if pl["player_ID"] in self.currentLineup]
+                    # Whoever is on the court for the opposing team
+                    candidates = self.on_court.on_court(opposing_team)
 
                     col = 0
                     for cand in candidates[:5]:
                         # Build a jersey button
-                        img = self.generate_jersey_image(cand.get("jersey_Number", 0))
+                        img = self.generate_jersey_image(cand.jersey_Number)
                         # color code
-                        bg_color = "lightblue" if cand["team_ID"] == home_team_id else "lightpink"
+                        bg_color = "lightblue" if cand.team_ID == home_team_id else "lightpink"
 
                         btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg_color)
                         btn.image = img
                         btn.grid(row=0, column=col, padx=5, pady=2)
-                        btn.config(command=lambda pid=cand["player_ID"], b=btn: make_foul_select(pid, b))
+                        btn.config(command=lambda pid=cand.player_ID, b=btn: make_foul_select(pid, b))
                         col += 1
 
                     update_submit_if_allowed()
@@ -936,44 +880,47 @@ class MainMenu(tk.Tk):
                             submit_btn.master.destroy()
                             submit_btn = None
 
+                @tracing.traced("submit_all", form=stat)
                 def submit_all():
                     """
                     Actually call `update_player_stats(...)` with the correct action tokens, e.g. "2pt_make".
                     This function presumably does a POST to /Stats or similar in your RealAPI.
                     """
                     game_id = self.selected_game_id
-                    shooter_id = player["player_ID"]
+                    updates = []
+                    shooter_id = player.player_ID
 
                     if shot_result.get() == "made":
                         # e.g. "2pt_make"
-                        self.test_data.update_player_stats(game_id, shooter_id, "2pt_make")
+                        updates.append((shooter_id, "2pt_make"))
 
                         if foul_choice.get() == "yes":
                             if free_throw1.get() == "made":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_make")
+                                updates.append((shooter_id, "ft_make"))
                             elif free_throw1.get() == "missed":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_miss")
+                                updates.append((shooter_id, "ft_miss"))
                         if assist_choice.get() == "yes" and assist_player.get() != 0:
-                            self.test_data.update_player_stats(game_id, assist_player.get(), "assist")
+                            updates.append((assist_player.get(), "assist"))
 
                     elif shot_result.get() == "missed":
                         # "2pt_miss"
-                        self.test_data.update_player_stats(game_id, shooter_id, "2pt_miss")
+                        updates.append((shooter_id, "2pt_miss"))
                         if foul_choice.get() == "yes":
                             if free_throw1.get() == "made":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_make")
+                                updates.append((shooter_id, "ft_make"))
                             elif free_throw1.get() == "missed":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_miss")
+                                updates.append((shooter_id, "ft_miss"))
                             if free_throw2.get() == "made":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_make")
+                                updates.append((shooter_id, "ft_make"))
                             elif free_throw2.get() == "missed":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_miss")
+                                updates.append((shooter_id, "ft_miss"))
                         else:
                             if block_choice.get() == "yes" and block_player.get() != 0:
-                                self.test_data.update_player_stats(game_id, block_player.get(), "block")
+                                updates.append((block_player.get(), "block"))
                         if rebound_choice.get() == "yes" and rebound_player.get() != 0:
-                            self.test_data.update_player_stats(game_id, rebound_player.get(), "rebound")
+                            updates.append((rebound_player.get(), "rebound"))
 
+                    self.post_stat_updates(game_id, updates)
                     # Clear the form
                     clear_rows_after(0)
                     final_frame = ttk.Frame(self.stat_detail_frame)
@@ -985,7 +932,7 @@ class MainMenu(tk.Tk):
 
             case "3pt":
                 # Set header and clear previous content.
-                self.stat_detail_frame.config(text=f"3-Point Attempt for {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"3-Point Attempt for {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
@@ -1047,9 +994,9 @@ class MainMenu(tk.Tk):
                 submit_btn = None  # Will store the submit button widget
 
                 # --- Retrieve Game Record for Color Coding ---
-                game_rec = next((g for g in self.test_data.db["Games"] if g["GameID"] == self.selected_game_id), {})
-                home_team_id = game_rec.get("HomeTeamID")
-                away_team_id = game_rec.get("AwayTeamID")
+                game_rec = self._game_record()
+                home_team_id = game_rec.home_ID if game_rec else None
+                away_team_id = game_rec.away_ID if game_rec else None
 
                 # --- Row 0: Shot Outcome ---
                 shot_frame = ttk.Frame(self.stat_detail_frame)
@@ -1096,18 +1043,17 @@ class MainMenu(tk.Tk):
                                                                             pady=5)
                     btn_frame = ttk.Frame(fp_frame)
                     btn_frame.grid(row=1, column=0, columnspan=4)
-                    shooter_team = player.get("TeamID")
+                    shooter_team = player.team_ID
                     opposing_team = home_team_id if shooter_team != home_team_id else away_team_id
-                    candidates = [p for p in self.test_data.db["Players"]
-                                  if p["PlayerID"] in self.currentLineup and p.get("TeamID") == opposing_team][:5]
+                    candidates = self.on_court.on_court(opposing_team)
                     col = 0
                     for cand in candidates:
-                        img = self.generate_jersey_image(cand["Jersey_Number"])
-                        bg = "lightblue" if cand.get("TeamID") == home_team_id else "lightpink"
+                        img = self.generate_jersey_image(cand.jersey_Number)
+                        bg = "lightblue" if cand.team_ID == home_team_id else "lightpink"
                         btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg)
                         btn.image = img
                         btn.grid(row=0, column=col, padx=5, pady=2)
-                        btn.config(command=lambda pid=cand["PlayerID"], b=btn: make_foul_select(pid, b))
+                        btn.config(command=lambda pid=cand.player_ID, b=btn: make_foul_select(pid, b))
                         col += 1
                     update_submit_if_allowed()
                     add_free_throw_section()
@@ -1215,17 +1161,15 @@ class MainMenu(tk.Tk):
                                                                               pady=5)
                     btn_frame = ttk.Frame(ap_frame)
                     btn_frame.grid(row=1, column=0, columnspan=4)
-                    teammates = [p for p in self.test_data.db["Players"]
-                                 if p["PlayerID"] in self.currentLineup and p.get("TeamID") == player.get("TeamID")
-                                 and p["PlayerID"] != player["PlayerID"]][:4]
+                    teammates = self.on_court.teammates_of(player.player_ID)
                     col = 0
                     for tm in teammates:
-                        img = self.generate_jersey_image(tm["Jersey_Number"])
-                        bg = "lightblue" if tm.get("TeamID") == home_team_id else "lightpink"
+                        img = self.generate_jersey_image(tm.jersey_Number)
+                        bg = "lightblue" if tm.team_ID == home_team_id else "lightpink"
                         cur_btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg)
                         cur_btn.image = img
                         cur_btn.grid(row=0, column=col, padx=5, pady=2)
-                        cur_btn.config(command=lambda pid=tm["PlayerID"], btn=cur_btn: make_assist_select(pid, btn))
+                        cur_btn.config(command=lambda pid=tm.player_ID, btn=cur_btn: make_assist_select(pid, btn))
                         col += 1
                     update_submit_if_allowed()
 
@@ -1262,18 +1206,17 @@ class MainMenu(tk.Tk):
                                                                              pady=5)
                     btn_frame = ttk.Frame(bp_frame)
                     btn_frame.grid(row=1, column=0, columnspan=5)
-                    shooter_team = player.get("TeamID")
-                    opposing_team = home_team_id if game_rec["HomeTeamID"] != shooter_team else game_rec["AwayTeamID"]
-                    opponents = [p for p in self.test_data.db["Players"]
-                                 if p["PlayerID"] in self.currentLineup and p.get("TeamID") == opposing_team][:5]
+                    shooter_team = player.team_ID
+                    opposing_team = home_team_id if home_team_id != shooter_team else away_team_id
+                    opponents = self.on_court.on_court(opposing_team)
                     col = 0
                     for opp in opponents:
-                        img = self.generate_jersey_image(opp["Jersey_Number"])
-                        bg = "lightblue" if opp.get("TeamID") == home_team_id else "lightpink"
+                        img = self.generate_jersey_image(opp.jersey_Number)
+                        bg = "lightblue" if opp.team_ID == home_team_id else "lightpink"
                         cur_btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg)
                         cur_btn.image = img
                         cur_btn.grid(row=0, column=col, padx=5, pady=2)
-                        cur_btn.config(command=lambda pid=opp["PlayerID"], btn=cur_btn: make_block_select(pid, btn))
+                        cur_btn.config(command=lambda pid=opp.player_ID, btn=cur_btn: make_block_select(pid, btn))
                         col += 1
                     add_rebound_question()
 
@@ -1310,15 +1253,15 @@ class MainMenu(tk.Tk):
                     ttk.Label(rp_frame, text="Select rebounder:").grid(row=0, column=0, columnspan=10, padx=5, pady=5)
                     btn_frame = ttk.Frame(rp_frame)
                     btn_frame.grid(row=1, column=0, columnspan=10)
-                    rebounders = [p for p in self.test_data.db["Players"] if p["PlayerID"] in self.currentLineup][:10]
+                    rebounders = self.on_court.lineup()
                     col = 0
                     for rp in rebounders:
-                        img = self.generate_jersey_image(rp["Jersey_Number"])
-                        bg = "lightblue" if rp.get("TeamID") == home_team_id else "lightpink"
+                        img = self.generate_jersey_image(rp.jersey_Number)
+                        bg = "lightblue" if rp.team_ID == home_team_id else "lightpink"
                         cur_btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg)
                         cur_btn.image = img
                         cur_btn.grid(row=0, column=col, padx=5, pady=2)
-                        cur_btn.config(command=lambda pid=rp["PlayerID"], btn=cur_btn: make_rebound_select(pid, btn))
+                        cur_btn.config(command=lambda pid=rp.player_ID, btn=cur_btn: make_rebound_select(pid, btn))
                         col += 1
                     update_submit_if_allowed()
 
@@ -1376,38 +1319,41 @@ class MainMenu(tk.Tk):
                             submit_btn.master.destroy()
                             submit_btn = None
 
+                @tracing.traced("submit_all", form=stat)
                 def submit_all():
                     game_id = self.selected_game_id
-                    shooter_id = player["PlayerID"]
+                    updates = []
+                    shooter_id = player.player_ID
                     if shot_result.get() == "made":
-                        self.test_data.update_player_stats(game_id, shooter_id, "3pt_make")
+                        updates.append((shooter_id, "3pt_make"))
                         if foul_choice.get() == "yes":
                             if free_throw1.get() == "made":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_make")
+                                updates.append((shooter_id, "ft_make"))
                             elif free_throw1.get() == "missed":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_miss")
+                                updates.append((shooter_id, "ft_miss"))
                     elif shot_result.get() == "missed":
-                        self.test_data.update_player_stats(game_id, shooter_id, "3pt_miss")
+                        updates.append((shooter_id, "3pt_miss"))
                         if foul_choice.get() == "yes":
                             if free_throw1.get() == "made":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_make")
+                                updates.append((shooter_id, "ft_make"))
                             elif free_throw1.get() == "missed":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_miss")
+                                updates.append((shooter_id, "ft_miss"))
                             if free_throw2.get() == "made":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_make")
+                                updates.append((shooter_id, "ft_make"))
                             elif free_throw2.get() == "missed":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_miss")
+                                updates.append((shooter_id, "ft_miss"))
                             if free_throw3.get() == "made":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_make")
+                                updates.append((shooter_id, "ft_make"))
                             elif free_throw3.get() == "missed":
-                                self.test_data.update_player_stats(game_id, shooter_id, "ft_miss")
+                                updates.append((shooter_id, "ft_miss"))
                         else:
                             if block_choice.get() == "yes" and block_player.get() != 0:
-                                self.test_data.update_player_stats(game_id, block_player.get(), "block")
+                                updates.append((block_player.get(), "block"))
                     if assist_choice.get() == "yes" and assist_player.get() != 0:
-                        self.test_data.update_player_stats(game_id, assist_player.get(), "assist")
+                        updates.append((assist_player.get(), "assist"))
                     if rebound_choice.get() == "yes" and rebound_player.get() != 0:
-                        self.test_data.update_player_stats(game_id, rebound_player.get(), "rebound")
+                        updates.append((rebound_player.get(), "rebound"))
+                    self.post_stat_updates(game_id, updates)
                     clear_rows_after(0)
                     final_frame = ttk.Frame(self.stat_detail_frame)
                     final_frame.grid(row=next_row(), column=0, pady=5)
@@ -1416,7 +1362,7 @@ class MainMenu(tk.Tk):
                 update_submit_if_allowed()
 
             case "Stl":
-                self.stat_detail_frame.config(text=f"Steal by {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Steal by {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
 
@@ -1424,9 +1370,9 @@ class MainMenu(tk.Tk):
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
 
                 # Retrieve the game record so we can color code based on team.
-                game_rec = next((g for g in self.test_data.db["Games"] if g["GameID"] == self.selected_game_id), {})
-                home_team_id = game_rec.get("HomeTeamID", None)
-                away_team_id = game_rec.get("AwayTeamID", None)
+                game_rec = self._game_record()
+                home_team_id = game_rec.home_ID if game_rec else None
+                away_team_id = game_rec.away_ID if game_rec else None
 
                 # Create persistent frames.
                 steal_frame = ttk.Frame(self.stat_detail_frame)
@@ -1448,26 +1394,25 @@ class MainMenu(tk.Tk):
 
                 # Row 1: Create jersey buttons for the opposing team.
                 # Determine which team is opposing the stealing player's team.
-                shooter_team = player.get("TeamID")
+                shooter_team = player.team_ID
                 if shooter_team == home_team_id:
                     opposing_team = away_team_id
                 else:
                     opposing_team = home_team_id
 
                 # Filter players from the opposing team that are currently on court.
-                opponents = [p for p in self.test_data.db["Players"]
-                             if p["PlayerID"] in self.currentLineup and p.get("TeamID") == opposing_team][:5]
+                opponents = self.on_court.on_court(opposing_team)
 
                 btn_frame = ttk.Frame(steal_target_frame)
                 btn_frame.grid(row=0, column=0)
                 col = 0
                 for opp in opponents:
-                    img = self.generate_jersey_image(opp["Jersey_Number"])
+                    img = self.generate_jersey_image(opp.jersey_Number)
                     # Color code: lightblue for home, lightpink for away.
-                    bg_color = "lightblue" if opp.get("TeamID") == home_team_id else "lightpink"
+                    bg_color = "lightblue" if opp.team_ID == home_team_id else "lightpink"
                     btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg_color)
                     btn.image = img
-                    btn.config(command=lambda pid=opp["PlayerID"], b=btn: make_steal_select(pid, b))
+                    btn.config(command=lambda pid=opp.player_ID, b=btn: make_steal_select(pid, b))
                     btn.grid(row=0, column=col, padx=5, pady=2)
                     col += 1
 
@@ -1486,20 +1431,23 @@ class MainMenu(tk.Tk):
                     submit_btn = ttk.Button(submit_frame, text="Submit", command=submit_all)
                     submit_btn.grid(row=0, column=0, padx=5, pady=5)
 
+                @tracing.traced("submit_all", form=stat)
                 def submit_all():
                     game_id = self.selected_game_id
+                    updates = []
                     # Record the steal for the stealing player.
-                    self.test_data.update_player_stats(game_id, player["PlayerID"], "steal")
+                    updates.append((player.player_ID, "steal"))
                     # And record that the steal was a turnover from the selected opponent.
                     if steal_target.get() != 0:
-                        self.test_data.update_player_stats(game_id, steal_target.get(), "TO")
+                        updates.append((steal_target.get(), "TO"))
+                    self.post_stat_updates(game_id, updates)
                     for widget in submit_frame.winfo_children():
                         widget.destroy()
                     ttk.Label(submit_frame, text="Steal recorded.").grid(row=0, column=0, padx=5, pady=5)
 
                 update_submit()
             case "TO":
-                self.stat_detail_frame.config(text=f"Turnover by {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Turnover by {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
 
@@ -1507,9 +1455,9 @@ class MainMenu(tk.Tk):
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
 
                 # Retrieve game record for team info.
-                game_rec = next((g for g in self.test_data.db["Games"] if g["GameID"] == self.selected_game_id), {})
-                home_team_id = game_rec.get("HomeTeamID", None)
-                away_team_id = game_rec.get("AwayTeamID", None)
+                game_rec = self._game_record()
+                home_team_id = game_rec.home_ID if game_rec else None
+                away_team_id = game_rec.away_ID if game_rec else None
 
                 # Create frames.
                 to_frame = ttk.Frame(self.stat_detail_frame)
@@ -1528,7 +1476,7 @@ class MainMenu(tk.Tk):
                 selected_stolen_btn = [None]
 
                 # Row 0: Display turnover message.
-                ttk.Label(to_frame, text=f"Turnover by {player['Last_Name']}").pack(padx=5, pady=5)
+                ttk.Label(to_frame, text=f"Turnover by {player.last_Name}").pack(padx=5, pady=5)
 
                 # Row 1: Ask if the turnover was stolen.
                 stolen_q_frame = ttk.Frame(stolen_frame)
@@ -1549,18 +1497,17 @@ class MainMenu(tk.Tk):
                     btn_frame = ttk.Frame(stolen_target_frame)
                     btn_frame.pack()
                     # Determine opposing team: if turnover by a home player then opponents are from away, else home.
-                    turnover_team = player.get("TeamID")
+                    turnover_team = player.team_ID
                     opposing_team = away_team_id if turnover_team == home_team_id else home_team_id
                     # Filter opponents among on-court players.
-                    opponents = [p for p in self.test_data.db["Players"]
-                                 if p["PlayerID"] in self.currentLineup and p.get("TeamID") == opposing_team][:5]
+                    opponents = self.on_court.on_court(opposing_team)
                     col = 0
                     for opp in opponents:
-                        img = self.generate_jersey_image(opp["Jersey_Number"])
-                        bg_color = "lightblue" if opp.get("TeamID") == home_team_id else "lightpink"
+                        img = self.generate_jersey_image(opp.jersey_Number)
+                        bg_color = "lightblue" if opp.team_ID == home_team_id else "lightpink"
                         btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg_color)
                         btn.image = img
-                        btn.config(command=lambda pid=opp["PlayerID"], b=btn: make_stolen_select(pid, b))
+                        btn.config(command=lambda pid=opp.player_ID, b=btn: make_stolen_select(pid, b))
                         btn.grid(row=0, column=col, padx=5, pady=2)
                         col += 1
                     update_submit()
@@ -1585,13 +1532,16 @@ class MainMenu(tk.Tk):
                     ttk.Button(submit_frame, text="Submit", command=lambda: submit_turnover()).grid(row=0, column=0,
                                                                                                     padx=5, pady=5)
 
+                @tracing.traced("submit_all", form=stat)
                 def submit_turnover():
                     game_id = self.selected_game_id
+                    updates = []
                     # Record the turnover for the player (they turned the ball over).
-                    self.test_data.update_player_stats(game_id, player["PlayerID"], "TO")
+                    updates.append((player.player_ID, "TO"))
                     # If the turnover was stolen, record a steal for the selected opponent.
                     if stolen_choice.get() == "yes" and stolen_by.get() != 0:
-                        self.test_data.update_player_stats(game_id, stolen_by.get(), "steal")
+                        updates.append((stolen_by.get(), "steal"))
+                    self.post_stat_updates(game_id, updates)
                     for widget in submit_frame.winfo_children():
                         widget.destroy()
                     ttk.Label(submit_frame, text="Turnover recorded.").grid(row=0, column=0, padx=5, pady=5)
@@ -1599,7 +1549,7 @@ class MainMenu(tk.Tk):
                 update_submit()
 
             case "Ast":
-                self.stat_detail_frame.config(text=f"Assist by {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Assist by {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
@@ -1629,15 +1579,13 @@ class MainMenu(tk.Tk):
                 assisted_frame.grid(row=next_row(), column=0, pady=5)
                 btn_frame = ttk.Frame(assisted_frame)
                 btn_frame.pack(padx=5, pady=5)
-                teammates = [p for p in self.test_data.db["Players"]
-                             if p["PlayerID"] in self.currentLineup and p.get("TeamID") == player.get("TeamID")
-                             and p["PlayerID"] != player["PlayerID"]][:4]
+                teammates = self.on_court.teammates_of(player.player_ID)
                 for col, mate in enumerate(teammates):
-                    img = self.generate_jersey_image(mate["Jersey_Number"])
-                    bg_color = "lightblue" if mate.get("TeamID") == player.get("TeamID") else "lightpink"
+                    img = self.generate_jersey_image(mate.jersey_Number)
+                    bg_color = "lightblue" if mate.team_ID == player.team_ID else "lightpink"
                     btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg_color)
                     btn.image = img
-                    btn.config(command=lambda pid=mate["PlayerID"], b=btn: make_assist_select(pid, b))
+                    btn.config(command=lambda pid=mate.player_ID, b=btn: make_assist_select(pid, b))
                     btn.grid(row=0, column=col, padx=5, pady=2)
 
                 def make_assist_select(pid, btn):
@@ -1731,18 +1679,21 @@ class MainMenu(tk.Tk):
                         ttk.Button(submit_frame, text="Submit", command=submit_assist).grid(row=0, column=0, padx=5,
                                                                                             pady=5)
 
+                @tracing.traced("submit_all", form=stat)
                 def submit_assist():
                     game_id = self.selected_game_id
-                    self.test_data.update_player_stats(game_id, player["PlayerID"], "assist")
+                    updates = []
+                    updates.append((player.player_ID, "assist"))
                     if shot_type_choice.get() == "2":
-                        self.test_data.update_player_stats(game_id, assisted_player.get(), "2pt_make")
+                        updates.append((assisted_player.get(), "2pt_make"))
                     elif shot_type_choice.get() == "3":
-                        self.test_data.update_player_stats(game_id, assisted_player.get(), "3pt_make")
+                        updates.append((assisted_player.get(), "3pt_make"))
                     if foul_choice.get() == "yes":
                         if free_throw_result.get() == "made":
-                            self.test_data.update_player_stats(game_id, assisted_player.get(), "ft_make")
+                            updates.append((assisted_player.get(), "ft_make"))
                         elif free_throw_result.get() == "missed":
-                            self.test_data.update_player_stats(game_id, assisted_player.get(), "ft_miss")
+                            updates.append((assisted_player.get(), "ft_miss"))
+                    self.post_stat_updates(game_id, updates)
                     for widget in submit_frame.winfo_children():
                         widget.destroy()
                     ttk.Label(submit_frame, text="Assist recorded.").grid(row=0, column=0, padx=5, pady=5)
@@ -1751,7 +1702,7 @@ class MainMenu(tk.Tk):
                 update_submit()
 
             case "Blk":
-                self.stat_detail_frame.config(text=f"Block by {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Block by {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
 
@@ -1759,9 +1710,9 @@ class MainMenu(tk.Tk):
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
 
                 # Retrieve game record for team info.
-                game_rec = next((g for g in self.test_data.db["Games"] if g["GameID"] == self.selected_game_id), {})
-                home_team_id = game_rec.get("HomeTeamID", None)
-                away_team_id = game_rec.get("AwayTeamID", None)
+                game_rec = self._game_record()
+                home_team_id = game_rec.home_ID if game_rec else None
+                away_team_id = game_rec.away_ID if game_rec else None
 
                 # Create persistent frames.
                 block_prompt_frame = ttk.Frame(self.stat_detail_frame)
@@ -1779,26 +1730,25 @@ class MainMenu(tk.Tk):
                 selected_blocked_btn = [None]
 
                 # Row 0: Header.
-                ttk.Label(block_prompt_frame, text=f"Block by {player['Last_Name']}").pack(padx=5, pady=5)
+                ttk.Label(block_prompt_frame, text=f"Block by {player.last_Name}").pack(padx=5, pady=5)
 
                 # Row 1: Ask which opponent was blocked.
                 ttk.Label(target_frame, text="Who did you block?").pack(padx=5, pady=5)
                 btn_frame = ttk.Frame(target_frame)
                 btn_frame.pack(padx=5, pady=5)
                 # Determine opposing team: if defender's team is home, then opposing team is away; else home.
-                defender_team = player.get("TeamID")
+                defender_team = player.team_ID
                 opposing_team = away_team_id if defender_team == home_team_id else home_team_id
                 # Get up to five opponents from current on‑court players.
-                opponents = [p for p in self.test_data.db["Players"]
-                             if p["PlayerID"] in self.currentLineup and p.get("TeamID") == opposing_team][:5]
+                opponents = self.on_court.on_court(opposing_team)
                 col = 0
                 for opp in opponents:
-                    img = self.generate_jersey_image(opp["Jersey_Number"])
+                    img = self.generate_jersey_image(opp.jersey_Number)
                     # Color-code: use lightblue if opponent is on the home team; otherwise lightpink.
-                    bg_color = "lightblue" if opp.get("TeamID") == home_team_id else "lightpink"
+                    bg_color = "lightblue" if opp.team_ID == home_team_id else "lightpink"
                     btn = tk.Button(btn_frame, image=img, relief="raised", borderwidth=2, bg=bg_color)
                     btn.image = img
-                    btn.config(command=lambda pid=opp["PlayerID"], b=btn: make_blocked_select(pid, b))
+                    btn.config(command=lambda pid=opp.player_ID, b=btn: make_blocked_select(pid, b))
                     btn.grid(row=0, column=col, padx=5, pady=2)
                     col += 1
 
@@ -1830,16 +1780,19 @@ class MainMenu(tk.Tk):
                     ttk.Button(submit_frame, text="Submit", command=lambda: submit_block()).grid(row=0, column=0,
                                                                                                  padx=5, pady=5)
 
+                @tracing.traced("submit_all", form=stat)
                 def submit_block():
                     game_id = self.selected_game_id
+                    updates = []
                     # Record the block for the defending player.
-                    self.test_data.update_player_stats(game_id, player["PlayerID"], "block")
+                    updates.append((player.player_ID, "block"))
                     # If an opponent was selected and shot type is chosen, update that opponent's stat with a missed shot.
                     if blocked_player.get() != 0:
                         if shot_type_choice.get() == "2":
-                            self.test_data.update_player_stats(game_id, blocked_player.get(), "2pt_miss")
+                            updates.append((blocked_player.get(), "2pt_miss"))
                         elif shot_type_choice.get() == "3":
-                            self.test_data.update_player_stats(game_id, blocked_player.get(), "3pt_miss")
+                            updates.append((blocked_player.get(), "3pt_miss"))
+                    self.post_stat_updates(game_id, updates)
                     for widget in submit_frame.winfo_children():
                         widget.destroy()
                     ttk.Label(submit_frame, text="Block recorded.").grid(row=0, column=0, padx=5, pady=5)
@@ -1847,7 +1800,7 @@ class MainMenu(tk.Tk):
                 update_submit()
 
             case "Foul":
-                self.stat_detail_frame.config(text=f"Foul for {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Foul for {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
@@ -1914,19 +1867,18 @@ class MainMenu(tk.Tk):
                 frame_opp_btn = ttk.Frame(frame_opp)
                 frame_opp_btn.pack(padx=5, pady=5)
                 selected_opp_btn = [None]
-                shooter_team = player.get("TeamID")
-                game_rec = next((g for g in self.test_data.db["Games"] if g["GameID"] == self.selected_game_id), {})
-                home_team = game_rec.get("HomeTeamID")
-                away_team = game_rec.get("AwayTeamID")
+                shooter_team = player.team_ID
+                game_rec = self._game_record()
+                home_team = game_rec.home_ID if game_rec else None
+                away_team = game_rec.away_ID if game_rec else None
                 opposing_team = away_team if shooter_team == home_team else home_team
-                opponents = [p for p in self.test_data.db["Players"]
-                             if p["PlayerID"] in self.currentLineup and p.get("TeamID") == opposing_team][:5]
+                opponents = self.on_court.on_court(opposing_team)
                 for col, opp in enumerate(opponents):
-                    img = self.generate_jersey_image(opp["Jersey_Number"])
-                    bg = "lightblue" if opp.get("TeamID") == home_team else "lightpink"
+                    img = self.generate_jersey_image(opp.jersey_Number)
+                    bg = "lightblue" if opp.team_ID == home_team else "lightpink"
                     btn = tk.Button(frame_opp_btn, image=img, relief="raised", borderwidth=2, bg=bg)
                     btn.image = img
-                    btn.config(command=lambda pid=opp["PlayerID"], b=btn: select_opp(pid, b))
+                    btn.config(command=lambda pid=opp.player_ID, b=btn: select_opp(pid, b))
                     btn.grid(row=0, column=col, padx=5, pady=2)
 
                 def select_opp(pid, btn):
@@ -2068,20 +2020,23 @@ class MainMenu(tk.Tk):
                             ttk.Button(frame_submit, text="Submit", command=submit_foul).grid(row=0, column=0, padx=5,
                                                                                               pady=5)
 
+                @tracing.traced("submit_all", form=stat)
                 def submit_foul():
                     game_id = self.selected_game_id
-                    self.test_data.update_player_stats(game_id, player["PlayerID"], "foul")
+                    updates = []
+                    updates.append((player.player_ID, "foul"))
                     if fouled_player.get() != 0:
-                        self.test_data.update_player_stats(game_id, fouled_player.get(), "fouled")
+                        updates.append((fouled_player.get(), "fouled"))
                     if shooting_foul.get() == "yes":
                         if shot_made.get() == "made":
                             if free_throw_made.get() == "made":
-                                self.test_data.update_player_stats(game_id, fouled_player.get(), "ft_make")
+                                updates.append((fouled_player.get(), "ft_make"))
                             elif free_throw_made.get() == "missed":
-                                self.test_data.update_player_stats(game_id, fouled_player.get(), "ft_miss")
+                                updates.append((fouled_player.get(), "ft_miss"))
                         elif shot_made.get() == "missed":
                             made_ft = int(free_throws_made.get())
-                            self.test_data.update_player_stats(game_id, fouled_player.get(), f"ft_make_{made_ft}")
+                            updates.append((fouled_player.get(), f"ft_make_{made_ft}"))
+                    self.post_stat_updates(game_id, updates)
                     for widget in frame_submit.winfo_children():
                         widget.destroy()
                     ttk.Label(frame_submit, text="Foul recorded.").grid(row=0, column=0, padx=5, pady=5)
@@ -2091,7 +2046,7 @@ class MainMenu(tk.Tk):
                 update_shooting_foul()
 
             case "Reb":
-                self.stat_detail_frame.config(text=f"Rebound for {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Rebound for {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
@@ -2105,15 +2060,16 @@ class MainMenu(tk.Tk):
                 ttk.Button(confirm_frame, text="Record Rebound",
                            command=lambda: record_rebound(player)).pack(padx=5, pady=5)
 
+                @tracing.traced("submit_all", form=stat)
                 def record_rebound(p):
                     game_id = self.selected_game_id
-                    self.test_data.update_player_stats(game_id, p["PlayerID"], "rebound")
+                    self.post_stat_updates(game_id, [(p.player_ID, "rebound")])
                     for widget in self.stat_detail_frame.winfo_children():
                         widget.destroy()
                     ttk.Label(self.stat_detail_frame, text="Rebound recorded.").pack(padx=5, pady=5)
 
             case "FT":
-                self.stat_detail_frame.config(text=f"Free Throw for {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Free Throw for {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
                 self.stat_detail_frame.grid_columnconfigure(0, weight=1)
@@ -2126,12 +2082,15 @@ class MainMenu(tk.Tk):
                         ttk.Button(ft_submit_frame, text="Record Free Throw",
                                    command=lambda: record_free_throw(player, ft_choice.get())).pack(padx=5, pady=5)
 
+                @tracing.traced("submit_all", form=stat)
                 def record_free_throw(p, result):
                     game_id = self.selected_game_id
+                    updates = []
                     if result == "made":
-                        self.test_data.update_player_stats(game_id, p["PlayerID"], "ft_make")
+                        updates.append((p.player_ID, "ft_make"))
                     else:
-                        self.test_data.update_player_stats(game_id, p["PlayerID"], "ft_miss")
+                        updates.append((p.player_ID, "ft_miss"))
+                    self.post_stat_updates(game_id, updates)
                     for widget in self.stat_detail_frame.winfo_children():
                         widget.destroy()
                     ttk.Label(self.stat_detail_frame, text="Free throw recorded.").pack(padx=5, pady=5)
@@ -2153,21 +2112,20 @@ class MainMenu(tk.Tk):
                 ft_submit_frame.grid(row=2, column=0, pady=5)
 
             case "jersey":
-                self.stat_detail_frame.config(text=f"Substitution for {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Substitution for {player.last_Name}")
                 for widget in self.stat_detail_frame.winfo_children():
                     widget.destroy()
 
                 # Retrieve the game record for team info.
-                game_rec = next((g for g in self.test_data.db["Games"] if g["GameID"] == self.selected_game_id), {})
-                home_team_id = game_rec.get("HomeTeamID", None)
-                away_team_id = game_rec.get("AwayTeamID", None)
+                game_rec = self._game_record()
+                home_team_id = game_rec.home_ID if game_rec else None
+                away_team_id = game_rec.away_ID if game_rec else None
                 _htid = home_team_id  # capture locally for lambda use
 
                 # Determine the team of the current on-court player (being substituted out).
-                team_id = player.get("TeamID")
+                team_id = player.team_ID
                 # Get bench players for that team.
-                bench_list = self.bench.get(team_id, [])
-                bench_players = [p for p in self.test_data.db["Players"] if p["PlayerID"] in bench_list]
+                bench_players = self.on_court.bench(team_id)
                 if not bench_players:
                     ttk.Label(self.stat_detail_frame, text="No bench players available for substitution.").pack(padx=5, pady=5)
                     return
@@ -2195,14 +2153,14 @@ class MainMenu(tk.Tk):
                     col = index % 2
                     bp_frame = ttk.Frame(bench_frame)
                     bp_frame.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
-                    img = self.generate_jersey_image(bench_player["Jersey_Number"])
+                    img = self.generate_jersey_image(bench_player.jersey_Number)
                     # Color code background: lightblue for home, lightpink for away.
-                    bg_color = "lightblue" if bench_player.get("TeamID") == team_id and team_id == _htid else "lightpink"
+                    bg_color = "lightblue" if bench_player.team_ID == team_id and team_id == _htid else "lightpink"
                     btn = tk.Button(bp_frame, image=img, relief="raised", borderwidth=2, bg=bg_color)
                     btn.image = img
-                    btn.config(command=lambda pid=bench_player["PlayerID"], b=btn: make_sub_select(pid, b))
+                    btn.config(command=lambda pid=bench_player.player_ID, b=btn: make_sub_select(pid, b))
                     btn.pack(side="left", padx=5)
-                    info = f"{bench_player['Last_Name']}\n({bench_player['Position']})"
+                    info = f"{bench_player.last_Name}\n({bench_player.position_ID})"
                     ttk.Label(bp_frame, text=info).pack(side="left", padx=5)
 
                 # Create a submit button.
@@ -2216,31 +2174,57 @@ class MainMenu(tk.Tk):
                         ttk.Label(self.stat_detail_frame, text="Please select a bench player.").pack(padx=5, pady=5)
                         return
 
-                    # Swap the on-court player with the selected bench player in self.currentLineup.
+                    # The bench player takes the on-court player's slot; they go to the bench.
                     try:
-                        idx = self.currentLineup.index(player["PlayerID"])
-                        self.currentLineup[idx] = sub_in_id
-                    except ValueError:
-                        self.currentLineup.append(sub_in_id)
-
-                    # Update the bench array: remove the incoming player and add the outgoing one.
-                    if team_id in self.bench:
-                        if sub_in_id in self.bench[team_id]:
-                            self.bench[team_id].remove(sub_in_id)
-                        if player["PlayerID"] not in self.bench[team_id]:
-                            self.bench[team_id].append(player["PlayerID"])
+                        self.on_court.substitute(player.player_ID, sub_in_id)
+                    except ValueError as e:
+                        log.error("Substitution failed: %s", e)
+                        return
 
                     # Now, instead of updating only the affected row,
-                    # refresh the game UI using the new update_game_ui_with_lineup method.
-                    self.test_data.update_game_ui_with_lineup(self.currentLineup, self.bench)
+                    # refresh the game UI from the new lineup.
+                    self.update_game_ui_with_lineup(self.on_court)
 
                 # End of substitution case (no break statement)
 
             case _:
-                self.stat_detail_frame.config(text=f"Stat '{stat}' for {player['Last_Name']}")
+                self.stat_detail_frame.config(text=f"Stat '{stat}' for {player.last_Name}")
                 ttk.Label(self.stat_detail_frame, text=f"Form placeholder for {stat}").pack(padx=5, pady=5)
 
 
+def make_backend(name, db_path=None):
+    """
+    "local" -> LocalAPI served from fake_database.json (or db_path), "real" -> None
+    (MainMenu then starts the ASP.NET API and uses RealAPI).
+    """
+    if name == "local":
+        from local_backend import LocalAPI, DEFAULT_DB_PATH
+        return LocalAPI(db_path or DEFAULT_DB_PATH)
+    if name == "real":
+        return None
+    raise ValueError(f"Unknown backend '{name}' (use 'real' or 'local')")
+
+
 if __name__ == '__main__':
-    app = MainMenu()
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Basketball Manager")
+    arg_parser.add_argument("--backend", choices=["real", "local"], default=os.environ.get("GOB_BACKEND", "real"),
+                            help="'local' runs on fake_database.json without .NET/SQL Server (env: GOB_BACKEND)")
+    arg_parser.add_argument("--db", default=os.environ.get("GOB_DB"),
+                            help="JSON file for the local backend (env: GOB_DB)")
+    arg_parser.add_argument("--log-level", default=None,
+                            help="DEBUG, INFO, WARNING or ERROR (env: GOB_LOG_LEVEL, default INFO)")
+    arg_parser.add_argument("--log", default=None, metavar="MODULE=LEVEL,...",
+                            help="per-module levels, e.g. Real_API=DEBUG,gob_ui=WARNING (env: GOB_LOG_MODULES)")
+    arg_parser.add_argument("--log-ring", type=int, default=None, metavar="N",
+                            help="keep the last N log lines in memory, dumped to gob_log_dump.txt when a UI "
+                                 "callback crashes (env: GOB_LOG_RING)")
+    arg_parser.add_argument("--trace-dump", default=os.environ.get("GOB_TRACE_DUMP"), metavar="PATH",
+                            help="on exit, write the request/UI trace there: Prometheus text for .prom/.txt, "
+                                 "JSON otherwise (env: GOB_TRACE_DUMP)")
+    args = arg_parser.parse_args()
+    gob_log.configure(level=args.log_level, modules=args.log, ring=args.log_ring)
+
+    app = MainMenu(backend=make_backend(args.backend, args.db), trace_dump=args.trace_dump)
     app.mainloop()
@@ -0,0 +1,338 @@
+import heapq
+import itertools
+import sys
+import time
+import types
+
+# Colour names the UI passes to winfo_rgb(), as 16-bit (r, g, b) like Tk answers
+_COLOURS = {"white": (65535, 65535, 65535), "black": (0, 0, 0), "#dcdad5": (56540, 55998, 54741)}
+
+
+class TclError(Exception):
+    pass
+
+
+class _FakeInterp:
+    """Stands in for the Tcl interpreter: every command "succeeds" and does nothing."""
+
+    def call(self, *args):
+        return ""
+
+    def interpaddr(self):
+        return 0
+
+
+class _Widget:
+    """
+    Any Tk / ttk widget. Takes every option, remembers the last value set for each
+    (cget works), keeps track of children and whether it is packed / gridded, and
+    counts configure calls - enough for the UI code to run and for benchmarks to see
+    how much widget work a path does.
+    """
+
+    configures = 0  # across all widgets
+
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.tk = master.tk if master is not None else _FakeInterp()
+        self._options = dict(options)
+        self._children = []
+        self._mapped = False
+        self._bindings = {}
+        if master is not None:
+            master._children.append(self)
+
+    # options
+    def configure(self, cnf=None, **options):
+        if cnf:
+            options.update(cnf)
+        _Widget.configures += 1
+        self._options.update(options)
+
+    config = configure
+
+    def cget(self, key):
+        return self._options.get(key, "")
+
+    def __setitem__(self, key, value):
+        self.configure(**{key: value})
+
+    def __getitem__(self, key):
+        return self.cget(key)
+
+    # geometry
+    def pack(self, *args, **options):
+        self._mapped = True
+
+    grid = place = pack
+
+    def pack_forget(self):
+        self._mapped = False
+
+    grid_forget = place_forget = pack_forget
+
+    def pack_propagate(self, *args):
+        pass
+
+    grid_propagate = pack_propagate
+
+    def grid_columnconfigure(self, *args, **options):
+        pass
+
+    columnconfigure = rowconfigure = grid_rowconfigure = grid_columnconfigure
+
+    def winfo_ismapped(self):
+        return self._mapped
+
+    def winfo_children(self):
+        return list(self._children)
+
+    def winfo_reqwidth(self):
+        return int(self._options.get("width") or 275)
+
+    def winfo_width(self):
+        return self.winfo_reqwidth()
+
+    def winfo_height(self):
+        return int(self._options.get("height") or 700)
+
+    def winfo_rgb(self, colour):
+        return _COLOURS.get(str(colour).lower(), (56540, 55998, 54741))
+
+    def destroy(self):
+        for child in list(self._children):
+            child.destroy()
+        if self.master is not None and self in self.master._children:
+            self.master._children.remove(self)
+
+    # events
+    def bind(self, sequence=None, func=None, add=None):
+        self._bindings[sequence] = func
+
+    bind_all = bind
+
+    def unbind(self, sequence, funcid=None):
+        self._bindings.pop(sequence, None)
+
+    unbind_all = unbind
+
+    def focus_set(self):
+        pass
+
+    def state(self, statespec=None):
+        return ()
+
+    # the odd per-widget method the UI calls
+    def insert(self, *args):
+        pass
+
+    def delete(self, *args):
+        pass
+
+    def get(self):
+        return self._options.get("value", "")
+
+    def set(self, *args):
+        pass
+
+    def add(self, child, **options):
+        pass
+
+    def tab(self, tab_id, option=None, **options):
+        return ""
+
+    def select(self, *args):
+        return ""
+
+    def yview(self, *args):
+        return (0.0, 1.0)
+
+
+class Canvas(_Widget):
+    """A canvas that knows its scroll position and items, for VirtualScheduleList."""
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self._items = {}
+        self._ids = itertools.count(1)
+        self._top = 0.0
+
+    def create_window(self, *coords, **options):
+        item = next(self._ids)
+        self._items[item] = dict(options, coords=coords)
+        return item
+
+    create_image = create_text = create_rectangle = create_window
+
+    def coords(self, item, *coords):
+        self._items[item]["coords"] = coords
+
+    def itemconfigure(self, item, **options):
+        _Widget.configures += 1
+        self._items[item].update(options)
+
+    def canvasy(self, y):
+        return self._top + y
+
+    def yview_moveto(self, fraction):
+        region = self._options.get("scrollregion") or (0, 0, 0, 0)
+        self._top = fraction * region[3]
+
+    def yview_scroll(self, number, what):
+        self._top = max(0.0, self._top + number * float(self._options.get("yscrollincrement") or 1))
+
+    def delete(self, *items):
+        for item in items:
+            if item == "all":
+                self._items.clear()
+            else:
+                self._items.pop(item, None)
+
+
+class Tk(_Widget):
+    """
+    The root window. after() / after_idle() callbacks run from update() once they
+    are due - there is no event loop, the caller pumps it (see benchmark.pump).
+    """
+
+    def __init__(self, *args, **options):
+        super().__init__(None)
+        self._timers = []  # heap of (due, seq, after_id)
+        self._callbacks = {}  # after_id -> (fn, args)
+        self._seq = itertools.count(1)
+
+    def after(self, ms, func=None, *args):
+        after_id = f"after#{next(self._seq)}"
+        self._callbacks[after_id] = (func, args)
+        heapq.heappush(self._timers, (time.monotonic() + ms / 1000.0, next(self._seq), after_id))
+        return after_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self._callbacks.pop(after_id, None)
+
+    def update(self):
+        """Runs every callback that is due by now."""
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, after_id = heapq.heappop(self._timers)
+            entry = self._callbacks.pop(after_id, None)
+            if entry is not None:
+                func, args = entry
+                try:
+                    func(*args)
+                except Exception:
+                    self.report_callback_exception(*sys.exc_info())
+
+    update_idletasks = update
+
+    def report_callback_exception(self, exc, val, tb):
+        raise val
+
+    def mainloop(self, n=0):
+        pass
+
+    def title(self, *args):
+        pass
+
+    def geometry(self, *args):
+        pass
+
+    def minsize(self, *args):
+        pass
+
+    def protocol(self, *args):
+        pass
+
+    def iconbitmap(self, *args):
+        pass
+
+    def iconphoto(self, *args):
+        pass
+
+    def withdraw(self):
+        pass
+
+
+class PhotoImage:
+    _names = itertools.count(1)
+
+    def __init__(self, name=None, cnf=None, master=None, **options):
+        self.name = name or f"pyimage{next(self._names)}"
+        self.tk = master.tk if master is not None else _FakeInterp()
+        self._options = options
+
+    def __str__(self):
+        return self.name
+
+    def width(self):
+        return int(self._options.get("width", 0))
+
+    def height(self):
+        return int(self._options.get("height", 0))
+
+
+class _Variable:
+    def __init__(self, master=None, value=None, name=None):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+class Style:
+    def __init__(self, master=None):
+        pass
+
+    def theme_use(self, name=None):
+        return "clam"
+
+    def configure(self, style, query_opt=None, **options):
+        pass
+
+    def map(self, style, query_opt=None, **options):
+        pass
+
+    def lookup(self, style, option, state=None, default=None):
+        return "#dcdad5"
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+def install():
+    """
+    Puts this fake tkinter (with ttk and messagebox) into sys.modules, so the UI's
+    modules import it instead of the real one and run without a display. Has to run
+    before gob_ui, game_details_view, schedule_view, jersey_cache or PIL.ImageTk
+    are imported. Returns False if the real tkinter was already imported.
+
+    Nothing is drawn: widgets only keep their options. Everything around them -
+    the data paths, PIL rendering, the network worker's after() polling - is real.
+    """
+    if "tkinter" in sys.modules and not getattr(sys.modules["tkinter"], "HEADLESS", False):
+        return False
+    widgets = {name: type(name, (_Widget,), {}) for name in (
+        "Frame", "Label", "Button", "Scrollbar", "Notebook", "Combobox", "Entry", "LabelFrame",
+        "Radiobutton", "Checkbutton", "Spinbox", "Toplevel", "Listbox", "Text")}
+    ttk = _module("tkinter.ttk", Style=Style, **widgets)
+    messagebox = _module("tkinter.messagebox", **{name: (lambda *args, **options: None) for name in (
+        "showerror", "showinfo", "showwarning", "askyesno", "askokcancel")})
+    tkinter = _module("tkinter", HEADLESS=True, TclError=TclError, Tk=Tk, Canvas=Canvas, PhotoImage=PhotoImage,
+                      StringVar=_Variable, IntVar=_Variable, BooleanVar=_Variable, DoubleVar=_Variable,
+                      TkVersion=8.6, ttk=ttk, messagebox=messagebox, **widgets)
+    sys.modules.update({"tkinter": tkinter, "tkinter.ttk": ttk, "tkinter.messagebox": messagebox})
+    return True
+
+
+def widget_configures():
+    """configure() / itemconfigure() calls made on fake widgets so far."""
+    return _Widget.configures
@@ -0,0 +1,132 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+
+from gob_log import get_logger
+
+log = get_logger("jersey_cache")
+
+HIGHLIGHT_COLOR = (30, 144, 255, 255)
+
+
+class JerseyRenderer:
+    """
+    Renders the little numbered jersey icons used all over the game tab, and caches them.
+
+      - Jersey.png is decoded and resized once
+      - every icon is cached by (number, background colour, highlight), so rebuilding
+        a lineup or reopening a stat form reuses the same PhotoImage objects
+      - build_atlas() pre-renders 0-99 into one sprite sheet (one PIL image, one
+        transfer to Tk); icons for those numbers are then cut out of the sheet by Tk
+        itself, without any new PIL images
+
+    Must be used from the Tk thread (PhotoImages belong to the Tk interpreter).
+    """
+
+    def __init__(self, root, path, size=32):
+        self.root = root
+        self.path = path
+        self.size = size
+        self._base = None
+        self._base_failed = False
+        self._font = None
+        self._rgb = {}  # Tk colour name -> (r, g, b)
+        self._photos = {}  # (text, bg_rgb, highlight) -> PhotoImage
+        self._atlases = {}  # (bg_rgb, highlight) -> (atlas PhotoImage, columns)
+        self.hits = 0
+        self.renders = 0
+
+    def get(self, number, bg=None, highlight=False):
+        """
+        The jersey icon for a number, on bg (a Tk colour; default is the ttk frame
+        background), optionally with a highlight outline. None if Jersey.png is missing.
+        """
+        bg_rgb = self._bg_rgb(bg)
+        text = str(number)
+        key = (text, bg_rgb, highlight)
+        photo = self._photos.get(key)
+        if photo is not None:
+            self.hits += 1
+            return photo
+
+        atlas = self._atlases.get((bg_rgb, highlight))
+        if atlas is not None and text.isdigit() and text == str(int(text)) and int(text) < 100:
+            photo = self._cut_from_atlas(atlas, int(text))
+        else:
+            image = self._render(text, bg_rgb, highlight)
+            if image is None:
+                return None
+            photo = ImageTk.PhotoImage(image, master=self.root)
+        self._photos[key] = photo
+        return photo
+
+    def build_atlas(self, bg=None, highlight=False, columns=10):
+        """Pre-renders jerseys 0-99 on bg into one sprite sheet."""
+        bg_rgb = self._bg_rgb(bg)
+        if (bg_rgb, highlight) in self._atlases or self._base_image() is None:
+            return
+        rows = (100 + columns - 1) // columns
+        sheet = Image.new("RGBA", (columns * self.size, rows * self.size), (*bg_rgb, 255))
+        for n in range(100):
+            sheet.paste(self._render(str(n), bg_rgb, highlight), ((n % columns) * self.size, (n // columns) * self.size))
+        self._atlases[(bg_rgb, highlight)] = (ImageTk.PhotoImage(sheet, master=self.root), columns)
+
+    def stats(self):
+        return {"cached": len(self._photos), "hits": self.hits, "renders": self.renders,
+                "atlases": len(self._atlases)}
+
+    # ----------------
+    # INTERNALS
+    # ----------------
+    def _bg_rgb(self, bg):
+        if bg is None:
+            bg = ttk.Style(self.root).lookup('TFrame', 'background')
+        rgb = self._rgb.get(bg)
+        if rgb is None:
+            r, g, b = self.root.winfo_rgb(bg)
+            rgb = self._rgb[bg] = (r // 256, g // 256, b // 256)
+        return rgb
+
+    def _base_image(self):
+        if self._base is None and not self._base_failed:
+            if not os.path.exists(self.path):
+                log.error("Jersey image not found at %s", self.path)
+                self._base_failed = True
+                return None
+            try:
+                self._base = Image.open(self.path).convert("RGBA").resize((self.size, self.size),
+                                                                           Image.Resampling.LANCZOS)
+            except Exception as e:
+                log.error("Error generating jersey image: %s", e)
+                self._base_failed = True
+                return None
+            self._font = ImageFont.load_default()
+        return self._base
+
+    def _render(self, text, bg_rgb, highlight):
+        base = self._base_image()
+        if base is None:
+            return None
+        self.renders += 1
+        image = Image.new("RGBA", base.size, (*bg_rgb, 255))
+        image.paste(base, (0, 0), base)
+        draw = ImageDraw.Draw(image)
+        bbox = draw.textbbox((0, 0), text, font=self._font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        x = (self.size - text_width) // 2
+        y = (self.size - text_height) // 2
+        draw.text((x, y), text, fill="black", font=self._font)
+        if highlight:
+            draw.rectangle((0, 0, self.size - 1, self.size - 1), outline=HIGHLIGHT_COLOR, width=2)
+        return image
+
+    def _cut_from_atlas(self, atlas, n):
+        sheet, columns = atlas
+        x0 = (n % columns) * self.size
+        y0 = (n // columns) * self.size
+        photo = tk.PhotoImage(master=self.root, width=self.size, height=self.size)
+        photo.tk.call(photo, "copy", str(sheet), "-from", x0, y0, x0 + self.size, y0 + self.size)
+        return photo
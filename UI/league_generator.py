@@ -0,0 +1,265 @@
+import argparse
+import json
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from league_json import FORMATS, write_tables
+
+# fake_database.json's stat columns, in file order
+STAT_COLUMNS = ("2ptMade", "2ptMiss", "3ptMade", "3ptMiss", "Steals", "Turnovers", "Assists", "Blocks",
+                "Fouls", "OffensiveRebounds", "DefensiveRebounds", "FreeThrowsMade", "FreeThrowsMissed")
+
+POSITIONS = ("PG", "SG", "SF", "PF", "C")
+
+# A team's per-game totals in a current NBA season. Makes come from attempts x a
+# per-player percentage, everything else is a Poisson count around these.
+TEAM_PER_GAME = {
+    "fg2a": 54.0, "fg3a": 35.0, "fta": 22.0,
+    "oreb": 10.5, "dreb": 33.0, "ast": 26.5, "stl": 8.0, "blk": 5.0, "tov": 13.5, "pf": 18.5,
+}
+LEAGUE_PCT = {"fg2": 0.54, "fg3": 0.36, "ft": 0.78}
+
+# How much of each stat a position takes compared to an average player (PG, SG, SF, PF, C)
+POSITION_SHARE = {
+    "fg2a": (0.90, 0.95, 1.00, 1.10, 1.15),
+    "fg3a": (1.30, 1.40, 1.10, 0.80, 0.35),
+    "fta": (1.00, 1.00, 1.00, 1.05, 1.10),
+    "oreb": (0.40, 0.50, 0.90, 1.50, 2.20),
+    "dreb": (0.60, 0.70, 0.95, 1.30, 1.80),
+    "ast": (2.20, 1.20, 0.90, 0.70, 0.60),
+    "stl": (1.30, 1.20, 1.00, 0.80, 0.70),
+    "blk": (0.40, 0.50, 0.90, 1.40, 2.50),
+    "tov": (1.50, 1.10, 0.90, 0.80, 0.90),
+    "pf": (0.80, 0.90, 1.00, 1.15, 1.30),
+}
+COUNTS = tuple(TEAM_PER_GAME)
+
+# Average minutes by depth-chart slot for the players who dress (starters first)
+DEPTH_MINUTES = (35, 34, 32, 31, 29, 24, 21, 18, 14, 10, 6, 3, 1)
+
+_FIRST_NAMES = ("James", "Marcus", "Tyrese", "Jalen", "Luka", "Devin", "Anthony", "Chris", "Kevin", "Darius",
+                "Malik", "Andre", "Isaiah", "Jaylen", "Tre", "Zion", "Myles", "Aaron", "Derrick", "Keldon")
+_LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Wilson",
+               "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Thompson", "White",
+               "Harris", "Clark", "Lewis", "Walker", "Young", "Allen", "King", "Wright", "Scott", "Green")
+_CITIES = ("Indiana", "San Antonio", "Boston", "Denver", "Phoenix", "Chicago", "Detroit", "Miami", "Memphis",
+           "Orlando", "Portland", "Sacramento", "Toronto", "Utah", "Atlanta", "Charlotte", "Dallas", "Houston")
+_NICKNAMES = ("Pacers", "Spurs", "Comets", "Hawks", "Rockets", "Wolves", "Bears", "Kings", "Storm", "Blaze",
+              "Tide", "Thunder", "Knights", "Falcons", "Lynx", "Owls", "Pilots", "Rangers")
+
+# Games generated per batch of random draws. Part of what a seed means: changing
+# it changes the stats a seed gives.
+_CHUNK = 256
+
+# One Stats row, formatted straight from the numbers (no dict / json.dumps per row)
+_STAT_ROW = ('{"StatID":%d,"PlayerID":%d,"GameID":"%s",'
+             + ",".join(f'"{column}":%d' for column in STAT_COLUMNS) + "}")
+
+
+class LeagueGenerator:
+    """
+    Builds a made-up league in fake_database.json's shape (the NBADatabase tables:
+    Teams, Games, Players, Stats) at any size, offline and reproducibly: the same
+    arguments and seed always give the same file.
+
+      teams            - number of teams
+      games            - total games (default: an 82-game season for every team)
+      roster / dressed - players per team, and how many of them play each game
+      seed             - fixes every name, jersey number, pairing and box score
+
+    Every table is an iterator (teams(), players(), games(), stats()) computed as it
+    goes, and write() streams them to a file record by record, so a season with
+    millions of stat rows never has to be in memory. Box scores are drawn around
+    TEAM_PER_GAME: minutes follow the depth chart, each stat is split by position
+    (centres rebound and block, guards assist and shoot threes), every player has
+    their own shooting percentages and usage, and makes are binomial over attempts.
+    """
+
+    def __init__(self, teams, games=None, roster=15, dressed=13, seed=0, start=datetime(2024, 10, 22, 23, 30)):
+        if teams < 2:
+            raise ValueError("A league needs at least 2 teams")
+        if dressed > roster or dressed > len(DEPTH_MINUTES):
+            raise ValueError(f"dressed must be at most roster and {len(DEPTH_MINUTES)}")
+        self.team_count = teams
+        self.game_count = teams * 82 // 2 if games is None else games
+        self.roster = roster
+        self.dressed = dressed
+        self.seed = seed
+        self.start = start
+
+        # One row per player: position and talent. Small (teams x roster), so kept.
+        rng = np.random.default_rng([seed, 0])
+        players = teams * roster
+        self._usage = rng.lognormal(0.0, 0.25, players)
+        self._pct = {
+            "fg2": np.clip(rng.normal(LEAGUE_PCT["fg2"], 0.04, players), 0.35, 0.70),
+            "fg3": np.clip(rng.normal(LEAGUE_PCT["fg3"], 0.04, players), 0.20, 0.48),
+            "ft": np.clip(rng.normal(LEAGUE_PCT["ft"], 0.07, players), 0.45, 0.95),
+        }
+        # Position share of each counting stat, per depth slot: (dressed, len(COUNTS))
+        slot_position = np.arange(dressed) % len(POSITIONS)
+        self._slot_share = np.array([[POSITION_SHARE[c][p] for c in COUNTS] for p in slot_position])
+
+    # ----------------
+    # TABLES
+    # ----------------
+    def teams(self):
+        rng = np.random.default_rng([self.seed, 1])
+        for t in range(1, self.team_count + 1):
+            city = _CITIES[int(rng.integers(len(_CITIES)))]
+            nickname = _NICKNAMES[int(rng.integers(len(_NICKNAMES)))]
+            yield {"TeamID": t, "Team_Name": f"{city} {nickname} {t}", "City": city}
+
+    def players(self):
+        rng = np.random.default_rng([self.seed, 2])
+        for t in range(1, self.team_count + 1):
+            jerseys = rng.choice(100, size=self.roster, replace=False)
+            for slot in range(self.roster):
+                yield {
+                    "PlayerID": self._player_id(t, slot),
+                    "TeamID": t,
+                    "First_Name": _FIRST_NAMES[int(rng.integers(len(_FIRST_NAMES)))],
+                    "Last_Name": _LAST_NAMES[int(rng.integers(len(_LAST_NAMES)))],
+                    "Position": POSITIONS[slot % len(POSITIONS)],
+                    "Jersey_Number": int(jerseys[slot]),
+                }
+
+    def games(self):
+        for number, (home, away, day) in enumerate(self._schedule()):
+            yield {"GameID": _game_id(number), "HomeTeamID": home, "AwayTeamID": away,
+                   "GameDate": (self.start + timedelta(days=day)).strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+    def stats(self):
+        """The Stats rows as dicts (see stat_lines() for the fast path write() uses)."""
+        for line in self.stat_lines():
+            yield json.loads(line)
+
+    def stat_lines(self):
+        """Every Stats row as a compact JSON object string, game by game."""
+        stat_id = 1
+        schedule = self._schedule()
+        chunk_number = 0
+        while True:
+            chunk = [pair for _, pair in zip(range(_CHUNK), schedule)]
+            if not chunk:
+                return
+            box = self._box_scores(chunk, np.random.default_rng([self.seed, 3, chunk_number]))
+            for g, (home, away, _) in enumerate(chunk):
+                game_id = _game_id(chunk_number * _CHUNK + g)
+                for side, team in enumerate((home, away)):
+                    for slot in range(self.dressed):
+                        yield _STAT_ROW % ((stat_id, self._player_id(team, slot), game_id)
+                                           + tuple(box[g, side, slot].tolist()))
+                        stat_id += 1
+            chunk_number += 1
+
+    def sizes(self):
+        """Row counts of the four tables, without generating them."""
+        return {"Teams": self.team_count, "Games": self.game_count, "Players": self.team_count * self.roster,
+                "Stats": self.game_count * 2 * self.dressed}
+
+    # ----------------
+    # OUTPUT
+    # ----------------
+    def write(self, path, format="compact"):
+        """
+        Streams the league to path in fake_database.json's layout (LocalAPI and the
+        benchmarks load it as is). format is any of league_json's. Returns sizes().
+        """
+        write_tables(path, (
+            ("Teams", self.teams()),
+            ("Games", self.games()),
+            ("Players", self.players()),
+            ("Stats", self.stat_lines())), format=format)
+        return self.sizes()
+
+    # ----------------
+    # INTERNALS
+    # ----------------
+    def _player_id(self, team, slot):
+        return (team - 1) * self.roster + slot + 1
+
+    def _schedule(self):
+        """
+        (home, away, day) for every game: round robin by the circle method, one
+        round a day, repeated until game_count games. The team with fewer home
+        games so far gets the home game, so home and away come out even.
+        """
+        slots = self.team_count + (self.team_count % 2)  # an odd league gets a bye
+        rounds = slots - 1
+        home_games = [0] * (self.team_count + 1)
+        made = 0
+        day = 0
+        while made < self.game_count:
+            r = day % rounds
+            order = [0] + [1 + (k + r) % rounds for k in range(rounds)]
+            for j in range(slots // 2):
+                a, b = order[j] + 1, order[slots - 1 - j] + 1
+                if a > self.team_count or b > self.team_count:
+                    continue
+                if home_games[b] < home_games[a] or (home_games[b] == home_games[a] and (day + j) % 2):
+                    a, b = b, a
+                home_games[a] += 1
+                yield a, b, day
+                made += 1
+                if made == self.game_count:
+                    return
+            day += 1
+
+    def _box_scores(self, chunk, rng):
+        """Stat columns for a batch of games: int array (games, 2 teams, dressed, len(STAT_COLUMNS))."""
+        games = len(chunk)
+        teams = np.array([[home, away] for home, away, _ in chunk])
+        slots = np.arange(self.dressed)
+        player_index = (teams[:, :, None] - 1) * self.roster + slots  # (games, 2, dressed)
+
+        # Minutes: the depth chart, give or take, always 240 a team
+        minutes = np.array(DEPTH_MINUTES[:self.dressed], dtype=float) * rng.lognormal(0.0, 0.2, (games, 2, self.dressed))
+        minutes *= 240.0 / minutes.sum(axis=2, keepdims=True)
+        usage = self._usage[player_index]
+        # Each player's share of the team's count, per stat: (games, 2, dressed, counts)
+        weight = (minutes / 240.0)[..., None] * self._slot_share
+        shooting = [COUNTS.index(c) for c in ("fg2a", "fg3a", "fta")]
+        weight[..., shooting] *= usage[..., None]
+        weight /= weight.sum(axis=2, keepdims=True)
+        pace = rng.lognormal(0.0, 0.08, (games, 2, 1, 1))
+        counts = rng.poisson(weight * pace * np.array([TEAM_PER_GAME[c] for c in COUNTS]))
+        c = {name: counts[..., i] for i, name in enumerate(COUNTS)}
+
+        fg2m = rng.binomial(c["fg2a"], self._pct["fg2"][player_index])
+        fg3m = rng.binomial(c["fg3a"], self._pct["fg3"][player_index])
+        ftm = rng.binomial(c["fta"], self._pct["ft"][player_index])
+        columns = {
+            "2ptMade": fg2m, "2ptMiss": c["fg2a"] - fg2m,
+            "3ptMade": fg3m, "3ptMiss": c["fg3a"] - fg3m,
+            "Steals": c["stl"], "Turnovers": c["tov"], "Assists": c["ast"], "Blocks": c["blk"],
+            "Fouls": np.minimum(c["pf"], 6),
+            "OffensiveRebounds": c["oreb"], "DefensiveRebounds": c["dreb"],
+            "FreeThrowsMade": ftm, "FreeThrowsMissed": c["fta"] - ftm,
+        }
+        return np.stack([columns[column] for column in STAT_COLUMNS], axis=-1)
+
+
+def _game_id(number):
+    # Zero-padded like the NBA ids in fake_database.json ("0022400621")
+    return f"{number + 1:010d}"
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description="Writes a synthetic league in fake_database.json's format")
+    arg_parser.add_argument("--teams", type=int, default=30)
+    arg_parser.add_argument("--games", type=int, default=None, help="total games (default: 82 per team)")
+    arg_parser.add_argument("--roster", type=int, default=15, help="players per team")
+    arg_parser.add_argument("--dressed", type=int, default=13, help="players per team with a stat row each game")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--out", default="synthetic_league.json")
+    arg_parser.add_argument("--format", choices=FORMATS, default="compact")
+    args = arg_parser.parse_args()
+    try:
+        generator = LeagueGenerator(args.teams, args.games, roster=args.roster, dressed=args.dressed, seed=args.seed)
+    except ValueError as e:
+        arg_parser.error(str(e))
+    sizes = generator.write(args.out, format=args.format)
+    print(f"{os.path.abspath(args.out)}: " + ", ".join(f"{n} {table}" for table, n in sizes.items()))
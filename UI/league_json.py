@@ -0,0 +1,195 @@
+import json
+
+# The four NBADatabase tables, in the order they're written
+TABLES = ("Teams", "Games", "Players", "Stats")
+FORMATS = ("pretty", "compact", "ndjson")
+
+# What _scan() gives as the record when a table starts, so empty tables are seen too
+_TABLE_START = object()
+
+# First key of an NDJSON section line: {"_table": "Stats"} - the records after it belong to that table
+NDJSON_TABLE_KEY = "_table"
+
+_READ_SIZE = 1 << 16
+_WHITESPACE = " \t\r\n"
+
+
+def _encode(record, indent):
+    # Records may come pre-encoded (e.g. LeagueGenerator's stat rows); those are written as
+    # they are, unless they have to be indented like the rest of the file
+    if isinstance(record, str):
+        if not indent:
+            return record
+        record = json.loads(record)
+    if indent:
+        # nested two levels deep, inside {"Table": [ ... ]}
+        return json.dumps(record, indent=indent).replace("\n", "\n" + " " * indent * 2)
+    return json.dumps(record, separators=(",", ":"))
+
+
+def write_tables(path, tables, format="compact"):
+    """
+    Writes fake_database.json-style data - {"Teams": [...], "Games": [...], ...} - one
+    record at a time, so the tables can be generators and nothing is built up in memory.
+
+      tables - {table name: iterable of records} or (name, records) pairs, in file order.
+               A record is a dict, or a str that already holds its compact JSON
+               (decoded and re-indented for "pretty", so that one is slower).
+      format - "compact": one JSON document, one record per line, no indentation
+               "pretty":  one JSON document indented 4 spaces, the layout json.dump(..., indent=4) gives
+               "ndjson":  newline-delimited; a {"_table": name} line starts each table,
+                          then one record per line
+
+    Returns {table name: records written}. read_tables() / iter_table() read all three back.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format '{format}' (use one of {', '.join(FORMATS)})")
+    items = tables.items() if isinstance(tables, dict) else tables
+    counts = {}
+    indent = 4 if format == "pretty" else 0
+    with open(path, "w", encoding="utf-8") as f:
+        if format != "ndjson":
+            f.write("{")
+        for t, (table, records) in enumerate(items):
+            count = 0
+            if format == "ndjson":
+                f.write(json.dumps({NDJSON_TABLE_KEY: table}) + "\n")
+                for record in records:
+                    f.write(_encode(record, 0) + "\n")
+                    count += 1
+            else:
+                pad = " " * indent
+                f.write(f'{"," if t else ""}\n{pad}{json.dumps(table)}: [')
+                for record in records:
+                    f.write(f'{"," if count else ""}\n{pad * 2}{_encode(record, indent)}')
+                    count += 1
+                f.write(f"\n{pad}]" if count else "]")
+            counts[table] = count
+        if format != "ndjson":
+            f.write("\n}\n")
+    return counts
+
+
+class _Reader:
+    """
+    Pulls one JSON value at a time off a file, reading it in blocks: only the value
+    being decoded (and the rest of its block) is ever in memory.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self):
+        block = self.f.read(_READ_SIZE)
+        if not block:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + block
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """The next non-whitespace character ("" at the end of the file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Bad league file: expected '{char}', found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def value(self):
+        """Decodes the next value. Only used for objects and strings, which can't be cut short silently."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"Bad league file: {e.msg}") from None
+            self.pos = end
+            return value
+
+
+def iter_records(path):
+    """
+    (table, record) for every record in a league file, in file order, decoded one
+    at a time - memory stays flat however big the file is. Reads all three
+    write_tables() formats (and any json.dump of the same dict).
+    """
+    for table, record in _scan(path):
+        if record is not _TABLE_START:
+            yield table, record
+
+
+def _scan(path):
+    """iter_records(), plus a (table, _TABLE_START) as each table starts."""
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        if first.lstrip().startswith('{"' + NDJSON_TABLE_KEY + '"'):
+            yield from _iter_ndjson(first, f)
+            return
+        f.seek(0)
+        reader = _Reader(f)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            table = reader.value()
+            reader.expect(":")
+            reader.expect("[")
+            yield table, _TABLE_START
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield table, reader.value()
+                    if reader.peek() == "]":
+                        reader.pos += 1
+                        break
+                    reader.expect(",")
+            if reader.peek() == "}":
+                return
+            reader.expect(",")
+
+
+def _iter_ndjson(first, f):
+    table = json.loads(first)[NDJSON_TABLE_KEY]
+    yield table, _TABLE_START
+    for line in f:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if NDJSON_TABLE_KEY in record:
+            table = record[NDJSON_TABLE_KEY]
+            yield table, _TABLE_START
+            continue
+        yield table, record
+
+
+def iter_table(path, table):
+    """The records of one table, decoded lazily (the other tables are skipped past, not kept)."""
+    for name, record in iter_records(path):
+        if name == table:
+            yield record
+
+
+def read_tables(path):
+    """The whole file as {table: [records]} - what json.load gave, for any of the formats."""
+    tables = {}
+    for table, record in _scan(path):
+        rows = tables.setdefault(table, [])
+        if record is not _TABLE_START:
+            rows.append(record)
+    return tables
@@ -0,0 +1,187 @@
+import json
+import random
+import threading
+
+import requests
+
+from gob_log import get_logger
+from records import Stat
+
+log = get_logger("live_events")
+
+# The API sends ": ping" every 15 s on an idle stream, so no data for this long means it's dead.
+STREAM_READ_TIMEOUT = 45
+
+
+def parse_sse(lines):
+    """
+    Turns the lines of a text/event-stream response into (id, event, data) tuples.
+    Comment lines (": ping") are skipped; multi-line data is joined with newlines.
+    """
+    event_id, event, data = None, "message", []
+    for line in lines:
+        if line is None:
+            continue
+        if line == "":
+            if data:
+                yield event_id, event, "\n".join(data)
+            event_id, event, data = None, "message", []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            data.append(value)
+        elif name == "event":
+            event = value
+        elif name == "id":
+            event_id = value
+
+
+def stat_event(payload):
+    """
+    A StatEvent from the API as a plain dict:
+      { "seq", "game_id", "deltas": [Stat], "stats": [Stat] }
+    deltas are the play's increments (stat_ID None), stats the new totals of every row it touched.
+    """
+    return {
+        "seq": payload.get("seq"),
+        "game_id": payload.get("game_ID"),
+        "deltas": [Stat.from_json(d) for d in payload.get("deltas") or []],
+        "stats": [Stat.from_json(s) for s in payload.get("stats") or []],
+    }
+
+
+class GameEventStream:
+    """
+    Follows GET /Stats/Game/{id}/Events (Server-Sent Events) on a daemon thread and
+    calls on_event(stat_event) for every stat change in the game - on that thread,
+    so UI code has to hand it over to the Tk thread itself.
+
+    The stream has its own Session: it keeps one connection open for as long as it
+    runs, and must not hold up the shared pool. If the connection drops it reconnects
+    with exponential backoff and sends Last-Event-ID, so the server replays whatever
+    was missed. A 404/405 means the API has no push endpoint; the stream then stops.
+    """
+
+    def __init__(self, url, on_event, timeout=3.05, base_delay=0.5, max_delay=15.0):
+        self.url = url
+        self.on_event = on_event
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.last_event_id = None
+        self.received = 0
+
+        self._session = requests.Session()
+        self._response = None
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gob-live-events", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def close(self):
+        """Stops following the game. Safe to call from any thread, more than once."""
+        self._closed.set()
+        response = self._response
+        if response is not None:
+            # Unblocks the read the thread is sitting in
+            response.close()
+        self._session.close()
+
+    def _run(self):
+        failures = 0
+        while not self._closed.is_set():
+            try:
+                if not self._follow():
+                    return
+                failures = 0
+            except (requests.RequestException, OSError, ValueError) as e:
+                if self._closed.is_set():
+                    return
+                failures += 1
+                log.warning("Live stats stream for %s dropped (%s), reconnecting", self.url, e)
+            delay = min(self.max_delay, self.base_delay * (2 ** failures))
+            self._closed.wait(delay * random.uniform(0.5, 1.0))
+
+    def _follow(self):
+        """One connection. Returns False if the server has no event stream."""
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+        with self._session.get(self.url, headers=headers, stream=True,
+                               timeout=(self.timeout, STREAM_READ_TIMEOUT)) as response:
+            if response.status_code in (404, 405):
+                log.info("%s not available; live stats are off", self.url)
+                return False
+            response.raise_for_status()
+            self._response = response
+            try:
+                for event_id, event, data in parse_sse(response.iter_lines(decode_unicode=True)):
+                    if self._closed.is_set():
+                        break
+                    if event_id is not None:
+                        self.last_event_id = event_id
+                    if event != "stats":
+                        continue
+                    self.received += 1
+                    try:
+                        self.on_event(stat_event(json.loads(data)))
+                    except Exception as e:
+                        log.exception("Live stats callback failed: %s", e)
+            finally:
+                self._response = None
+        return True
+
+
+class _Subscription:
+    def __init__(self, bus, game_id, on_event):
+        self._bus = bus
+        self.game_id = game_id
+        self.on_event = on_event
+
+    def close(self):
+        self._bus._unsubscribe(self)
+
+
+class LocalEventBus:
+    """
+    In-process version of the API's StatEventHub, for LocalAPI: publish() calls every
+    subscriber of the game right away, on the publishing thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # game_ID -> [_Subscription]
+        self._seq = {}  # game_ID -> last seq
+
+    def subscribe(self, game_id, on_event):
+        sub = _Subscription(self, game_id, on_event)
+        with self._lock:
+            self._subscribers.setdefault(game_id, []).append(sub)
+        return sub
+
+    def publish(self, game_id, deltas, stats):
+        with self._lock:
+            seq = self._seq[game_id] = self._seq.get(game_id, 0) + 1
+            subscribers = list(self._subscribers.get(game_id, ()))
+        event = {"seq": seq, "game_id": game_id, "deltas": deltas, "stats": stats}
+        for sub in subscribers:
+            try:
+                sub.on_event(event)
+            except Exception as e:
+                log.exception("Live stats callback failed: %s", e)
+
+    def _unsubscribe(self, sub):
+        with self._lock:
+            subs = self._subscribers.get(sub.game_id, [])
+            if sub in subs:
+                subs.remove(sub)
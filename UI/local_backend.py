@@ -0,0 +1,381 @@
+import os
+import threading
+from dataclasses import replace
+from datetime import timezone
+from zoneinfo import ZoneInfo
+
+import requests
+from dateutil import parser
+
+from gob_log import get_logger
+from league_json import iter_records, write_tables
+from live_events import LocalEventBus
+from Real_API import RealAPI, merge_stat_events, stat_body, stat_increments
+from records import STAT_FIELDS, Game, Player, Stat, Team
+from stats_engine import StatTable
+
+log = get_logger("local_backend")
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_database.json")
+
+# fake_database.json stat column -> API (StatDTO) field
+FAKE_STAT_FIELDS = {
+    "3ptMade": "three_Points_Made",
+    "3ptMiss": "three_Points_Missed",
+    "2ptMade": "two_Points_Made",
+    "2ptMiss": "two_Points_Missed",
+    "FreeThrowsMade": "free_Throw_Made",
+    "FreeThrowsMissed": "free_Throw_Missed",
+    "Steals": "steals",
+    "Turnovers": "turnovers",
+    "Assists": "assists",
+    "Blocks": "blocks",
+    "Fouls": "fouls",
+    "OffensiveRebounds": "off_Rebounds",
+    "DefensiveRebounds": "def_Rebounds",
+}
+
+
+def _bad_request(message):
+    """A requests.HTTPError that looks like the API answering 400 (what the stat journal expects)."""
+    resp = requests.Response()
+    resp.status_code = 400
+    resp.reason = message
+    return requests.HTTPError(f"400 Client Error: {message}", response=resp)
+
+
+def _api_date(value):
+    """
+    ASP.NET sends Game_Date without an offset ("2025-01-23T00:00:00"), and the UI
+    compares it with naive datetimes, so drop the "Z" the fake DB uses.
+    """
+    dt = parser.isoparse(value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+class LocalAPI:
+    """
+    In-process stand-in for RealAPI, served from fake_database.json - no .NET, no
+    SQL Server, no network. Same methods and the same records (records.Game, Player,
+    ...) as RealAPI, so the UI, benchmarks and load tests can run against it unchanged.
+
+    The JSON is loaded once into record tables keyed by ID, plus indexes for the hot
+    lookups (roster by team, stats by game). Writes only change the in-memory
+    tables; save() writes them back out if you want to keep them. The file is read
+    and written a record at a time (league_json), so any of its formats load.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self.teams = {}  # team_ID -> Team
+        self.games = {}  # game_ID -> Game
+        self.players = {}  # player_ID -> Player
+        self.stats = {}  # stat_ID -> Stat
+        self._players_by_team = {}  # team_ID -> [Players sorted by player_ID]
+        self._stats_by_game = {}  # game_ID -> {player_ID: Stat}
+        self._applied_batches = set()  # idempotency keys already applied
+        self._next_ids = {}  # table name -> next free ID
+        self.events = LocalEventBus()  # stat changes, like the API's event stream
+
+        # Record by record, so only the tables are ever in memory - never the parsed file as well
+        for table, row in iter_records(path):
+            if table == "Stats":
+                stat = Stat(stat_ID=row["StatID"], player_ID=row["PlayerID"], game_ID=int(row["GameID"]),
+                            **{field: int(row.get(column) or 0) for column, field in FAKE_STAT_FIELDS.items()})
+                self.stats[stat.stat_ID] = stat
+            elif table == "Games":
+                # the NBA ids are zero-padded strings ("0022400621")
+                game = Game(game_ID=int(row["GameID"]), home_ID=row.get("HomeTeamID"),
+                            away_ID=row.get("AwayTeamID"), game_Date=_api_date(row["GameDate"]))
+                self.games[game.game_ID] = game
+            elif table == "Players":
+                player = Player.from_json(row)
+                self.players[player.player_ID] = player
+            elif table == "Teams":
+                team = Team.from_json(row)
+                self.teams[team.team_ID] = team
+        self._reindex()
+        self._next_ids = {"games": max(self.games, default=0) + 1,
+                          "players": max(self.players, default=0) + 1,
+                          "stats": max(self.stats, default=0) + 1}
+
+    def _new_id(self, table):
+        new_id = self._next_ids[table]
+        self._next_ids[table] += 1
+        return new_id
+
+    def _reindex(self):
+        self._players_by_team = {}
+        for p in self.players.values():
+            self._players_by_team.setdefault(p.team_ID, []).append(p)
+        for roster in self._players_by_team.values():
+            roster.sort(key=lambda x: x.player_ID)
+        self._stats_by_game = {}
+        for s in self.stats.values():
+            self._stats_by_game.setdefault(s.game_ID, {})[s.player_ID] = s
+
+    def save(self, path=None, format="compact"):
+        """
+        Writes the current tables back out in fake_database.json's layout, a record at
+        a time. format is "compact", "pretty" (the old indent=4 file) or "ndjson".
+        """
+        with self._lock:
+            write_tables(path or self.path, (
+                ("Teams", ({"TeamID": t.team_ID, "Team_Name": t.team_Name, "City": t.team_City}
+                           for t in self.teams.values())),
+                ("Games", ({"GameID": str(g.game_ID).zfill(10), "HomeTeamID": g.home_ID, "AwayTeamID": g.away_ID,
+                            "GameDate": g.game_Date + "Z", "home": self._team_name(g.home_ID),
+                            "away": self._team_name(g.away_ID)} for g in self.games.values())),
+                ("Players", ({"PlayerID": p.player_ID, "TeamID": p.team_ID, "First_Name": p.first_Name,
+                              "Last_Name": p.last_Name, "Position": p.position_ID,
+                              "Jersey_Number": p.jersey_Number} for p in self.players.values())),
+                ("Stats", (dict({"StatID": s.stat_ID, "PlayerID": s.player_ID, "GameID": str(s.game_ID).zfill(10)},
+                                **{column: float(getattr(s, field)) for column, field in FAKE_STAT_FIELDS.items()})
+                           for s in self.stats.values())),
+            ), format=format)
+
+    # ----------------
+    # SAME HOUSEKEEPING AS RealAPI
+    # ----------------
+    def connection_stats(self):
+        return {"requests": 0, "opened": 0, "reused": 0}
+
+    def cache_stats(self):
+        return {"hits": 0, "misses": 0, "hit_rate": 0.0, "evictions": 0, "size": 0, "max_entries": 0}
+
+    def invalidate_roster_index(self):
+        pass
+
+    def clear_cache(self):
+        pass
+
+    def close(self):
+        pass
+
+    # ----------------
+    # GETTERS
+    # ----------------
+    def get_players_for_team_sorted(self, team_id: int):
+        with self._lock:
+            return list(self._players_by_team.get(team_id, []))
+
+    def get_team_stats_for_game(self, team_id: int, game_id: int):
+        with self._lock:
+            return [replace(s) for s in self._stats_by_game.get(game_id, {}).values()
+                    if self._team_of(s.player_ID) == team_id]
+
+    def get_player_stats_for_game(self, player_id: int, game_id: int) -> dict:
+        with self._lock:
+            row = self._stats_by_game.get(game_id, {}).get(player_id)
+            return replace(row) if row else None
+
+    def get_game_stats(self, game_id: int):
+        with self._lock:
+            return [replace(s) for s in self._stats_by_game.get(game_id, {}).values()]
+
+    def get_all_stats(self):
+        with self._lock:
+            return [replace(s) for s in self.stats.values()]
+
+    def get_season_table(self):
+        with self._lock:
+            team_of = {pid: p.team_ID for pid, p in self.players.items()}
+            return StatTable.from_rows(self.stats.values(), team_of=team_of)
+
+    def get_game(self, game_id: int):
+        with self._lock:
+            game = self.games.get(game_id)
+            return replace(game) if game else None
+
+    def get_game_score(self, game_id: int):
+        """Same shape as GET /Stats/GameScore/{id}. Raises like RealAPI if the game has no stats."""
+        with self._lock:
+            game = self.games.get(game_id)
+            stats = self._stats_by_game.get(game_id)
+            if game is None or not stats:
+                resp = requests.Response()
+                resp.status_code = 404
+                raise requests.HTTPError(f"404 Client Error: no score for game {game_id}", response=resp)
+            score = {game.home_ID: 0, game.away_ID: 0}
+            for s in stats.values():
+                team_id = self._team_of(s.player_ID)
+                if team_id in score:
+                    score[team_id] += s.three_Points_Made * 3 + s.two_Points_Made * 2 + s.free_Throw_Made
+            return {"gameId": game_id, "homeTeamScore": score[game.home_ID], "awayTeamScore": score[game.away_ID]}
+
+    def get_game_snapshot(self, game_id: int, game=None, budget=None, server_score=False):
+        """Same shape as RealAPI.get_game_snapshot; everything is in memory so nothing is ever missing."""
+        with self._lock:
+            stored = self.games.get(game_id)
+            if game is None:
+                if stored is None:
+                    return None
+                game = replace(stored, home=self._team_name(stored.home_ID), away=self._team_name(stored.away_ID))
+            snapshot = {
+                "game_id": game_id,
+                "game": game,
+                "stats": [replace(s) for s in self._stats_by_game.get(game_id, {}).values()],
+                "home_roster": list(self._players_by_team.get(game.home_ID, [])),
+                "away_roster": list(self._players_by_team.get(game.away_ID, [])),
+                "team_of": {pid: p.team_ID for pid, p in self.players.items()},
+                "server_score": None,
+                "missing": [],
+                "elapsed_ms": 0.0,
+            }
+        if server_score:
+            try:
+                snapshot["server_score"] = self.get_game_score(game_id)
+            except requests.HTTPError:
+                snapshot["server_score"] = {"gameId": game_id, "homeTeamScore": 0, "awayTeamScore": 0}
+        return snapshot
+
+    def get_schedule(self):
+        with self._lock:
+            return [replace(g, home=self._team_name(g.home_ID), away=self._team_name(g.away_ID))
+                    for g in self.games.values()]
+
+    def _team_name(self, team_id):
+        team = self.teams.get(team_id)
+        return team.team_Name if team else "Unknown"
+
+    def _team_of(self, player_id):
+        player = self.players.get(player_id)
+        return player.team_ID if player else None
+
+    def _get_team_name_by_id(self, team_id):
+        with self._lock:
+            return self._team_name(team_id)
+
+    def get_all_teams(self):
+        with self._lock:
+            return sorted(t.team_Name for t in self.teams.values())
+
+    # Builds the same display lines as RealAPI, on top of the local getters
+    get_game_details = RealAPI.get_game_details
+
+    # ----------------
+    # SETTERS / UPDATERS
+    # ----------------
+    def get_team_id_by_name(self, team_name):
+        with self._lock:
+            for team_id, team in self.teams.items():
+                if team.team_Name.lower() == team_name.lower():
+                    return team_id
+        return None
+
+    def create_game(self, home, away, dt_value):
+        if dt_value.tzinfo is None:
+            dt_value = dt_value.replace(tzinfo=ZoneInfo("America/New_York"))
+        utc_dt = dt_value.astimezone(timezone.utc).replace(tzinfo=None)
+        home_team_id = self.get_team_id_by_name(home)
+        away_team_id = self.get_team_id_by_name(away)
+        if home_team_id is None or away_team_id is None:
+            log.error("Could not find team IDs for the selected teams.")
+            return None
+        with self._lock:
+            game_id = self._new_id("games")
+            game = Game(game_ID=game_id, home_ID=home_team_id, away_ID=away_team_id,
+                        game_Date=utc_dt.strftime("%Y-%m-%dT%H:%M:%S"))
+            self.games[game_id] = game
+            return replace(game)
+
+    def delete_game(self, game_id):
+        with self._lock:
+            if self.games.pop(game_id, None) is None:
+                log.error("Error deleting game %s: 404 not found", game_id)
+                return False
+            # Stats go with the game, like the API's cascade
+            for stat in self._stats_by_game.pop(game_id, {}).values():
+                self.stats.pop(stat.stat_ID, None)
+            return True
+
+    def delete_stat(self, stat_id):
+        with self._lock:
+            stat = self.stats.pop(stat_id, None)
+            if stat is None:
+                log.warning("Could not delete stat %s (HTTP 404)", stat_id)
+                return False
+            self._stats_by_game.get(stat.game_ID, {}).pop(stat.player_ID, None)
+            return True
+
+    def _get_players_for_team(self, team_id):
+        return self.get_players_for_team_sorted(team_id)
+
+    def create_player(self, team_id, first_name, last_name, position, jersey_number):
+        with self._lock:
+            player_id = self._new_id("players")
+            player = Player(player_ID=player_id, team_ID=team_id, first_Name=first_name,
+                            last_Name=last_name, position_ID=position, jersey_Number=jersey_number)
+            self.players[player_id] = player
+            roster = self._players_by_team.setdefault(team_id, [])
+            roster.append(player)
+            roster.sort(key=lambda x: x.player_ID)
+            return replace(player)
+
+    def delete_player(self, player_id):
+        with self._lock:
+            player = self.players.pop(player_id, None)
+            if player is None:
+                log.error("Error deleting player %s: 404", player_id)
+                return False
+            roster = self._players_by_team.get(player.team_ID, [])
+            roster[:] = [p for p in roster if p.player_ID != player_id]
+            return True
+
+    def _get_team_stats_for_game(self, team_id, game_id):
+        return self.get_team_stats_for_game(team_id, game_id)
+
+    def update_player_stats(self, game_id: int, player_id: int, action: str) -> None:
+        body = stat_body(game_id, player_id)
+        for field, count in stat_increments(action).items():
+            body[field] += count
+        try:
+            self.post_stat_rows([body])
+        except requests.HTTPError as ex:
+            log.error("Error posting stat update: %s", ex)
+
+    def update_player_stats_batch(self, game_id: int, events) -> bool:
+        rows = merge_stat_events(game_id, events)
+        if not rows:
+            return True
+        try:
+            self.post_stat_rows(rows)
+        except requests.HTTPError as ex:
+            log.error("Error posting stat batch: %s", ex)
+            return False
+        return True
+
+    def post_stat_rows(self, rows, idempotency_key=None):
+        """Same rules as POST /Stats/Batch: all or nothing, each idempotency key applied once."""
+        with self._lock:
+            if idempotency_key and idempotency_key in self._applied_batches:
+                return
+            for body in rows:
+                if body["player_ID"] not in self.players:
+                    raise _bad_request("Player with given Player_ID does not exist")
+                if body["game_ID"] not in self.games:
+                    raise _bad_request("Game with given Game_ID does not exist")
+            touched = {}  # game_ID -> {stat_ID: Stat}
+            for body in rows:
+                by_player = self._stats_by_game.setdefault(body["game_ID"], {})
+                stat = by_player.get(body["player_ID"])
+                if stat is None:
+                    stat = Stat(stat_ID=self._new_id("stats"), player_ID=body["player_ID"], game_ID=body["game_ID"])
+                    self.stats[stat.stat_ID] = stat
+                    by_player[body["player_ID"]] = stat
+                for field in STAT_FIELDS:
+                    setattr(stat, field, getattr(stat, field) + body.get(field, 0))
+                touched.setdefault(stat.game_ID, {})[stat.stat_ID] = stat
+            if idempotency_key:
+                self._applied_batches.add(idempotency_key)
+            events = [(game_id, [Stat.from_json(b) for b in rows if b["game_ID"] == game_id],
+                       [replace(s) for s in stats.values()]) for game_id, stats in touched.items()]
+        for game_id, deltas, totals in events:
+            self.events.publish(game_id, deltas, totals)
+
+    def subscribe_game_events(self, game_id, on_event):
+        """Same as RealAPI.subscribe_game_events, fed straight from post_stat_rows."""
+        return self.events.subscribe(game_id, on_event)
@@ -26,13 +26,14 @@ Stats:
 Finally, the database is written out to "fake_database.json".
 """
 
-import json
 import random
 import datetime
 import math
 from nba_api.stats.static import teams
 from nba_api.stats.endpoints import leaguegamefinder, boxscoretraditionalv2
 
+from league_json import write_tables
+
 DATABASE_FILENAME = "fake_database.json"
 
 # ---------------------------------------------------------------------------
@@ -228,15 +229,14 @@ class NBADatabase:
         self.next_stat_id += 1
         return stat_record["StatID"]
 
-    def to_json(self, filename):
-        db = {
-            "Teams": self.teams,
-            "Games": self.games,
-            "Players": self.players,
-            "Stats": self.stats
-        }
-        with open(filename, "w") as f:
-            json.dump(db, f, indent=4)
+    def to_json(self, filename, format="compact"):
+        # Written record by record; format is "compact", "pretty" (indent=4) or "ndjson"
+        write_tables(filename, (
+            ("Teams", self.teams),
+            ("Games", self.games),
+            ("Players", self.players),
+            ("Stats", self.stats)
+        ), format=format)
         print(f"Fake database saved to {filename}")
 
 # ---------------------------------------------------------------------------
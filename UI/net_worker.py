@@ -0,0 +1,177 @@
+import contextvars
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import tracing
+from gob_log import get_logger
+
+log = get_logger("net_worker")
+
+
+class NetworkWorker:
+    """
+    Runs blocking API calls off the Tk thread and hands the results back to it.
+
+    Worker threads never touch Tk: finished jobs are put on a queue, and the Tk
+    thread drains that queue every poll_ms via root.after(), calling the job's
+    on_success / on_error there.
+
+      - reads run on a small thread pool ("read" lane)
+      - writes run one at a time, in submission order ("write" lane), so two stat
+        posts for the same player can't race each other on the server
+      - a job submitted with a key supersedes any earlier job with the same key:
+        the earlier one is cancelled if it hasn't started, and its result is
+        dropped if it has (e.g. the user clicked another game before the first
+        game's details finished loading)
+      - on_busy_change(count) is called on the Tk thread whenever the number of
+        jobs in flight changes, so the UI can show a loading indicator
+      - call_soon(fn, ...) lets any other thread (e.g. a live event stream) run
+        something on the Tk thread at the next poll
+      - a job carries the tracing spans active when it was submitted: fn and its
+        callbacks run under them, and they're held until the callback is done (or
+        the job is dropped), so a span covers the whole click -> request -> redraw
+    """
+
+    def __init__(self, root, max_workers=4, poll_ms=25, on_busy_change=None):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.on_busy_change = on_busy_change
+        self._executors = {
+            "read": ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gob-read"),
+            "write": ThreadPoolExecutor(max_workers=1, thread_name_prefix="gob-write"),
+        }
+        self._done = queue.Queue()
+        self._calls = queue.Queue()  # (fn, args) from call_soon
+        self._ids = itertools.count(1)
+        self._latest = {}  # key -> id of the newest job submitted with that key
+        self._futures = {}  # key -> future of that newest job
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._poll_id = self.root.after(self.poll_ms, self._drain)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def submit(self, fn, *args, on_success=None, on_error=None, key=None, lane="read", **kwargs):
+        """
+        Runs fn(*args, **kwargs) on a worker thread. When it finishes, on_success(result)
+        or on_error(exception) is called on the Tk thread - unless a newer job with the
+        same key was submitted in the meantime.
+        """
+        if self._closed:
+            return None
+        job_id = next(self._ids)
+        with self._lock:
+            if key is not None:
+                previous = self._futures.get(key)
+                if previous is not None and previous.cancel():
+                    # Never started, so it will never report back
+                    self._in_flight -= 1
+                self._latest[key] = job_id
+            self._in_flight += 1
+
+        ctx = contextvars.copy_context()
+        spans = tracing.active_spans()
+        for span in spans:
+            span.hold()
+
+        def run():
+            try:
+                result = ctx.run(fn, *args, **kwargs)
+            except Exception as e:
+                self._done.put((job_id, key, None, e, on_success, on_error, ctx, spans))
+            else:
+                self._done.put((job_id, key, result, None, on_success, on_error, ctx, spans))
+
+        future = self._executors[lane].submit(run)
+        if spans:
+            future.add_done_callback(lambda f: f.cancelled() and _release(spans))
+        if key is not None:
+            with self._lock:
+                if self._latest.get(key) == job_id:
+                    self._futures[key] = future
+        self._notify_busy()
+        return future
+
+    def cancel(self, key):
+        """Forget any pending job for key; its result (if it still arrives) is dropped."""
+        with self._lock:
+            future = self._futures.pop(key, None)
+            self._latest.pop(key, None)
+            if future is not None and future.cancel():
+                self._in_flight -= 1
+        self._notify_busy()
+
+    def call_soon(self, fn, *args):
+        """Runs fn(*args) on the Tk thread at the next poll. Safe to call from any thread."""
+        if not self._closed:
+            self._calls.put((fn, args))
+
+    def is_pending(self, key):
+        with self._lock:
+            return key in self._latest
+
+    def _drain(self):
+        changed = False
+        while True:
+            try:
+                job_id, key, result, error, on_success, on_error, ctx, spans = self._done.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+            with self._lock:
+                self._in_flight -= 1
+                superseded = key is not None and self._latest.get(key) != job_id
+                if key is not None and not superseded:
+                    del self._latest[key]
+                    self._futures.pop(key, None)
+            try:
+                if superseded:
+                    # A newer request for the same thing is on its way
+                    pass
+                elif error is not None:
+                    if on_error is not None:
+                        ctx.run(on_error, error)
+                    else:
+                        log.error("Background request failed: %s", error)
+                elif on_success is not None:
+                    ctx.run(on_success, result)
+            except Exception as e:
+                log.exception("Callback for background request failed: %s", e)
+            finally:
+                _release(spans)
+        if changed:
+            self._notify_busy()
+        while True:
+            try:
+                fn, args = self._calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                log.exception("Scheduled callback failed: %s", e)
+        if not self._closed:
+            self._poll_id = self.root.after(self.poll_ms, self._drain)
+
+    def _notify_busy(self):
+        if self.on_busy_change is not None and threading.current_thread() is threading.main_thread():
+            self.on_busy_change(self._in_flight)
+
+    def shutdown(self, wait=False):
+        self._closed = True
+        try:
+            self.root.after_cancel(self._poll_id)
+        except Exception:
+            pass
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _release(spans):
+    for span in spans:
+        span.release()
@@ -0,0 +1,87 @@
+STARTERS = 5
+
+
+class _TeamLineup:
+    """One team's five on-court slots plus its bench."""
+
+    def __init__(self, team_id, roster, starters):
+        self.team_id = team_id
+        self.court = [p.player_ID for p in roster[:starters]]  # slot -> player_ID
+        self.slot_of = {pid: i for i, pid in enumerate(self.court)}  # player_ID -> slot
+        self.bench = {p.player_ID: None for p in roster[starters:]}  # ordered set of player_IDs
+
+
+class OnCourtState:
+    """
+    Who is on the court and who is on the bench in the game being scored.
+
+    Built once from the two rosters (the first STARTERS players of each start), then
+    every question the stat forms ask is a dict/set lookup instead of a scan of the
+    whole player list:
+
+      team_of(pid), is_on_court(pid)     - O(1)
+      on_court(team_id), bench(team_id)  - that team's players (records), in slot / bench order
+      teammates_of(pid)                  - the player's on-court teammates, without them
+      opponents_of(pid)                  - the other team's on-court players
+      lineup()                           - everyone on the court, home first
+      substitute(out_id, in_id)          - O(1): the bench player takes the same slot
+
+    Players are the roster records (records.Player) the state was built from.
+    """
+
+    def __init__(self, home_id, away_id, home_roster, away_roster, starters=STARTERS):
+        self.home_id = home_id
+        self.away_id = away_id
+        self.players = {}  # player_ID -> Player
+        self._team_of = {}  # player_ID -> team_ID
+        self._teams = {}  # team_ID -> _TeamLineup
+        for team_id, roster in ((home_id, home_roster), (away_id, away_roster)):
+            self._teams[team_id] = _TeamLineup(team_id, roster, starters)
+            for p in roster:
+                self.players[p.player_ID] = p
+                self._team_of[p.player_ID] = team_id
+
+    def team_of(self, player_id):
+        return self._team_of.get(player_id)
+
+    def opponent_team(self, team_id):
+        return self.away_id if team_id == self.home_id else self.home_id
+
+    def is_on_court(self, player_id):
+        team = self._teams.get(self._team_of.get(player_id))
+        return team is not None and player_id in team.slot_of
+
+    __contains__ = is_on_court
+
+    def on_court(self, team_id):
+        team = self._teams.get(team_id)
+        return [self.players[pid] for pid in team.court] if team else []
+
+    def bench(self, team_id):
+        team = self._teams.get(team_id)
+        return [self.players[pid] for pid in team.bench] if team else []
+
+    def lineup(self):
+        return self.on_court(self.home_id) + self.on_court(self.away_id)
+
+    def teammates_of(self, player_id):
+        return [p for p in self.on_court(self._team_of.get(player_id)) if p.player_ID != player_id]
+
+    def opponents_of(self, player_id):
+        return self.on_court(self.opponent_team(self._team_of.get(player_id)))
+
+    def substitute(self, out_id, in_id):
+        """
+        Sends in_id (from the bench) on for out_id, in the same slot; out_id goes to the
+        bench. Raises ValueError if they aren't an on-court / bench pair of the same team.
+        """
+        team = self._teams.get(self._team_of.get(out_id))
+        if team is None or out_id not in team.slot_of:
+            raise ValueError(f"Player {out_id} is not on the court")
+        if in_id not in team.bench:
+            raise ValueError(f"Player {in_id} is not on team {team.team_id}'s bench")
+        slot = team.slot_of.pop(out_id)
+        del team.bench[in_id]
+        team.court[slot] = in_id
+        team.slot_of[in_id] = slot
+        team.bench[out_id] = None
@@ -0,0 +1,126 @@
+from dataclasses import dataclass, fields
+
+# Every counter field of the API's StatCreateDTO (JSON casing). Stat has one attribute per name.
+STAT_FIELDS = (
+    "three_Points_Made", "three_Points_Missed",
+    "two_Points_Made", "two_Points_Missed",
+    "free_Throw_Made", "free_Throw_Missed",
+    "steals", "turnovers", "assists", "blocks", "fouls",
+    "off_Rebounds", "def_Rebounds",
+)
+
+
+def _norm(key):
+    # "Home_ID", "home_ID" and "HomeID" all become "homeid"
+    return key.replace("_", "").lower()
+
+
+def _record(**aliases):
+    """
+    Makes a class a slotted dataclass record. Every attribute is named exactly like
+    the API's JSON key, and from_json() accepts any casing of it (plus the extra
+    spellings given as alias="attribute", e.g. HomeTeamID="home_ID").
+    """
+    def wrap(cls):
+        cls = dataclass(slots=True)(cls)
+        cls._FIELDS = tuple(f.name for f in fields(cls))
+        cls._KEYS = {_norm(name): name for name in cls._FIELDS}
+        cls._KEYS.update((_norm(alias), name) for alias, name in aliases.items())
+        return cls
+    return wrap
+
+
+class _Record:
+    """
+    The shared part of Team / Game / Player / Stat.
+
+    API JSON is turned into records once, where it comes in (RealAPI / LocalAPI), and
+    everything after that uses plain attribute access (player.jersey_Number) instead
+    of guessing between "Jersey_Number" and "jersey_Number" on every read. Records use
+    __slots__, so a full league roster or a season of stat rows takes a fraction of
+    the memory the same dicts did.
+
+    For code that still indexes by JSON name, record["team_ID"] and record.get(...)
+    read the attribute (any casing works there too).
+    """
+    __slots__ = ()
+    _FIELDS = ()
+    _KEYS = {}
+
+    @classmethod
+    def from_json(cls, data):
+        """Builds a record from an API (or fake database) dict; unknown keys are ignored."""
+        values = {}
+        for key, value in data.items():
+            name = cls._KEYS.get(_norm(key))
+            if name is not None:
+                values[name] = value
+        return cls(**values)
+
+    def to_json(self):
+        """The record as a dict with the API's JSON keys."""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    def __getitem__(self, key):
+        name = self._KEYS.get(_norm(key))
+        if name is None:
+            raise KeyError(key)
+        return getattr(self, name)
+
+    def get(self, key, default=None):
+        name = self._KEYS.get(_norm(key))
+        return default if name is None else getattr(self, name)
+
+    def keys(self):
+        return self._FIELDS
+
+
+@_record(City="team_City")
+class Team(_Record):
+    team_ID: int
+    team_Name: str = "Unknown"
+    team_City: str = ""
+
+
+@_record(HomeTeamID="home_ID", AwayTeamID="away_ID")
+class Game(_Record):
+    game_ID: int
+    home_ID: int = None
+    away_ID: int = None
+    game_Date: str = ""
+    # Team names, filled in by get_schedule() (not part of GameDTO)
+    home: str = None
+    away: str = None
+
+
+@_record(Position="position_ID")
+class Player(_Record):
+    player_ID: int
+    team_ID: int = None
+    first_Name: str = ""
+    last_Name: str = ""
+    position_ID: str = ""
+    jersey_Number: int = 0
+
+
+@_record()
+class Stat(_Record):
+    stat_ID: int = None
+    player_ID: int = None
+    game_ID: int = None
+    three_Points_Made: int = 0
+    three_Points_Missed: int = 0
+    two_Points_Made: int = 0
+    two_Points_Missed: int = 0
+    free_Throw_Made: int = 0
+    free_Throw_Missed: int = 0
+    steals: int = 0
+    turnovers: int = 0
+    assists: int = 0
+    blocks: int = 0
+    fouls: int = 0
+    off_Rebounds: int = 0
+    def_Rebounds: int = 0
+
+
+assert Stat._FIELDS[3:] == STAT_FIELDS
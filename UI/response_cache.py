@@ -0,0 +1,148 @@
+import threading
+import time
+from collections import OrderedDict
+
+# How long (seconds) each kind of response stays fresh. The first item of a cache
+# key picks the TTL, e.g. ("team_stats", 5, 12) uses DEFAULT_TTLS["team_stats"].
+# Writes made through RealAPI invalidate the matching keys right away, so these
+# only bound how stale data written by *other* clients can get.
+DEFAULT_TTLS = {
+    "players": 300.0,
+    "teams": 300.0,
+    "games": 30.0,
+    "game": 60.0,
+    "game_stats": 5.0,
+    "team_stats": 5.0,
+    "game_score": 5.0,
+    "all_stats": 30.0,
+    "season_table": 30.0,
+}
+
+
+class ResponseCache:
+    """
+    Read-through cache for API responses.
+
+      - every entry has a TTL picked by the endpoint name (first item of the key)
+      - at most max_entries are kept; the least recently used one is evicted first
+      - entries can carry tags, e.g. ("game", 12). bump(tag) raises that tag's
+        version, which makes every entry stored under the old version stale
+        without having to know their exact keys
+      - get_or_load() notes the key's generation and the tag versions before calling
+        the loader, so a bump() / invalidate() that lands while a load is in flight
+        (e.g. another thread's write) keeps the older response out of the cache
+      - hits / misses / evictions are counted so the TTLs and size can be tuned;
+        on_lookup(key, hit), if given, is also called for every lookup (RealAPI
+        reports them to the tracer with it)
+
+    It is safe to use from more than one thread.
+    """
+
+    def __init__(self, max_entries=512, ttls=None, default_ttl=30.0, clock=time.monotonic, on_lookup=None):
+        self.max_entries = max_entries
+        self.on_lookup = on_lookup
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value, ((tag, version), ...))
+        self._versions = {}  # tag -> int
+        self._generations = {}  # key -> int, raised by invalidate()
+        self._cleared = 0  # raised by clear()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _ttl_for(self, key):
+        endpoint = key[0] if isinstance(key, tuple) else key
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key):
+        """
+        Returns (True, value) for a fresh entry, otherwise (False, None).
+        Counts a hit or a miss.
+        """
+        hit, value = self._lookup(key)
+        if self.on_lookup is not None:
+            self.on_lookup(key, hit)
+        return hit, value
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value, tag_versions = entry
+                fresh = expires_at > self._clock() and all(
+                    self._versions.get(tag, 0) == version for tag, version in tag_versions
+                )
+                if fresh:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def _snapshot(self, key, tags):
+        # caller holds the lock
+        return (self._cleared, self._generations.get(key, 0)), tuple(
+            (tag, self._versions.get(tag, 0)) for tag in tags)
+
+    def put(self, key, value, tags=(), snapshot=None):
+        """
+        Caches value for key. snapshot - taken before the value was loaded, see
+        get_or_load() - makes it a no-op if key was invalidated since, and stores the
+        value under the tag versions it was loaded at (so a bump since makes it stale).
+        """
+        with self._lock:
+            generation, tag_versions = self._snapshot(key, tags)
+            if snapshot is not None:
+                if snapshot[0] != generation:
+                    return
+                tag_versions = snapshot[1]
+            self._entries[key] = (self._clock() + self._ttl_for(key), value, tag_versions)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader, tags=()):
+        """
+        Returns the cached value for key, or calls loader() and caches what it returns.
+        If loader raises, nothing is cached and the exception propagates.
+        """
+        hit, value = self.get(key)
+        if hit:
+            return value
+        with self._lock:
+            snapshot = self._snapshot(key, tags)
+        value = loader()
+        self.put(key, value, tags, snapshot)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def bump(self, tag):
+        """Makes every entry tagged with 'tag' stale."""
+        with self._lock:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._cleared += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
@@ -0,0 +1,90 @@
+import bisect
+from datetime import timedelta, timezone
+
+from dateutil import parser
+
+# The schedule shows game times shifted back 4 hours from what the API stores
+DISPLAY_OFFSET = timedelta(hours=4)
+
+
+def adjusted_game_date(game):
+    """The game's date as shown in the schedule (naive, DISPLAY_OFFSET already subtracted)."""
+    dt = parser.isoparse(game.game_Date)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt - DISPLAY_OFFSET
+
+
+class ScheduleModel:
+    """
+    The schedule kept in memory, sorted by adjusted game date (then game_ID).
+
+    Every date is parsed once, when its game is added. insert() / remove() find the
+    spot with a binary search, so creating or deleting a game only touches that one
+    game instead of refetching and re-sorting the whole season.
+    Indexing gives the records.Game objects in display order; get(game_id) looks one up by ID.
+    """
+
+    def __init__(self, games=()):
+        self._keys = []  # (adjusted datetime, game_ID), sorted
+        self._games = []  # Game records, same order as _keys
+        self._by_id = {}  # game_ID -> (key, game)
+        pairs = []
+        for game in games:
+            key = (adjusted_game_date(game), game.game_ID)
+            self._by_id[game.game_ID] = (key, game)
+            pairs.append((key, game))
+        pairs.sort(key=lambda kg: kg[0])
+        self._keys = [k for k, _ in pairs]
+        self._games = [g for _, g in pairs]
+
+    def __len__(self):
+        return len(self._games)
+
+    def __getitem__(self, index):
+        return self._games[index]
+
+    def __iter__(self):
+        return iter(self._games)
+
+    def __contains__(self, game_id):
+        return game_id in self._by_id
+
+    def get(self, game_id):
+        entry = self._by_id.get(game_id)
+        return entry[1] if entry else None
+
+    def adjusted_date(self, game_id):
+        """Parsed (display) date of a game in the model."""
+        return self._by_id[game_id][0][0]
+
+    def index_of(self, game_id):
+        entry = self._by_id.get(game_id)
+        if entry is None:
+            return None
+        return bisect.bisect_left(self._keys, entry[0])
+
+    def insert(self, game):
+        """Adds a game (or replaces the one with the same game_ID). Returns its index."""
+        if game.game_ID in self._by_id:
+            self.remove(game.game_ID)
+        key = (adjusted_game_date(game), game.game_ID)
+        index = bisect.bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._games.insert(index, game)
+        self._by_id[game.game_ID] = (key, game)
+        return index
+
+    def remove(self, game_id):
+        """Drops a game. Returns the index it had, or None if it wasn't there."""
+        index = self.index_of(game_id)
+        if index is None:
+            return None
+        del self._keys[index]
+        del self._games[index]
+        del self._by_id[game_id]
+        return index
+
+    def first_index_after(self, when):
+        """Index of the first game at or after 'when' (a naive datetime in display time)."""
+        return bisect.bisect_left(self._keys, (when,))
@@ -0,0 +1,138 @@
+from tkinter import ttk
+
+
+class _ScheduleRow:
+    """One recycled row: a fixed-size frame with the game button and the date label under it."""
+
+    def __init__(self, canvas, width, height):
+        self.frame = ttk.Frame(canvas, width=width, height=height)
+        self.frame.pack_propagate(False)
+        self.button = ttk.Button(self.frame, width=35)
+        self.button.pack(anchor="w", ipady=6)
+        self.label = ttk.Label(self.frame, font=("Consolas", 9), width=35)
+        self.label.pack(anchor="w", padx=10)
+        self.window = canvas.create_window(0, 0, window=self.frame, anchor="nw", width=width, height=height,
+                                           state="hidden")
+
+
+class VirtualScheduleList:
+    """
+    Scrollable list of games drawn straight on a Canvas, with only the rows that
+    are on screen (plus a couple either side) turned into widgets.
+
+    A small pool of rows is created once and reused: when the list scrolls, rows
+    that go off screen are moved to the newly visible positions and given the new
+    game's text, instead of one Frame/Button/Label per game existing all the time.
+    The canvas' scrollregion is sized for all the items, so the scrollbar and the
+    mouse wheel behave as if every row were there.
+
+      describe(item) -> (button_text, label_text, is_past), called when a row is shown
+      on_select(index) is called when a row's button is clicked
+    """
+
+    def __init__(self, canvas, scrollbar, describe, on_select, row_height=70, pad_x=8, pad_y=5, overscan=2):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.describe = describe
+        self.on_select = on_select
+        self.row_height = row_height
+        self.pad_x = pad_x
+        self.pad_y = pad_y
+        self.overscan = overscan
+
+        self.items = []
+        self._free = []  # rows not showing anything
+        self._shown = {}  # item index -> row
+        self._row_width = max(canvas.winfo_reqwidth() - 2 * pad_x, 1)
+
+        self.canvas.configure(yscrollcommand=self._on_yscroll, yscrollincrement=row_height)
+        self.scrollbar.configure(command=self.canvas.yview)
+        self.canvas.bind("<Configure>", self._on_resize, add="+")
+
+    def __len__(self):
+        return len(self.items)
+
+    def item(self, index):
+        return self.items[index]
+
+    def set_items(self, items):
+        """
+        Shows a new sorted sequence (anything with len() and indexing, e.g. a ScheduleModel).
+        It is kept by reference: after changing it, call items_changed().
+        Keeps the scroll position where it can.
+        """
+        self.items = items
+        self.items_changed()
+
+    def items_changed(self):
+        """The items were inserted / removed in place; resize and redraw only the visible rows."""
+        self._update_scrollregion()
+        self.refresh()
+
+    def refresh(self):
+        """Re-draws the visible rows (e.g. after the items changed or past/future flipped)."""
+        for index in list(self._shown):
+            self._release(index)
+        self._fill_viewport()
+
+    def scroll_to_index(self, index):
+        """Scrolls so the row at index is at the top of the list."""
+        if not self.items:
+            return
+        index = max(0, min(index, len(self.items) - 1))
+        self.canvas.yview_moveto(index * self.row_height / float(len(self.items) * self.row_height))
+        self._fill_viewport()
+
+    # ----------------
+    # INTERNALS
+    # ----------------
+    def _update_scrollregion(self):
+        height = len(self.items) * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, self._row_width + 2 * self.pad_x, height))
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._fill_viewport()
+
+    def _on_resize(self, event):
+        width = max(event.width - 2 * self.pad_x, 1)
+        if width != self._row_width:
+            self._row_width = width
+            for row in self._shown.values():
+                self.canvas.itemconfigure(row.window, width=width)
+            for row in self._free:
+                self.canvas.itemconfigure(row.window, width=width)
+            self._update_scrollregion()
+        self._fill_viewport()
+
+    def _visible_range(self):
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), self.row_height)
+        first = max(0, int(top // self.row_height) - self.overscan)
+        last = min(len(self.items), int((top + height) // self.row_height) + 1 + self.overscan)
+        return first, last
+
+    def _fill_viewport(self):
+        first, last = self._visible_range()
+        for index in list(self._shown):
+            if not first <= index < last:
+                self._release(index)
+        for index in range(first, last):
+            if index not in self._shown:
+                self._bind(index)
+
+    def _bind(self, index):
+        row = self._free.pop() if self._free else _ScheduleRow(
+            self.canvas, self._row_width, self.row_height - 2 * self.pad_y)
+        button_text, label_text, is_past = self.describe(self.items[index])
+        row.button.configure(text=button_text, style='Past.TButton' if is_past else 'Default.TButton',
+                             command=lambda i=index: self.on_select(i))
+        row.label.configure(text=label_text)
+        self.canvas.coords(row.window, self.pad_x, index * self.row_height + self.pad_y)
+        self.canvas.itemconfigure(row.window, state="normal")
+        self._shown[index] = row
+
+    def _release(self, index):
+        row = self._shown.pop(index)
+        self.canvas.itemconfigure(row.window, state="hidden")
+        self._free.append(row)
@@ -0,0 +1,180 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from gob_log import get_logger
+
+log = get_logger("stand_in_server")
+
+# (method, path regex, LocalAPI handler name) - the ASP.NET routes RealAPI uses
+_ROUTES = [
+    ("GET", r"/Teams", "_teams"),
+    ("GET", r"/Games", "_games"),
+    ("GET", r"/Games/(\d+)", "_game"),
+    ("GET", r"/Players", "_players"),
+    ("GET", r"/Stats", "_all_stats"),
+    ("GET", r"/Stats/Game/(\d+)", "_game_stats"),
+    ("GET", r"/Stats/Team/(\d+)/Game/(\d+)", "_team_stats"),
+    ("GET", r"/Stats/GameScore/(\d+)", "_game_score"),
+    ("POST", r"/Stats/Batch", "_post_batch"),
+    ("POST", r"/Stats", "_post_stat"),
+    ("DELETE", r"/Games/(\d+)", "_delete_game"),
+]
+_ROUTES = [(method, re.compile(pattern + r"/?$"), handler) for method, pattern, handler in _ROUTES]
+
+
+class _NotFound(Exception):
+    pass
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, like Kestrel, so RealAPI's connection pool behaves as it does for real
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, every response would
+    # wait ~40 ms for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        path = self.path.split("?", 1)[0]
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        for route_method, pattern, handler in _ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            return self._send(404, {"title": "Not Found"})
+        self.server.requests += 1
+        try:
+            status, payload = getattr(self.server, handler)(*map(int, match.groups()), body=body,
+                                                            key=self.headers.get("Idempotency-Key"))
+        except _NotFound:
+            status, payload = 404, {"title": "Not Found"}
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 500
+            payload = {"title": str(e)}
+        self._send(status, payload)
+
+    def _send(self, status, payload):
+        data = b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        log.debug("%s - %s", self.address_string(), format % args)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    A local HTTP server that answers the ASP.NET API's routes from a LocalAPI, so
+    RealAPI (connection pool, cache, JSON decoding and all) can be run and timed
+    without .NET or SQL Server - e.g. by benchmark.py.
+
+      with StandInServer(LocalAPI(path)) as server:
+          api = RealAPI(base_url=server.url)
+
+    The JSON matches the DTOs RealAPI reads (records' to_json()). There is no event
+    stream endpoint: GET /Stats/Game/{id}/Events answers 404, which live_events
+    takes as "no live stats".
+    """
+
+    daemon_threads = True
+
+    def __init__(self, backend, host="127.0.0.1", port=0):
+        super().__init__((host, port), _Handler)
+        self.backend = backend
+        self.requests = 0
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="gob-stand-in", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # ----------------
+    # ROUTES
+    # ----------------
+    def _teams(self, body=None, key=None):
+        with self.backend._lock:
+            return 200, [team.to_json() for team in self.backend.teams.values()]
+
+    def _games(self, body=None, key=None):
+        with self.backend._lock:
+            return 200, [_game_dto(game) for game in self.backend.games.values()]
+
+    def _game(self, game_id, body=None, key=None):
+        game = self.backend.get_game(game_id)
+        if game is None:
+            raise _NotFound()
+        return 200, _game_dto(game)
+
+    def _players(self, body=None, key=None):
+        with self.backend._lock:
+            return 200, [player.to_json() for player in self.backend.players.values()]
+
+    def _all_stats(self, body=None, key=None):
+        return 200, [stat.to_json() for stat in self.backend.get_all_stats()]
+
+    def _game_stats(self, game_id, body=None, key=None):
+        stats = self.backend.get_game_stats(game_id)
+        if not stats:
+            raise _NotFound()
+        return 200, [stat.to_json() for stat in stats]
+
+    def _team_stats(self, team_id, game_id, body=None, key=None):
+        stats = self.backend.get_team_stats_for_game(team_id, game_id)
+        if not stats:
+            raise _NotFound()
+        return 200, [stat.to_json() for stat in stats]
+
+    def _game_score(self, game_id, body=None, key=None):
+        return 200, self.backend.get_game_score(game_id)
+
+    def _post_batch(self, body=None, key=None):
+        self.backend.post_stat_rows(body or [], idempotency_key=key)
+        return 200, {"rows": len(body or [])}
+
+    def _post_stat(self, body=None, key=None):
+        self.backend.post_stat_rows([body])
+        return 201, body
+
+    def _delete_game(self, game_id, body=None, key=None):
+        if not self.backend.delete_game(game_id):
+            raise _NotFound()
+        return 204, None
+
+
+def _game_dto(game):
+    # GameDTO has no team names; RealAPI fills those in from /Teams
+    return {"game_ID": game.game_ID, "home_ID": game.home_ID, "away_ID": game.away_ID, "game_Date": game.game_Date}
@@ -0,0 +1,351 @@
+import json
+import os
+import random
+import threading
+import uuid
+
+import requests
+
+import tracing
+from gob_log import get_logger
+from Real_API import merge_stat_events
+from stats_engine import STAT_FIELDS
+
+log = get_logger("stat_journal")
+
+# Next to this file, so it survives closing the app (and crashes).
+DEFAULT_JOURNAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stat_journal.jsonl")
+
+
+class StatJournal:
+    """
+    Write-ahead log for stat increments, so a stat entered while the API is down
+    (or while the app crashes) is never lost and never counted twice.
+
+    record() appends the play's increments to an append-only JSONL file and fsyncs
+    it before returning - no network involved, so scorers can keep going at full
+    speed. A background flusher then delivers everything that is pending:
+
+      - pending increments for the same (player, game) are added together into one row
+      - before sending, the flusher writes a "batch" line with a fresh idempotency key
+        and the ids it covers, then POSTs /Stats/Batch with that key. A retry (even
+        after a restart) resends the same rows with the same key, and the server
+        applies a key at most once
+      - on success an "ack" line is written; on a network error / 5xx it retries with
+        exponential backoff (base_delay doubling up to max_delay, plus jitter)
+      - the API applies a batch all or nothing, so a 4xx answer (e.g. one row's game was
+        deleted) says nothing about the other rows in it. A rejected batch of several rows
+        is split: a "split" line sends its ids back to pending, to go one (player, game)
+        row per batch. Only a row the API rejects on its own is written off, with a "drop"
+        line, instead of blocking everything behind it
+      - if the API is too old for /Stats/Batch, RealAPI posts the rows one by one; when that
+        fails partway, the rows that went through get an "ack" line of their own (with
+        "ids") and only the rest are retried
+
+    Journal lines look like:
+      {"op": "add", "id": 7, "player_ID": 12, "game_ID": 5, "deltas": {"two_Points_Made": 1}}
+      {"op": "batch", "key": "3f0c...", "ids": [7, 8, 9]}
+      {"op": "ack", "key": "3f0c..."}
+      {"op": "split", "key": "3f0c...", "ids": [7, 8, 9]}
+      {"op": "drop", "key": "5d1a...", "reason": "400 ..."}
+    Once nothing is pending the file is truncated, so it doesn't grow forever.
+
+    "Never counted twice" only holds as far as the server remembers keys: the API keeps
+    applied idempotency keys in memory, so a batch that was applied right before an API
+    restart but never acked gets applied again when it's resent. The one-row-at-a-time
+    fallback has no keys at all; a crash between one of its POSTs and the ack line
+    resends that row.
+
+    The tracing spans active in record() stay with the play (in memory only): the
+    flusher sends it under them and they're released on the ack / drop, so a
+    "submit_all" span includes the POST that finally delivered it.
+    """
+
+    def __init__(self, api, path=DEFAULT_JOURNAL_PATH, base_delay=0.5, max_delay=30.0, max_batch=200):
+        self.api = api
+        self.path = path
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+        self._adds = {}  # id -> add record, not yet acked
+        self._batches = {}  # key -> [ids], sent (or about to be) but not acked
+        self._batched_ids = set()
+        self._isolated = set()  # ids from a rejected batch, sent one (player, game) row per batch
+        self._spans = {}  # id -> tracing spans of the play it came from
+        self._next_id = 1
+        self._failures = 0
+        self.delivered = 0
+        self.dropped = 0
+
+        self._replay()
+        self._rewrite()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    # ----------------
+    # PUBLIC
+    # ----------------
+    def record(self, game_id, events):
+        """
+        Durably queues one play's (player_id, action) events for delivery.
+        Returns once they are on disk; the flusher sends them.
+        """
+        rows = merge_stat_events(game_id, events)
+        if not rows:
+            return
+        spans = tracing.active_spans()
+        with self._lock:
+            for row in rows:
+                deltas = {field: row[field] for field in STAT_FIELDS if row[field]}
+                rec = {"op": "add", "id": self._next_id, "player_ID": row["player_ID"],
+                       "game_ID": row["game_ID"], "deltas": deltas}
+                self._next_id += 1
+                self._adds[rec["id"]] = rec
+                if spans:
+                    for span in spans:
+                        span.hold()
+                    self._spans[rec["id"]] = spans
+                self._write(rec, sync=False)
+            self._sync()
+        self._wake.set()
+
+    def pending_count(self):
+        """How many recorded rows haven't been confirmed by the server yet."""
+        with self._lock:
+            return len(self._adds)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="gob-stat-journal", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def stop(self, timeout=2.0):
+        """Stops the flusher. Anything still pending stays in the journal for next time."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            self._file.close()
+
+    def flush_once(self):
+        """
+        Sends one batch (an unfinished one first, otherwise a new one from the pending
+        rows). Returns True if there was nothing to do or it was delivered / written off,
+        False if it should be retried later.
+        """
+        with self._lock:
+            key = next(iter(self._batches), None)
+            if key is None:
+                free = self._next_batch()
+                if not free:
+                    return True
+                key = uuid.uuid4().hex
+                self._batches[key] = free
+                self._batched_ids.update(free)
+                # The key is on disk before the request goes out, so a retry after a
+                # crash reuses it and the server can tell it's a duplicate.
+                self._write({"op": "batch", "key": key, "ids": free})
+            rows = self._collapse(self._batches[key])
+            spans = {span: None for i in self._batches[key] for span in self._spans.get(i, ())}
+
+        try:
+            with tracing.activate(spans):
+                self.api.post_stat_rows(rows, idempotency_key=key)
+        except requests.RequestException as e:
+            sent = getattr(e, "rows_sent", None)
+            if sent:
+                # The per-row fallback got partway; those rows are in and mustn't be resent
+                self.delivered += self._finish_rows(key, sent)
+            status = e.response.status_code if isinstance(e, requests.HTTPError) and e.response is not None else None
+            if status is None or status >= 500 or status in (408, 429):
+                log.warning("Stat batch %s not delivered (%s), will retry", key, status or e)
+                return False
+            with self._lock:
+                remaining = len(self._collapse(self._batches[key]))
+            if remaining > 1:
+                log.warning("Stat batch %s rejected by the API (%s), resending its %s rows one by one",
+                            key, status, remaining)
+                self._split(key)
+                return True
+            log.error("Stat batch %s rejected by the API (%s), dropping it: %s", key, status, e)
+            self.dropped += self._finish(key, {"op": "drop", "key": key, "reason": str(e)})
+            return True
+
+        self.delivered += self._finish(key, {"op": "ack", "key": key})
+        return True
+
+    # ----------------
+    # FLUSHER
+    # ----------------
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            while not self._stopping.is_set():
+                with self._lock:
+                    if not self._adds:
+                        break
+                if self.flush_once():
+                    self._failures = 0
+                    continue
+                self._failures += 1
+                delay = min(self.max_delay, self.base_delay * (2 ** (self._failures - 1)))
+                delay *= random.uniform(0.8, 1.2)
+                # A new record() doesn't cut the backoff short - the API is still down
+                if self._stopping.wait(delay):
+                    return
+
+    def _collapse(self, ids):
+        """Adds the deltas of the given ids together, one StatCreateDTO row per (player, game)."""
+        rows = {}
+        for i in ids:
+            rec = self._adds[i]
+            row_key = (rec["player_ID"], rec["game_ID"])
+            row = rows.get(row_key)
+            if row is None:
+                row = rows[row_key] = {"player_ID": rec["player_ID"], "game_ID": rec["game_ID"]}
+                row.update((field, 0) for field in STAT_FIELDS)
+            for field, count in rec["deltas"].items():
+                row[field] += count
+        return list(rows.values())
+
+    def _next_batch(self):
+        """
+        The pending ids to send next: up to max_batch of them, or - for ids out of a
+        rejected batch - the ones for a single (player, game) row.
+        """
+        free = [i for i in self._adds if i not in self._batched_ids]
+        if not free:
+            return []
+        if free[0] in self._isolated:
+            row_key = self._row_key(free[0])
+            free = [i for i in free if i in self._isolated and self._row_key(i) == row_key]
+        else:
+            free = [i for i in free if i not in self._isolated]
+        return free[:self.max_batch]
+
+    def _row_key(self, i):
+        rec = self._adds[i]
+        return rec["player_ID"], rec["game_ID"]
+
+    def _split(self, key):
+        """Sends a rejected batch's ids back to pending, to be retried one row per batch."""
+        with self._lock:
+            ids = self._batches.pop(key)
+            self._batched_ids.difference_update(ids)
+            self._isolated.update(ids)
+            self._write({"op": "split", "key": key, "ids": ids})
+
+    def _finish_rows(self, key, rows):
+        """Acks just the ids of the batch that make up the given (already delivered) rows."""
+        row_keys = {(row["player_ID"], row["game_ID"]) for row in rows}
+        with self._lock:
+            ids = [i for i in self._batches[key] if self._row_key(i) in row_keys]
+        return self._finish(key, {"op": "ack", "key": key, "ids": ids}, ids)
+
+    def _finish(self, key, rec, ids=None):
+        """
+        Writes rec and forgets the given ids of the batch (default: all of them) -
+        delivered or written off. Returns how many recorded rows that was.
+        """
+        spans = []
+        with self._lock:
+            batch = self._batches.pop(key)
+            done = set(batch if ids is None else ids)
+            rest = [i for i in batch if i not in done]
+            if rest:
+                self._batches[key] = rest
+            for i in done:
+                self._adds.pop(i, None)
+                self._batched_ids.discard(i)
+                self._isolated.discard(i)
+                spans.extend(self._spans.pop(i, ()))
+            self._write(rec)
+            if not self._adds:
+                self._truncate()
+        for span in spans:
+            span.release()
+        return len(done)
+
+    # ----------------
+    # FILE
+    # ----------------
+    def _write(self, rec, sync=True):
+        if self._file.closed:
+            # stop() timed out while a request was in flight; the batch is resent next session
+            return
+        self._file.write(json.dumps(rec, separators=(",", ":")) + "\n")
+        if sync:
+            self._sync()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _truncate(self):
+        # Everything has been delivered; start the journal over
+        self._file.seek(0)
+        self._file.truncate()
+        self._sync()
+
+    def _rewrite(self):
+        """Replaces the journal with just the still-pending lines (drops acked history and torn writes)."""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for key, ids in self._batches.items():
+                for i in ids:
+                    f.write(json.dumps(self._adds[i], separators=(",", ":")) + "\n")
+                f.write(json.dumps({"op": "batch", "key": key, "ids": ids}, separators=(",", ":")) + "\n")
+            for i, rec in self._adds.items():
+                if i not in self._batched_ids:
+                    f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+            isolated = [i for i in self._adds if i in self._isolated and i not in self._batched_ids]
+            if isolated:
+                f.write(json.dumps({"op": "split", "key": None, "ids": isolated}, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def _replay(self):
+        """Rebuilds the pending state from an existing journal (e.g. after a crash)."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    # A half-written last line from a crash; that play never returned from record()
+                    continue
+                op = rec.get("op")
+                if op == "add":
+                    self._adds[rec["id"]] = rec
+                    self._next_id = max(self._next_id, rec["id"] + 1)
+                elif op == "batch":
+                    self._batches[rec["key"]] = rec["ids"]
+                    self._batched_ids.update(rec["ids"])
+                elif op == "split":
+                    self._batches.pop(rec["key"], None)
+                    self._batched_ids.difference_update(rec["ids"])
+                    self._isolated.update(i for i in rec["ids"] if i in self._adds)
+                elif op in ("ack", "drop"):
+                    batch = self._batches.pop(rec["key"], [])
+                    # An ack with "ids" covers only part of the batch; the rest is still to send
+                    done = set(rec.get("ids", batch))
+                    rest = [i for i in batch if i not in done]
+                    if rest:
+                        self._batches[rec["key"]] = rest
+                    for i in done:
+                        self._adds.pop(i, None)
+                        self._batched_ids.discard(i)
+                        self._isolated.discard(i)
+        if self._adds:
+            log.info("Stat journal: %s row(s) from a previous session still to send", len(self._adds))
@@ -0,0 +1,296 @@
+from itertools import chain
+from operator import attrgetter, itemgetter
+
+import numpy as np
+
+from records import STAT_FIELDS, Stat
+
+_COLUMN = {field: i for i, field in enumerate(STAT_FIELDS)}
+
+# Stat rows turn up with different casings of the same field ("two_Points_Made" from
+# the API's JSON, "Two_Points_Made" from the C# DTO names). They all land in one column.
+_CANONICAL = {field.lower(): field for field in STAT_FIELDS}
+
+# Numbers worked out from the counters, on top of STAT_FIELDS.
+DERIVED_FIELDS = (
+    "points", "rebounds",
+    "fg_made", "fg_attempts", "fg_pct",
+    "three_made", "three_attempts", "three_pct",
+    "ft_made", "ft_attempts", "ft_pct",
+)
+
+NO_TEAM = -1
+
+
+def canonical_field(name):
+    """The STAT_FIELDS name for any casing of a counter name, or None if it isn't one."""
+    return _CANONICAL.get(name.lower())
+
+
+def _pct(made, attempts):
+    # Whole percent, 0 when there were no attempts (rounded like Python's round())
+    out = np.zeros(made.shape, dtype=np.int64)
+    shot = attempts > 0
+    out[shot] = np.round(made[shot] * 100.0 / attempts[shot])
+    return out
+
+
+def derive(counts):
+    """
+    The DERIVED_FIELDS columns for a (rows x STAT_FIELDS) counter matrix, as a dict of arrays.
+    """
+    col = {field: counts[:, i] for field, i in _COLUMN.items()}
+    fg_made = col["two_Points_Made"] + col["three_Points_Made"]
+    fg_attempts = fg_made + col["two_Points_Missed"] + col["three_Points_Missed"]
+    three_made = col["three_Points_Made"]
+    three_attempts = three_made + col["three_Points_Missed"]
+    ft_made = col["free_Throw_Made"]
+    ft_attempts = ft_made + col["free_Throw_Missed"]
+    return {
+        "points": col["two_Points_Made"] * 2 + three_made * 3 + ft_made,
+        "rebounds": col["off_Rebounds"] + col["def_Rebounds"],
+        "fg_made": fg_made,
+        "fg_attempts": fg_attempts,
+        "fg_pct": _pct(fg_made, fg_attempts),
+        "three_made": three_made,
+        "three_attempts": three_attempts,
+        "three_pct": _pct(three_made, three_attempts),
+        "ft_made": ft_made,
+        "ft_attempts": ft_attempts,
+        "ft_pct": _pct(ft_made, ft_attempts),
+    }
+
+
+class Aggregate:
+    """
+    Summed stats per group (player, team, game, ...), as columns.
+
+      keys     - {key name: array}, e.g. {"player_ID": [...]}, one entry per group
+      counts   - (groups x STAT_FIELDS) matrix of summed counters
+      games    - how many different games each group has rows in
+
+    column(name) gives any counter, derived field, key or "games" as an array;
+    row(i) / rows() / get(key) give plain dicts for the UI.
+    """
+
+    def __init__(self, keys, counts, games):
+        self.keys = keys
+        self.counts = counts
+        self.games = games
+        self._derived = None
+        self._positions = None
+
+    def __len__(self):
+        return len(self.counts)
+
+    def column(self, name):
+        if name in self.keys:
+            return self.keys[name]
+        if name == "games":
+            return self.games
+        if name in DERIVED_FIELDS:
+            if self._derived is None:
+                self._derived = derive(self.counts)
+            return self._derived[name]
+        return self.counts[:, _COLUMN[canonical_field(name) or name]]
+
+    def row(self, index):
+        """Everything about one group: its keys, "games", every counter and every derived field."""
+        out = {name: int(values[index]) for name, values in self.keys.items()}
+        out["games"] = int(self.games[index])
+        out.update(zip(STAT_FIELDS, self.counts[index].tolist()))
+        for name in DERIVED_FIELDS:
+            out[name] = int(self.column(name)[index])
+        return out
+
+    def rows(self):
+        return [self.row(i) for i in range(len(self))]
+
+    def get(self, key):
+        """
+        row() of the group with this key (a tuple when grouped by more than one key).
+        A group with no rows gives the all-zero row.
+        """
+        if self._positions is None:
+            columns = [values.tolist() for values in self.keys.values()]
+            keys = columns[0] if len(columns) == 1 else zip(*columns)
+            self._positions = {k: i for i, k in enumerate(keys)}
+        index = self._positions.get(key)
+        if index is not None:
+            return self.row(index)
+        names = list(self.keys)
+        out = dict(zip(names, key if len(names) > 1 else (key,)))
+        out["games"] = 0
+        out.update((field, 0) for field in STAT_FIELDS)
+        out.update((name, 0) for name in DERIVED_FIELDS)
+        return out
+
+    def top(self, stat, n=10, per_game=False, min_games=1):
+        """
+        The n best groups by a column (highest first) as row() dicts. With per_game,
+        ranks by stat / games and adds it to each row as "<stat>_per_game".
+        """
+        values = self.column(stat).astype(np.float64)
+        eligible = self.games >= min_games
+        if per_game:
+            values = np.divide(values, self.games, out=np.zeros_like(values), where=self.games > 0)
+        candidates = np.flatnonzero(eligible)
+        if len(candidates) > n:
+            # Only the top n need sorting
+            candidates = candidates[np.argpartition(-values[candidates], n - 1)[:n]]
+        order = candidates[np.lexsort((candidates, -values[candidates]))]
+        result = []
+        for index in order:
+            row = self.row(index)
+            if per_game:
+                row[f"{stat}_per_game"] = round(float(values[index]), 1)
+            result.append(row)
+        return result
+
+
+def _team_ids(player_ids, team_of):
+    # team_ID is nullable in the API: a teamless player counts as NO_TEAM, like an unknown one
+    return np.fromiter((NO_TEAM if (t := team_of.get(p)) is None else t for p in player_ids.tolist()),
+                       dtype=np.int64, count=len(player_ids))
+
+
+class StatTable:
+    """
+    Stat rows loaded into NumPy columns, so whole-game and whole-season numbers are
+    a handful of array operations instead of a Python loop (and .get() calls) per row.
+
+    One row per stat line: player_ID, game_ID, team_ID (NO_TEAM if unknown) and a
+    (rows x STAT_FIELDS) counter matrix. Rows are added up with by_player(),
+    by_team(), by_game(), by_team_game() or group_by(...); each gives an Aggregate
+    with the counters summed and the derived numbers (points, rebounds, FG/3PT/FT
+    made, attempts and %) worked out for every group at once.
+    """
+
+    def __init__(self, player_ids, game_ids, team_ids, counts):
+        self.player_ids = player_ids
+        self.game_ids = game_ids
+        self.team_ids = team_ids
+        self.counts = counts
+
+    @classmethod
+    def from_rows(cls, rows, team_of=None):
+        """
+        Builds a table from Stat records or stat row dicts in any key casing. team_of maps
+        player_ID -> team_ID (rows of unknown or teamless players get NO_TEAM).
+        """
+        rows = list(rows)
+        n = len(rows)
+        team_of = team_of or {}
+        counts = np.zeros((n, len(STAT_FIELDS)), dtype=np.int64)
+        if n == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return cls(empty, empty.copy(), empty.copy(), counts)
+
+        if all(isinstance(r, Stat) for r in rows):
+            # Records: the attributes are already the canonical names
+            values = chain.from_iterable(map(attrgetter("player_ID", "game_ID", *STAT_FIELDS), rows))
+            matrix = np.fromiter(values, dtype=np.int64, count=n * (2 + len(STAT_FIELDS))).reshape(n, -1)
+            player_ids = matrix[:, 0].copy()
+            team_ids = _team_ids(player_ids, team_of)
+            return cls(player_ids, matrix[:, 1].copy(), team_ids, matrix[:, 2:].copy())
+
+        # Dicts: look at which spellings are in use once, then pull each one out as a column
+        spellings = {}
+        for key in set().union(*rows):
+            field = canonical_field(key)
+            if field is not None:
+                spellings[key] = _COLUMN[field]
+            elif key.lower() in ("player_id", "game_id"):
+                spellings[key] = key.lower()
+        keys = list(spellings)
+        try:
+            # Usual case: every row has every key - one C-level pass over the rows
+            values = chain.from_iterable(map(itemgetter(*keys), rows))
+            matrix = np.fromiter(values, dtype=np.int64, count=n * len(keys))
+        except (KeyError, TypeError):
+            # Missing keys or None values somewhere
+            values = (r.get(key) or 0 for r in rows for key in keys)
+            matrix = np.fromiter(values, dtype=np.int64, count=n * len(keys))
+        matrix = matrix.reshape(n, len(keys))
+
+        player_ids = np.zeros(n, dtype=np.int64)
+        game_ids = np.zeros(n, dtype=np.int64)
+        for i, key in enumerate(keys):
+            target = spellings[key]
+            if target == "player_id":
+                player_ids += matrix[:, i]
+            elif target == "game_id":
+                game_ids += matrix[:, i]
+            else:
+                counts[:, target] += matrix[:, i]
+        team_ids = _team_ids(player_ids, team_of)
+        return cls(player_ids, game_ids, team_ids, counts)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def where(self, mask):
+        """The rows where a boolean mask is True, as a new table."""
+        return StatTable(self.player_ids[mask], self.game_ids[mask], self.team_ids[mask], self.counts[mask])
+
+    def for_game(self, game_id):
+        return self.where(self.game_ids == game_id)
+
+    def for_team(self, team_id):
+        return self.where(self.team_ids == team_id)
+
+    def by_player(self):
+        return self.group_by("player_ID")
+
+    def by_team(self):
+        return self.group_by("team_ID")
+
+    def by_game(self):
+        return self.group_by("game_ID")
+
+    def by_team_game(self):
+        return self.group_by("team_ID", "game_ID")
+
+    def group_by(self, *names):
+        """
+        Sums the counters per distinct value of the named columns ("player_ID",
+        "game_ID", "team_ID"). Sorts once, then adds up each run of equal keys.
+        """
+        columns = [self._key_column(name) for name in names]
+        if len(self) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return Aggregate({name: empty for name in names}, self.counts.copy(), empty)
+
+        order = np.lexsort(columns[::-1])
+        sorted_columns = [c[order] for c in columns]
+        starts = self._run_starts(sorted_columns)
+        counts = np.add.reduceat(self.counts[order], starts, axis=0)
+
+        # Games per group: distinct game_IDs inside each run
+        if "game_ID" in names:
+            games = np.ones(len(starts), dtype=np.int64)
+        else:
+            game_order = np.lexsort([self.game_ids] + columns[::-1])
+            with_games = [c[game_order] for c in columns] + [self.game_ids[game_order]]
+            game_starts = self._run_starts(with_games)
+            group_starts = self._run_starts([c[game_starts] for c in with_games[:-1]])
+            games = np.diff(np.append(group_starts, len(game_starts)))
+
+        keys = {name: c[starts] for name, c in zip(names, sorted_columns)}
+        return Aggregate(keys, counts, games)
+
+    def _key_column(self, name):
+        return {"player_ID": self.player_ids, "game_ID": self.game_ids, "team_ID": self.team_ids}[name]
+
+    @staticmethod
+    def _run_starts(sorted_columns):
+        # Index of the first row of every run of equal keys
+        change = np.zeros(len(sorted_columns[0]), dtype=bool)
+        change[0] = True
+        for c in sorted_columns:
+            change[1:] |= c[1:] != c[:-1]
+        return np.flatnonzero(change)
+
+    def leaders(self, stat="points", n=10, per_game=False, min_games=1):
+        """Top n players by a stat (see Aggregate.top)."""
+        return self.by_player().top(stat, n=n, per_game=per_game, min_games=min_games)
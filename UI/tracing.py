@@ -0,0 +1,347 @@
+import bisect
+import contextvars
+import functools
+import json
+import re
+import threading
+import time
+from collections import deque
+
+# Histogram bucket upper bounds, in seconds (Prometheus "le" labels).
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.95, 0.99)
+
+# "/Stats/Team/5/Game/12" -> "/Stats/Team/{id}/Game/{id}", so every game shares one histogram
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+# The spans the current code runs under (see Tracer.span / activate). A tuple, since a
+# stat journal flush can carry the plays of several clicks at once.
+_active = contextvars.ContextVar("gob_active_spans", default=())
+
+
+def endpoint_of(path):
+    return _ID_SEGMENT.sub("/{id}", path.split("?", 1)[0])
+
+
+class LatencyHistogram:
+    """
+    Latencies of one endpoint (or one kind of span): count, sum and BUCKETS counts
+    for the Prometheus export, plus the last `window` samples for p50/p95/p99.
+    Not thread-safe on its own; the Tracer's lock covers it.
+    """
+
+    def __init__(self, window=2048):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # the last one is +Inf
+        self.samples = deque(maxlen=window)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.samples.append(seconds)
+
+    def quantile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self):
+        """{count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}"""
+        out = {"count": self.count, "mean_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0}
+        if self.samples:
+            ordered = sorted(self.samples)
+            for q in QUANTILES:
+                out[f"p{int(q * 100)}_ms"] = round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2)
+        else:
+            out.update((f"p{int(q * 100)}_ms", 0.0) for q in QUANTILES)
+        out["max_ms"] = round(self.max * 1000, 2)
+        return out
+
+
+class _EndpointStats:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.statuses = {}  # status code (or "error") -> count
+        self.bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class Span:
+    """
+    One traced UI action (a click) and every API call made on its behalf, on any thread.
+
+    The span ends when the `with` block that started it is left *and* all the work it
+    handed off has finished: NetworkWorker and StatJournal hold() it while they carry
+    it and release() it when done, so e.g. select_game's span lasts until the details
+    panel has been drawn.
+    """
+
+    def __init__(self, tracer, name, attrs, max_calls=200):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.duration = None
+        self.calls = []  # {"method", "endpoint", "status", "ms", "bytes"}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._max_calls = max_calls
+        self._holds = 1  # the `with` block itself
+        self._lock = threading.Lock()
+
+    def hold(self):
+        with self._lock:
+            self._holds += 1
+
+    def release(self):
+        with self._lock:
+            self._holds -= 1
+            done = self._holds == 0 and self.duration is None
+            if done:
+                self.duration = time.perf_counter() - self._start
+        if done:
+            self.tracer._finish_span(self)
+
+    def _add_call(self, call):
+        with self._lock:
+            if len(self.calls) < self._max_calls:
+                self.calls.append(call)
+
+    def _add_cache(self, hit):
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def to_json(self):
+        with self._lock:
+            return {
+                "name": self.name,
+                "attrs": dict(self.attrs),
+                "started_at": self.started_at,
+                "ms": round(self.duration * 1000, 2) if self.duration is not None else None,
+                "requests": len(self.calls),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "calls": list(self.calls),
+            }
+
+
+class Tracer:
+    """
+    In-memory request and UI tracing.
+
+    RealAPI reports every HTTP call (record_request) and cache lookup (record_cache).
+    They are added up per "METHOD /endpoint/{id}" - count, status codes, bytes, cache
+    hits / misses and a latency histogram with p50/p95/p99 - and attached to whatever
+    spans are active, so a finished span shows exactly which round trips one click made.
+
+      with TRACER.span("select_game", game_id=5): ...   - trace a UI action
+      @traced("submit_all", form="2pt")                 - same, for a whole function
+      snapshot() / to_json()                            - everything as a dict / JSON text
+      to_prometheus()                                   - Prometheus text exposition format
+      dump(path)                                        - either one, to a file
+    """
+
+    def __init__(self, keep_spans=200):
+        self._lock = threading.Lock()
+        self._endpoints = {}  # (method, endpoint) -> _EndpointStats
+        self._span_latency = {}  # span name -> LatencyHistogram
+        self.recent_spans = deque(maxlen=keep_spans)
+
+    # ----------------
+    # RECORDING
+    # ----------------
+    def record_request(self, method, path, status, nbytes, seconds):
+        """One HTTP call. status is None if it failed without an answer."""
+        endpoint = endpoint_of(path)
+        with self._lock:
+            stats = self._endpoint(method, endpoint)
+            stats.latency.observe(seconds)
+            key = status if status is not None else "error"
+            stats.statuses[key] = stats.statuses.get(key, 0) + 1
+            stats.bytes += nbytes
+        spans = _active.get()
+        if spans:
+            call = {"method": method, "endpoint": endpoint, "status": status,
+                    "ms": round(seconds * 1000, 2), "bytes": nbytes}
+            for span in spans:
+                span._add_call(call)
+
+    def record_cache(self, key, hit):
+        """One read-cache lookup; key is the cache key, its first item names the endpoint."""
+        name = key[0] if isinstance(key, tuple) else key
+        with self._lock:
+            stats = self._endpoint("CACHE", name)
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+        for span in _active.get():
+            span._add_cache(hit)
+
+    def _endpoint(self, method, endpoint):
+        stats = self._endpoints.get((method, endpoint))
+        if stats is None:
+            stats = self._endpoints[(method, endpoint)] = _EndpointStats()
+        return stats
+
+    # ----------------
+    # SPANS
+    # ----------------
+    def span(self, name, **attrs):
+        """Context manager: starts a Span and makes it active for the block."""
+        return _SpanScope(Span(self, name, attrs))
+
+    def _finish_span(self, span):
+        with self._lock:
+            latency = self._span_latency.get(span.name)
+            if latency is None:
+                latency = self._span_latency[span.name] = LatencyHistogram()
+            latency.observe(span.duration)
+            self.recent_spans.append(span)
+
+    # ----------------
+    # EXPORT
+    # ----------------
+    def snapshot(self):
+        with self._lock:
+            endpoints = {}
+            cache = {}
+            for (method, endpoint), stats in sorted(self._endpoints.items()):
+                if method == "CACHE":
+                    cache[endpoint] = {"hits": stats.cache_hits, "misses": stats.cache_misses}
+                    continue
+                entry = stats.latency.summary()
+                entry["statuses"] = {str(k): v for k, v in stats.statuses.items()}
+                entry["bytes"] = stats.bytes
+                endpoints[f"{method} {endpoint}"] = entry
+            spans = {name: latency.summary() for name, latency in sorted(self._span_latency.items())}
+            recent = list(self.recent_spans)
+        return {"endpoints": endpoints, "cache": cache, "spans": spans,
+                "recent_spans": [span.to_json() for span in recent]}
+
+    def to_json(self, path=None):
+        """The snapshot as JSON text; also written to path if given."""
+        text = json.dumps(self.snapshot(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def dump(self, path):
+        """Writes to_prometheus() if path ends in .prom / .txt, otherwise to_json()."""
+        if path.endswith((".prom", ".txt")):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.to_prometheus())
+        else:
+            self.to_json(path)
+        return path
+
+    def to_prometheus(self):
+        lines = []
+        with self._lock:
+            requests = [(k, v) for k, v in sorted(self._endpoints.items()) if k[0] != "CACHE"]
+            lookups = [(k[1], v) for k, v in sorted(self._endpoints.items()) if k[0] == "CACHE"]
+            spans = sorted(self._span_latency.items())
+
+            _histogram(lines, "gob_api_request_seconds", "Latency of API calls.",
+                       [(f'method="{m}",endpoint="{e}"', s.latency) for (m, e), s in requests])
+            lines.append("# HELP gob_api_requests_total API calls by status code.")
+            lines.append("# TYPE gob_api_requests_total counter")
+            for (method, endpoint), stats in requests:
+                for status, n in sorted(stats.statuses.items(), key=str):
+                    lines.append(f'gob_api_requests_total{{method="{method}",endpoint="{endpoint}",'
+                                 f'status="{status}"}} {n}')
+            lines.append("# HELP gob_api_response_bytes_total Bytes received from the API.")
+            lines.append("# TYPE gob_api_response_bytes_total counter")
+            for (method, endpoint), stats in requests:
+                lines.append(f'gob_api_response_bytes_total{{method="{method}",endpoint="{endpoint}"}} {stats.bytes}')
+            lines.append("# HELP gob_cache_lookups_total Read-cache lookups.")
+            lines.append("# TYPE gob_cache_lookups_total counter")
+            for name, stats in lookups:
+                lines.append(f'gob_cache_lookups_total{{endpoint="{name}",result="hit"}} {stats.cache_hits}')
+                lines.append(f'gob_cache_lookups_total{{endpoint="{name}",result="miss"}} {stats.cache_misses}')
+            _histogram(lines, "gob_ui_span_seconds", "How long UI actions took, including their API calls.",
+                       [(f'span="{name}"', latency) for name, latency in spans])
+        return "\n".join(lines) + "\n"
+
+
+def _histogram(lines, metric, help_text, series):
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} histogram")
+    for labels, latency in series:
+        cumulative = 0
+        for bound, n in zip(BUCKETS + ("+Inf",), latency.buckets):
+            cumulative += n
+            lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{metric}_sum{{{labels}}} {latency.total}")
+        lines.append(f"{metric}_count{{{labels}}} {latency.count}")
+    # p50/p95/p99 over the recent window, as gauges next to the histogram
+    for labels, latency in series:
+        for q in QUANTILES:
+            lines.append(f'{metric}_quantile{{{labels},quantile="{q}"}} {latency.quantile(q)}')
+
+
+class _SpanScope:
+    def __init__(self, span):
+        self.span = span
+        self._token = None
+
+    def __enter__(self):
+        self._token = _active.set(_active.get() + (self.span,))
+        return self.span
+
+    def __exit__(self, *exc):
+        _active.reset(self._token)
+        self.span.release()
+        return False
+
+
+def active_spans():
+    """The spans the calling code runs under (empty tuple if none)."""
+    return _active.get()
+
+
+def activate(spans):
+    """
+    Context manager that makes already-started spans active again, e.g. on the thread
+    that finally does the work for them. Doesn't hold or release them.
+    """
+    return _Activation(tuple(spans))
+
+
+class _Activation:
+    def __init__(self, spans):
+        self.spans = spans
+        self._token = None
+
+    def __enter__(self):
+        self._token = _active.set(_active.get() + self.spans)
+
+    def __exit__(self, *exc):
+        _active.reset(self._token)
+        return False
+
+
+def traced(name, **attrs):
+    """Decorator: runs the function inside TRACER.span(name, **attrs)."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            with TRACER.span(name, **attrs):
+                return fn(*args, **kwargs)
+        return run
+    return wrap
+
+
+# The one tracer the UI and RealAPI report to.
+TRACER = Tracer()